@@ -0,0 +1,296 @@
+"""
+Generador de Catálogos Sintéticos - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script genera listados de laptops con los mismos formatos de texto
+que data/laptop.xlsx (precios en rupias con agrupación india, "8 GB DDR4
+RAM", "15.6 inches, 1920 x 1080 pixels", espacios finos U+2009, filas
+desalineadas, duplicados y valores faltantes) para medir cómo escalan las
+etapas del análisis con 10 mil, 1 millón o 10 millones de filas.
+
+El archivo se escribe por bloques, así que el tamaño máximo no depende de
+la memoria disponible.
+
+Uso:
+    python benchmarks/generar_catalogo.py 1M [--salida RUTA] [--semilla N]
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+DIRECTORIO_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO_DATOS_SINTETICOS = os.path.join(DIRECTORIO_BENCHMARKS, 'datos')
+
+# Espacio fino que usa el sitio de origen entre número y unidad
+EF = '\u2009'
+
+COLUMNAS = ['Unnamed: 0', 'Model', 'Price', 'Rating', 'Generation', 'Core',
+            'Ram', 'SSD', 'Display', 'Graphics', 'OS', 'Warranty']
+
+# (marca, serie, prefijo del código de modelo)
+SERIES = [
+    ('HP', 'Victus 15', 'fb'), ('HP', 'Pavilion 14', 'dv'), ('HP', '15s', 'fq'),
+    ('HP', '245 G9', 'PA'), ('HP', 'Omen 16', 'wf'),
+    ('Lenovo', 'IdeaPad Slim 3', '82X'), ('Lenovo', 'V15 G4', '82YU'),
+    ('Lenovo', 'ThinkPad E14', '21E'), ('Lenovo', 'LOQ 15', '83G'), ('Lenovo', 'Legion 5 Pro', '82J'),
+    ('Asus', 'Vivobook 15', 'X1502'), ('Asus', 'TUF Gaming F15', 'FX507'),
+    ('Asus', 'ROG Strix G16', 'G614'), ('Asus', 'Zenbook 14 OLED', 'UX3402'),
+    ('Dell', 'Inspiron 3520', 'D560'), ('Dell', 'Vostro 3420', 'V3420'), ('Dell', 'G15 5530', 'G15'),
+    ('Acer', 'Aspire 7', 'A715'), ('Acer', 'Nitro V', 'ANV15'), ('Acer', 'Swift Go 14', 'SFG14'),
+    ('MSI', 'Modern 14', 'C12M'), ('MSI', 'Thin GF63', '12UC'), ('MSI', 'Katana 15', 'B13V'),
+    ('Samsung', 'Galaxy Book3', 'NP750'), ('Infinix', 'INBook X2 Slim', 'XL23'),
+    ('Tecno', 'Megabook T1', 'T1'), ('Apple', 'MacBook Air 2022', 'MLY'),
+]
+
+# (Generation, Core, texto corto del modelo, gama 0-4)
+PROCESADORES = [
+    ('Intel Celeron N4500', 'Dual Core, 2 Threads', 'Intel Celeron N4500', 0),
+    ('11th Gen Intel Core i3 1115G4', 'Dual Core, 4 Threads', '11th Gen Core i3', 0),
+    ('12th Gen Intel Core i3 1215U', 'Hexa Core (2P + 4E), 8 Threads', '12th Gen Core i3', 1),
+    ('3rd Gen AMD Ryzen 3 3250U', 'Dual Core, 4 Threads', 'AMD Ryzen 3 3250U', 0),
+    ('7th Gen AMD Ryzen 5 7520U', 'Quad Core, 8 Threads', 'AMD Ryzen 5 7520U', 1),
+    ('12th Gen Intel Core i5 1235U', '10 Cores (2P + 8E), 12 Threads', '12th Gen Core i5', 1),
+    ('12th Gen Intel Core i5 12450H', 'Octa Core (4P + 4E), 12 Threads', '12th Gen Core i5', 2),
+    ('5th Gen AMD Ryzen 5 5600H', 'Hexa Core, 12 Threads', 'AMD Ryzen 5 5600H', 2),
+    ('13th Gen Intel Core i5 1335U', '10 Cores (2P + 8E), 12 Threads', '13th Gen Core i5', 2),
+    ('13th Gen Intel Core i7 13700H', '14 Cores (6P + 8E), 20 Threads', '13th Gen Core i7', 3),
+    ('7th Gen AMD Ryzen 7 7840HS', 'Octa Core, 16 Threads', 'AMD Ryzen 7 7840HS', 3),
+    ('Intel Core Ultra 7 Series 1 155H', '16 Cores (6P + 8E + 2LPE), 22 Threads', 'Core Ultra 7 155H', 3),
+    ('Apple M2', 'Octa Core', 'Apple M2', 3),
+    ('13th Gen Intel Core i9 13900H', '14 Cores (6P + 8E), 20 Threads', '13th Gen Core i9', 4),
+    ('14th Gen Intel Core i9 14900HX', '24 Cores (8P + 16E), 32 Threads', '14th Gen Core i9', 4),
+]
+
+RAM_GB = np.array([4, 8, 16, 32])
+RAM_PROB = np.array([0.05, 0.35, 0.5, 0.1])
+RAM_TIPOS = np.array(['DDR4', 'DDR5', 'LPDDR4X', 'LPDDR5', 'LPDDR5X', 'Unified Memory'])
+SSD_GB = np.array([256, 512, 1024, 2048])
+SSD_PROB = np.array([0.1, 0.6, 0.25, 0.05])
+PANTALLAS = np.array(['13.3', '14', '15.6', '16', '16.1', '17.3'])
+RESOLUCIONES = np.array(['1366 x 768', '1920 x 1080', '1920 x 1200', '2560 x 1600', '2880 x 1800'])
+
+# (texto, sobreprecio en rupias)
+GRAFICAS = [
+    ('Intel UHD Graphics', 0), ('Intel Iris Xe Graphics', 2000), ('Intel Integrated Iris Xe', 2000),
+    ('AMD Radeon Graphics', 0), ('4 GB NVIDIA GeForce RTX 2050', 9000),
+    ('6 GB NVIDIA GeForce RTX 3050', 14000), ('6 GB NVIDIA GeForce RTX 4050', 20000),
+    ('8 GB NVIDIA GeForce RTX 4060', 28000), ('4 GB AMD Radeon RX 6500M', 9000),
+]
+
+SISTEMAS = np.array(['Windows 11 OS', 'Windows 11  OS', 'Windows 10 OS', 'Mac OS', 'Chrome OS', 'DOS OS'])
+SISTEMAS_PROB = np.array([0.88, 0.02, 0.02, 0.03, 0.02, 0.03])
+GARANTIAS = np.array(['1 Year Warranty', '2 Year Warranty', '3 Year Warranty'])
+GARANTIAS_PROB = np.array([0.88, 0.09, 0.03])
+
+def parsear_filas(texto):
+    """
+    Interpreta tamaños como '10k', '1M' o '10000000'
+
+    Args:
+        texto (str): Número de filas con sufijo opcional k/M
+
+    Returns:
+        int: Número de filas
+    """
+    multiplicadores = {'k': 1_000, 'm': 1_000_000}
+    texto = texto.strip().lower().replace('_', '')
+    if texto[-1] in multiplicadores:
+        return int(float(texto[:-1]) * multiplicadores[texto[-1]])
+    return int(texto)
+
+def formatear_rupias(precios):
+    """
+    Formatea precios enteros con símbolo de rupia y agrupación india (₹1,02,990)
+
+    Args:
+        precios (numpy.ndarray): Precios enteros
+
+    Returns:
+        list: Precios formateados
+    """
+    resultado = []
+    for precio in precios.tolist():
+        miles, unidades = divmod(precio, 1000)
+        if miles == 0:
+            resultado.append(f"₹{unidades}")
+            continue
+        # Los grupos por encima de los miles son de dos cifras
+        grupos = []
+        while miles >= 100:
+            miles, resto = divmod(miles, 100)
+            grupos.append(f"{resto:02d}")
+        grupos.append(str(miles))
+        resultado.append("₹" + ",".join(reversed(grupos)) + f",{unidades:03d}")
+    return resultado
+
+def _con_espacios_finos(serie):
+    """
+    Sustituye los espacios entre número y unidad por espacios finos
+    """
+    return serie.str.replace(r'(\d) (GB|TB|inches|x|pixels)', rf'\1{EF}\2', regex=True) \
+                .str.replace(rf'x (\d)', rf'x{EF}\1', regex=True)
+
+def generar_bloque(filas, rng, inicio=0, tasa_duplicados=0.01, tasa_desalineadas=0.005,
+                   tasa_casi_duplicados=0.01):
+    """
+    Genera un bloque de listados sintéticos
+
+    Args:
+        filas (int): Número de filas del bloque
+        rng (numpy.random.Generator): Generador de números aleatorios
+        inicio (int): Valor inicial de la columna índice 'Unnamed: 0'
+        tasa_duplicados (float): Proporción de filas que repiten otra del bloque
+        tasa_desalineadas (float): Proporción de filas con columnas corridas,
+            como las que deja el scraping original
+        tasa_casi_duplicados (float): Proporción de filas que repiten otra
+            con pequeñas diferencias en el texto de Model (espacios o sufijo
+            de SKU)
+
+    Returns:
+        pandas.DataFrame: Bloque con las columnas de data/laptop.xlsx
+    """
+    serie = rng.integers(len(SERIES), size=filas)
+    cpu = rng.integers(len(PROCESADORES), size=filas)
+    ram = rng.choice(RAM_GB, size=filas, p=RAM_PROB)
+    ram_tipo = rng.choice(RAM_TIPOS, size=filas)
+    ssd = rng.choice(SSD_GB, size=filas, p=SSD_PROB)
+    grafica = rng.integers(len(GRAFICAS), size=filas)
+
+    gama = np.array([p[3] for p in PROCESADORES])[cpu]
+    sobreprecio = np.array([g[1] for g in GRAFICAS])[grafica]
+
+    # Precio coherente con las especificaciones, terminado en 90 o 99
+    precio = (15000 + gama * 14000 + ram * 900 + ssd * 12 + sobreprecio) * rng.lognormal(0, 0.18, filas)
+    precio = (precio // 100 * 100 + rng.choice([90, 99], size=filas)).astype(np.int64)
+
+    marcas = np.array([s[0] for s in SERIES])[serie]
+    nombres = pd.Series(np.array([f"{s[0]} {s[1]}" for s in SERIES])[serie])
+    codigos = np.array([s[2] for s in SERIES])[serie]
+    sku = pd.Series(rng.integers(0, 36 ** 4, size=filas)).map(lambda v: np.base_repr(v, 36).zfill(4))
+    cpu_corto = np.array([p[2] for p in PROCESADORES])[cpu]
+    ram_texto = pd.Series(ram).astype(str)
+    tb = pd.Series(ssd >= 1024)
+    ssd_numero = pd.Series(np.where(ssd >= 1024, ssd // 1024, ssd)).astype(str)
+    gaming = np.where(sobreprecio >= 9000, ' Gaming', '')
+    sistema_modelo = np.where(marcas == 'Apple', 'Mac OS', 'Win11 Home')
+
+    modelo = (nombres + ' ' + codigos + sku + gaming + ' Laptop (' + cpu_corto + '/ '
+              + ram_texto + 'GB/ ' + ssd_numero + tb.map({True: 'TB', False: 'GB'})
+              + ' SSD/ ' + sistema_modelo + ')')
+
+    ram_columna = ram_texto + ' GB ' + ram_tipo + ' RAM'
+    ssd_columna = ssd_numero + tb.map({True: ' TB SSD', False: ' GB SSD'})
+    pantalla = (pd.Series(rng.choice(PANTALLAS, size=filas)) + ' inches, '
+                + rng.choice(RESOLUCIONES, size=filas) + ' pixels')
+    pantalla = pantalla.where(rng.random(filas) > 0.1, pantalla + ', Touch Screen')
+
+    rating = np.round(np.clip(rng.normal(60 + gama * 5, 8, filas), 30, 89)).astype(float)
+    rating[rng.random(filas) < 0.165] = np.nan
+
+    bloque = pd.DataFrame({
+        'Unnamed: 0': np.arange(inicio, inicio + filas),
+        'Model': modelo,
+        'Price': formatear_rupias(precio),
+        'Rating': rating,
+        'Generation': np.array([p[0] for p in PROCESADORES])[cpu],
+        'Core': np.array([p[1] for p in PROCESADORES])[cpu],
+        'Ram': _con_espacios_finos(ram_columna),
+        'SSD': _con_espacios_finos(ssd_columna),
+        'Display': _con_espacios_finos(pantalla),
+        'Graphics': np.array([g[0] for g in GRAFICAS])[grafica],
+        'OS': rng.choice(SISTEMAS, size=filas, p=SISTEMAS_PROB),
+        'Warranty': rng.choice(GARANTIAS, size=filas, p=GARANTIAS_PROB),
+    })
+
+    # Espacios dobles ocasionales, como en "16 GB  LPDDR5 RAM"
+    dobles = rng.random(filas) < 0.03
+    bloque.loc[dobles, 'Ram'] = bloque.loc[dobles, 'Ram'].str.replace(' RAM', '  RAM', regex=False)
+
+    # Filas sin pantalla: el resto de columnas queda corrido una posición
+    desalineadas = np.flatnonzero(rng.random(filas) < tasa_desalineadas)
+    if len(desalineadas):
+        bloque.loc[desalineadas, ['Display', 'Graphics', 'OS', 'Warranty']] = \
+            bloque.loc[desalineadas, ['Graphics', 'OS', 'Warranty']].assign(extra='Backlit Keyboard').to_numpy()
+
+    # Listados repetidos (mismo contenido, distinto índice)
+    duplicadas = np.flatnonzero(rng.random(filas) < tasa_duplicados)
+    if len(duplicadas):
+        origen = rng.integers(filas, size=len(duplicadas))
+        columnas = COLUMNAS[1:]
+        bloque.loc[duplicadas, columnas] = bloque.loc[origen, columnas].to_numpy()
+
+    # Listados repetidos con el texto de Model ligeramente cambiado
+    casi = np.flatnonzero(rng.random(filas) < tasa_casi_duplicados)
+    if len(casi):
+        origen = rng.integers(filas, size=len(casi))
+        columnas = COLUMNAS[1:]
+        bloque.loc[casi, columnas] = bloque.loc[origen, columnas].to_numpy()
+        modelos = bloque.loc[casi, 'Model']
+        sufijo = rng.random(len(casi)) < 0.5
+        bloque.loc[casi, 'Model'] = np.where(
+            sufijo,
+            modelos.str.replace(' Laptop (', '/B Laptop (', n=1, regex=False),
+            modelos.str.replace('GB/ ', 'GB /  ', n=1, regex=False))
+
+    return bloque
+
+def generar_catalogo(ruta_salida, filas, tamano_bloque=500_000, semilla=42):
+    """
+    Escribe un catálogo sintético en CSV (o XLSX si la ruta termina en .xlsx)
+
+    Args:
+        ruta_salida (str): Archivo de salida
+        filas (int): Número total de filas
+        tamano_bloque (int): Filas generadas y escritas por bloque
+        semilla (int): Semilla del generador aleatorio
+
+    Returns:
+        str: Ruta del archivo generado
+    """
+    rng = np.random.default_rng(semilla)
+    directorio = os.path.dirname(os.path.abspath(ruta_salida))
+    os.makedirs(directorio, exist_ok=True)
+
+    if ruta_salida.endswith('.xlsx'):
+        if filas > 1_048_575:
+            raise ValueError("Excel admite como máximo 1.048.575 filas de datos")
+        generar_bloque(filas, rng).to_excel(ruta_salida, index=False)
+        return ruta_salida
+
+    temporal = ruta_salida + '.tmp'
+    with open(temporal, 'w', encoding='utf-8', newline='') as f:
+        for inicio in range(0, filas, tamano_bloque):
+            bloque = generar_bloque(min(tamano_bloque, filas - inicio), rng, inicio)
+            bloque.to_csv(f, index=False, header=(inicio == 0))
+    os.replace(temporal, ruta_salida)
+    return ruta_salida
+
+def ruta_catalogo(filas, extension='csv'):
+    """
+    Devuelve la ruta por defecto del catálogo sintético de un tamaño
+
+    Args:
+        filas (int): Número de filas
+        extension (str): 'csv' o 'xlsx'
+
+    Returns:
+        str: Ruta dentro de benchmarks/datos/
+    """
+    return os.path.join(DIRECTORIO_DATOS_SINTETICOS, f"laptops_sinteticas_{filas}.{extension}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera un catálogo sintético de laptops")
+    parser.add_argument("filas", help="Número de filas, p. ej. 10k, 1M o 10M")
+    parser.add_argument("--salida", help="Archivo de salida (.csv o .xlsx)")
+    parser.add_argument("--semilla", type=int, default=42, help="Semilla del generador")
+    parser.add_argument("--tamano-bloque", type=int, default=500_000, help="Filas por bloque escrito")
+    argumentos = parser.parse_args()
+
+    filas = parsear_filas(argumentos.filas)
+    ruta = argumentos.salida or ruta_catalogo(filas)
+    generar_catalogo(ruta, filas, argumentos.tamano_bloque, argumentos.semilla)
+    print(f"Catálogo sintético de {filas:,} filas guardado en: {ruta}")
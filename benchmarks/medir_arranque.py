@@ -0,0 +1,111 @@
+"""
+Medición del Tiempo de Arranque - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script mide cuánto tarda en importarse cada punto de entrada del
+proyecto en un intérprete nuevo, descontando el arranque de Python, y
+muestra los paquetes que más aportan a ese tiempo (python -X importtime).
+
+Uso:
+    python benchmarks/medir_arranque.py [--repeticiones N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+DIRECTORIO_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRECTORIO_SCRIPTS = os.path.join(DIRECTORIO_PROYECTO, 'scripts')
+
+# Módulo a importar -> directorio desde el que se ejecuta
+PUNTOS_DE_ENTRADA = {
+    'run_analysis': DIRECTORIO_PROYECTO,
+    'data_cleaning': DIRECTORIO_SCRIPTS,
+    'data_analysis': DIRECTORIO_SCRIPTS,
+    'visualizations': DIRECTORIO_SCRIPTS,
+    'resumen_incremental': DIRECTORIO_SCRIPTS,
+}
+
+def medir_importacion(modulo, directorio, repeticiones=5):
+    """
+    Mide el tiempo de importación de un módulo en intérpretes nuevos
+
+    Args:
+        modulo (str): Nombre del módulo
+        directorio (str): Directorio de trabajo del intérprete
+        repeticiones (int): Número de mediciones
+
+    Returns:
+        float: Mediana del tiempo en milisegundos
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', f'import {modulo}'], cwd=directorio,
+                       check=True, capture_output=True)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+def paquetes_mas_pesados(modulo, directorio, top=5):
+    """
+    Obtiene las importaciones directas del módulo con mayor tiempo acumulado
+
+    Args:
+        modulo (str): Nombre del módulo
+        directorio (str): Directorio de trabajo del intérprete
+        top (int): Número de paquetes a devolver
+
+    Returns:
+        list: Tuplas (paquete, milisegundos)
+    """
+    resultado = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+                               cwd=directorio, check=True, capture_output=True, text=True)
+    lineas = []
+    for linea in resultado.stderr.splitlines():
+        if not linea.startswith('import time:') or '|' not in linea:
+            continue
+        _, acumulado, nombre = linea.split('|')
+        if acumulado.strip().isdigit():
+            sangria = len(nombre) - len(nombre.lstrip(' '))
+            lineas.append((sangria, nombre.strip(), int(acumulado) / 1000))
+
+    # Las importaciones directas del módulo aparecen justo antes de su línea,
+    # con un nivel más de sangría
+    paquetes = {}
+    indice = max(i for i, (_, nombre, _) in enumerate(lineas) if nombre == modulo)
+    sangria_modulo = lineas[indice][0]
+    for sangria, nombre, ms in reversed(lineas[:indice]):
+        if sangria <= sangria_modulo:
+            break
+        if sangria == sangria_modulo + 2:
+            paquetes[nombre] = ms
+    return sorted(paquetes.items(), key=lambda x: x[1], reverse=True)[:top]
+
+def main(repeticiones=5):
+    """
+    Mide el arranque de todos los puntos de entrada y muestra un resumen
+
+    Args:
+        repeticiones (int): Número de mediciones por punto de entrada
+    """
+    print("=" * 60)
+    print("TIEMPO DE ARRANQUE POR PUNTO DE ENTRADA")
+    print("=" * 60)
+
+    base = medir_importacion('sys', DIRECTORIO_PROYECTO, repeticiones)
+    print(f"Arranque del intérprete (referencia): {base:.0f} ms\n")
+
+    for modulo, directorio in PUNTOS_DE_ENTRADA.items():
+        total = medir_importacion(modulo, directorio, repeticiones)
+        print(f"{modulo}: {total - base:.0f} ms sobre el intérprete")
+        for paquete, ms in paquetes_mas_pesados(modulo, directorio):
+            print(f"    {paquete}: {ms:.0f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mide el tiempo de importación de cada punto de entrada")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Mediciones por punto de entrada")
+    main(parser.parse_args().repeticiones)
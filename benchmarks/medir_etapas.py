@@ -0,0 +1,170 @@
+"""
+Medición de Etapas con Catálogos Sintéticos - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script mide el tiempo, el rendimiento (filas por segundo) y el pico de
+memoria de cada etapa del análisis (carga, limpieza, transformación,
+resumen, análisis de categóricas y gráficos) sobre catálogos sintéticos de
+distintos tamaños, para detectar qué etapas no escalan antes de que lleguen
+a producción.
+
+Los catálogos se generan con generar_catalogo.py y se reutilizan entre
+ejecuciones. Los resultados se añaden a benchmarks/resultados/etapas.jsonl.
+
+Uso:
+    python benchmarks/medir_etapas.py [--tamanos 10k 1M] [--etapas limpieza resumen]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import generar_catalogo
+
+DIRECTORIO_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO_SCRIPTS = os.path.join(os.path.dirname(DIRECTORIO_BENCHMARKS), 'scripts')
+DIRECTORIO_RESULTADOS = os.path.join(DIRECTORIO_BENCHMARKS, 'resultados')
+RUTA_RESULTADOS = os.path.join(DIRECTORIO_RESULTADOS, 'etapas.jsonl')
+
+sys.path.insert(0, DIRECTORIO_SCRIPTS)
+
+import data_cleaning  # noqa: E402
+import data_analysis  # noqa: E402
+import visualizations  # noqa: E402
+
+# Nombre -> (función que recibe el estado y devuelve el nuevo valor, clave del estado)
+ETAPAS = {
+    'carga': (lambda e: data_cleaning.cargar_datos(e['ruta']), 'original'),
+    'limpieza': (lambda e: data_cleaning.limpiar_datos(e['original']), 'limpio'),
+    'transformacion': (lambda e: data_cleaning.transformar_datos(e['limpio']), 'final'),
+    'resumen': (lambda e: data_analysis.resumen_estadistico(e['final']), None),
+    'categoricas': (lambda e: data_analysis.analizar_categoricas(e['final']), None),
+    'graficos': (lambda e: _generar_graficos(e['final']), None),
+}
+
+def _generar_graficos(df):
+    """
+    Genera los gráficos en el proceso actual, sin pantalla, dentro de
+    benchmarks/resultados/graficos para no sobrescribir los del reporte
+    """
+    visualizations.DIRECTORIO_REPORTES = os.path.join(DIRECTORIO_RESULTADOS, 'graficos')
+    visualizations.DIRECTORIO_IMAGENES = visualizations.DIRECTORIO_REPORTES
+    os.makedirs(visualizations.DIRECTORIO_IMAGENES, exist_ok=True)
+    visualizations.configurar_modo_sin_pantalla()
+    for _, funcion, _ in visualizations.GRAFICOS:
+        funcion(df)
+
+def medir_etapa(funcion, estado, filas, medir_memoria=True):
+    """
+    Ejecuta una etapa midiendo tiempo y pico de memoria
+
+    La salida por pantalla de la etapa se descarta para que no influya en
+    la medición.
+
+    Args:
+        funcion (callable): Etapa a ejecutar, recibe el estado
+        estado (dict): Resultados de las etapas anteriores
+        filas (int): Filas procesadas, para calcular el rendimiento
+        medir_memoria (bool): Usa tracemalloc para el pico de memoria
+            (añade algo de sobrecoste a la etapa)
+
+    Returns:
+        tuple: (resultado de la etapa, diccionario de métricas)
+    """
+    if medir_memoria:
+        tracemalloc.start()
+
+    inicio = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+        resultado = funcion(estado)
+    segundos = time.perf_counter() - inicio
+
+    pico_mb = None
+    if medir_memoria:
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        pico_mb = pico / 1024 ** 2
+
+    return resultado, {
+        'segundos': round(segundos, 4),
+        'filas_por_segundo': round(filas / segundos) if segundos > 0 else None,
+        'pico_memoria_mb': round(pico_mb, 1) if pico_mb is not None else None,
+    }
+
+def medir_tamano(filas, etapas, medir_memoria=True):
+    """
+    Mide las etapas indicadas sobre un catálogo sintético de un tamaño
+
+    Args:
+        filas (int): Número de filas del catálogo
+        etapas (list): Nombres de etapas (en el orden de ETAPAS)
+        medir_memoria (bool): Mide el pico de memoria de cada etapa
+
+    Returns:
+        list: Un diccionario de métricas por etapa
+    """
+    ruta = generar_catalogo.ruta_catalogo(filas)
+    if not os.path.exists(ruta):
+        print(f"Generando catálogo sintético de {filas:,} filas...")
+        generar_catalogo.generar_catalogo(ruta, filas)
+
+    # Las etapas posteriores necesitan los resultados de las anteriores
+    ultima = max(list(ETAPAS).index(nombre) for nombre in etapas)
+    estado = {'ruta': ruta}
+    resultados = []
+    for nombre in list(ETAPAS)[:ultima + 1]:
+        funcion, clave = ETAPAS[nombre]
+        resultado, metricas = medir_etapa(funcion, estado, filas, medir_memoria)
+        if clave is not None:
+            estado[clave] = resultado
+        if nombre not in etapas:
+            continue
+
+        metricas = {'filas': filas, 'etapa': nombre, **metricas}
+        resultados.append(metricas)
+        memoria = f"{metricas['pico_memoria_mb']:.1f} MB" if medir_memoria else "-"
+        print(f"{filas:>12,} {nombre:<16} {metricas['segundos']:>10.3f} s "
+              f"{metricas['filas_por_segundo'] or 0:>14,} filas/s {memoria:>12}")
+    return resultados
+
+def main(tamanos, etapas, medir_memoria=True):
+    """
+    Mide todas las combinaciones de tamaño y etapa y guarda los resultados
+
+    Args:
+        tamanos (list): Números de filas
+        etapas (list): Nombres de etapas a medir
+        medir_memoria (bool): Mide el pico de memoria de cada etapa
+    """
+    print("=" * 60)
+    print("RENDIMIENTO POR ETAPA CON CATÁLOGOS SINTÉTICOS")
+    print("=" * 60)
+    print(f"{'filas':>12} {'etapa':<16} {'tiempo':>12} {'rendimiento':>22} {'pico memoria':>12}")
+
+    fecha = datetime.now().isoformat(timespec='seconds')
+    os.makedirs(DIRECTORIO_RESULTADOS, exist_ok=True)
+    with open(RUTA_RESULTADOS, 'a', encoding='utf-8') as f:
+        for filas in tamanos:
+            for metricas in medir_tamano(filas, etapas, medir_memoria):
+                f.write(json.dumps({'fecha': fecha, **metricas}) + '\n')
+
+    print(f"\nResultados añadidos a: {RUTA_RESULTADOS}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mide cómo escalan las etapas del análisis")
+    parser.add_argument("--tamanos", nargs='+', default=['10k', '1M'],
+                        help="Tamaños de catálogo, p. ej. 10k 1M 10M")
+    parser.add_argument("--etapas", nargs='+', choices=list(ETAPAS), default=list(ETAPAS),
+                        help="Etapas a medir (las anteriores se ejecutan igualmente)")
+    parser.add_argument("--sin-memoria", action="store_true",
+                        help="No mide el pico de memoria (evita el sobrecoste de tracemalloc)")
+    argumentos = parser.parse_args()
+
+    main([generar_catalogo.parsear_filas(t) for t in argumentos.tamanos],
+         argumentos.etapas, medir_memoria=not argumentos.sin_memoria)
@@ -13,21 +13,74 @@ Este script ejecuta todo el análisis exploratorio de datos de forma automatizad
 
 import os
 import sys
+import argparse
 import subprocess
-import pandas as pd
+import tempfile
+from contextlib import redirect_stdout
 from datetime import datetime
 
-def ejecutar_script(script_path, descripcion):
+# Directorio de los scripts de análisis (para importarlos en proceso)
+DIRECTORIO_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts")
+
+# Registro de métricas por etapa y perfiles de cProfile (--perfilar)
+RUTA_REGISTRO_METRICAS = os.path.join("reports", "metricas_ejecucion.jsonl")
+DIRECTORIO_PERFILES = os.path.join("reports", "perfiles")
+
+# Salidas del análisis estadístico (se conservan para las ejecuciones que lo omiten)
+RUTA_ANALISIS_TEXTO = os.path.join("reports", "analisis_estadistico.txt")
+RUTA_ANALISIS_JSON = os.path.join("reports", "analisis_estadistico.json")
+RUTA_CUBO = os.path.join("reports", "cubo_precios.pkl")
+RUTA_REPORTE = os.path.join("reports", "EDA_Report.html")
+
+# Scripts que deciden cómo se cargan los datos limpios en el análisis y los gráficos
+ARCHIVOS_CODIGO_CARGA = ['cache_datos.py', 'bloque_numerico.py']
+
+class _SalidaDuplicada:
+    """
+    Escribe en la consola y a la vez en un archivo (como el comando tee)
+    """
+    def __init__(self, archivo, consola):
+        self.archivo = archivo
+        self.consola = consola
+    
+    def write(self, texto):
+        self.consola.write(texto)
+        return self.archivo.write(texto)
+    
+    def flush(self):
+        self.consola.flush()
+        self.archivo.flush()
+
+def _ruta_perfil(directorio_perfiles, numero, nombre):
+    """
+    Ruta del perfil de cProfile de una etapa, o None si no se perfila
+    """
+    if directorio_perfiles is None:
+        return None
+    return os.path.abspath(os.path.join(directorio_perfiles, f"{numero}_{nombre}.prof"))
+
+def ejecutar_script(script_path, descripcion, argumentos=(), ruta_perfil=None, ruta_salida_texto=None):
     """
     Ejecuta un script de Python y maneja errores
     
+    La salida del script se muestra a medida que se produce y la etapa
+    queda medida en el registro de métricas.
+    
     Args:
         script_path (str): Ruta al script a ejecutar
         descripcion (str): Descripción del script
+        argumentos (tuple): Argumentos adicionales de línea de comandos
+        ruta_perfil (str): Si se indica, ejecuta el script bajo cProfile y
+            guarda el perfil en esta ruta
+        ruta_salida_texto (str): Si se indica, guarda además la salida del
+            script en este archivo
     """
+    import instrumentacion
+    
     print(f"\n{'='*60}")
     print(f"EJECUTANDO: {descripcion}")
     print(f"{'='*60}")
+    sys.stdout.flush()
     
     try:
         # Obtener la ruta absoluta del script
@@ -35,15 +88,35 @@ def ejecutar_script(script_path, descripcion):
         script_dir = os.path.dirname(script_abs_path)
         script_name = os.path.basename(script_abs_path)
         
-        # Ejecutar el script desde su directorio
-        result = subprocess.run([sys.executable, script_name], 
-                              capture_output=True, text=True, cwd=script_dir)
+        comando = [sys.executable, script_name, *argumentos]
+        if ruta_perfil:
+            os.makedirs(os.path.dirname(ruta_perfil), exist_ok=True)
+            comando = [sys.executable, "-m", "cProfile", "-o", ruta_perfil, script_name, *argumentos]
+        
+        # Ejecutar el script desde su directorio. La salida de errores va a
+        # un archivo temporal: con dos tuberías, un script que escribe mucho
+        # en stderr se bloquearía mientras se lee su stdout
+        with instrumentacion.medir(descripcion, subproceso=True) as medicion, \
+                tempfile.TemporaryFile('w+', encoding='utf-8') as errores:
+            if ruta_salida_texto:
+                with open(ruta_salida_texto, 'w', encoding='utf-8') as archivo:
+                    proceso = subprocess.Popen(comando, stdout=subprocess.PIPE, stderr=errores,
+                                               text=True, encoding='utf-8', cwd=script_dir)
+                    for linea in proceso.stdout:
+                        sys.stdout.write(linea)
+                        archivo.write(linea)
+            else:
+                proceso = subprocess.Popen(comando, stderr=errores, cwd=script_dir)
+            codigo, medicion['rss_pico_mb'] = instrumentacion.esperar_proceso(proceso)
+            errores.seek(0)
+            stderr = errores.read()
+            result = subprocess.CompletedProcess(comando, codigo, stderr=stderr)
+            medicion['codigo_salida'] = result.returncode
+            if ruta_perfil:
+                medicion['perfil'] = ruta_perfil
         
         if result.returncode == 0:
-            print(f"✅ {descripcion} completado exitosamente")
-            if result.stdout:
-                print("Salida del script:")
-                print(result.stdout)
+            print(f"✅ {descripcion} completado exitosamente ({medicion['segundos']:.1f} s)")
         else:
             print(f"❌ Error en {descripcion}")
             print("Error:")
@@ -56,150 +129,276 @@ def ejecutar_script(script_path, descripcion):
     
     return True
 
+def _habilitar_importacion_scripts():
+    """
+    Permite importar los módulos de la carpeta scripts/ desde este proceso
+    """
+    if DIRECTORIO_SCRIPTS not in sys.path:
+        sys.path.insert(0, DIRECTORIO_SCRIPTS)
+
+def ejecutar_en_proceso(exportar_csv=False, procesos_graficos=1, compactar=False,
+                        directorio_perfiles=None, pendientes=None, manifiesto=None, vecinos=None):
+    """
+    Ejecuta las tres etapas dentro del mismo intérprete
+    
+    Los módulos se importan una sola vez y el DataFrame limpio se pasa
+    en memoria de una etapa a la siguiente, sin releer el CSV. Solo se
+    ejecutan las tareas pendientes; cada etapa completada se anota en el
+    manifiesto.
+    
+    Args:
+        exportar_csv (bool): Si es True también se escribe data/laptop_limpio.csv
+        procesos_graficos (int): Procesos usados para generar los gráficos
+        compactar (bool): Pasa a las etapas siguientes el DataFrame compactado
+            (categorías y tipos numéricos reducidos)
+        directorio_perfiles (str): Si se indica, guarda un perfil de cProfile
+            por etapa en este directorio
+        pendientes (list): Tareas a ejecutar (ver construir_tareas); por
+            defecto todas
+        manifiesto (dict): Manifiesto donde se registran las tareas completadas
+        vecinos (int): Imputa las especificaciones con ese número de vecinos
+            más cercanos (ver data_cleaning.main)
+        
+    Returns:
+        pandas.DataFrame: DataFrame limpio, o None si alguna etapa falló
+    """
+    _habilitar_importacion_scripts()
+    
+    import data_cleaning
+    import data_analysis
+    import visualizations
+    import instrumentacion
+    
+    if pendientes is None:
+        pendientes = construir_tareas(compactar, vecinos)
+    if manifiesto is None:
+        manifiesto = {}
+    analisis = [t for t in pendientes if t['etapa'] == 'analisis']
+    graficos = [t for t in pendientes if t['etapa'] == 'visualizaciones']
+    
+    def analisis_estadistico():
+        # La salida se guarda para reutilizarla cuando el análisis esté al día
+        with open(RUTA_ANALISIS_TEXTO, 'w', encoding='utf-8') as archivo:
+            with redirect_stdout(_SalidaDuplicada(archivo, sys.stdout)):
+                return data_analysis.main(df)
+    
+    ruta_salida = data_cleaning.RUTA_DATOS_LIMPIOS if exportar_csv else None
+    
+    def limpieza():
+        df = data_cleaning.main(data_cleaning.RUTA_DATOS, ruta_salida, compactar=compactar, vecinos=vecinos)
+        if df is None:
+            raise RuntimeError("no se pudieron cargar los datos originales")
+        return df
+    
+    etapas = [
+        ("limpieza", "Limpieza y Transformación de Datos", limpieza, []),
+        ("analisis", "Análisis Estadístico", analisis_estadistico, analisis),
+        ("visualizaciones", "Generación de Visualizaciones",
+         lambda: visualizations.main(df, sin_pantalla=True, max_workers=procesos_graficos,
+                                     graficos=[t['grafico'] for t in graficos]), graficos),
+    ]
+    
+    df = None
+    for numero, (nombre, descripcion, etapa, tareas) in enumerate(etapas, start=1):
+        if nombre != "limpieza" and not tareas:
+            continue
+        
+        print(f"\n{'='*60}")
+        print(f"EJECUTANDO: {descripcion}")
+        print(f"{'='*60}")
+        
+        try:
+            with instrumentacion.medir(descripcion, filas=None if df is None else len(df),
+                                       ruta_perfil=_ruta_perfil(directorio_perfiles, numero, nombre)) as medicion:
+                resultado = etapa()
+                if df is None:
+                    medicion['filas'] = len(resultado)
+        except Exception as e:
+            print(f"❌ Error ejecutando {descripcion}: {e}")
+            return None
+        
+        if df is None:
+            df = resultado
+        if nombre == "visualizaciones":
+            # Los gráficos opcionales que fallaron se repiten la próxima vez
+            tareas = [t for t in tareas if t['grafico'] not in resultado]
+        registrar_tareas(manifiesto, tareas)
+        print(f"✅ {descripcion} completado exitosamente ({medicion['segundos']:.1f} s)")
+    
+    return df
+
+def construir_tareas(compactar=False, vecinos=None):
+    """
+    Declara las tareas del análisis con sus salidas y huellas
+    
+    La huella de los datos combina el archivo original, el código de
+    limpieza, el código que decide cómo se cargan los datos limpios
+    (cache_datos.py y bloque_numerico.py) y los parámetros que cambian el
+    DataFrame limpio (compactación y vecinos de la imputación). Cada tarea
+    añade la huella de su propio código: el análisis depende de sus
+    scripts; cada gráfico solo del código de su función y de la parte común
+    de visualizations.py. El reporte depende de los archivos que presenta
+    (ver huella_reporte).
+    
+    Args:
+        compactar (bool): Si el DataFrame se compacta antes del análisis
+        vecinos (int): Vecinos de la imputación (None para la imputación por defecto)
+        
+    Returns:
+        list: Diccionarios con nombre, descripcion, etapa, huella, salidas
+            (y en los gráficos: grafico, el nombre de la función, y
+            salidas_opcionales)
+    """
+    _habilitar_importacion_scripts()
+    
+    import cache_datos
+    import grafo_etapas
+    import visualizations
+    
+    codigo_limpieza = [os.path.join(DIRECTORIO_SCRIPTS, nombre)
+                       for nombre in cache_datos.ARCHIVOS_CODIGO_LIMPIEZA + ARCHIVOS_CODIGO_CARGA]
+    huella_datos = grafo_etapas.huella(
+        grafo_etapas.huella_archivos([cache_datos.RUTA_DATOS] + codigo_limpieza),
+        {'compactar': compactar, 'vecinos': vecinos},
+    )
+    
+    tareas = [{
+        'nombre': 'analisis',
+        'descripcion': 'Análisis Estadístico',
+        'etapa': 'analisis',
+        'huella': grafo_etapas.huella(huella_datos, grafo_etapas.huella_archivos(
+            [os.path.join(DIRECTORIO_SCRIPTS, nombre)
+             for nombre in ('data_analysis.py', 'correlaciones.py', 'perfil_categoricas.py',
+                            'cubo_precios.py')])),
+        'salidas': [os.path.abspath(RUTA_ANALISIS_TEXTO), os.path.abspath(RUTA_ANALISIS_JSON),
+                    os.path.abspath(RUTA_CUBO)],
+    }]
+    
+    funciones = [funcion for _, funcion, _ in visualizations.GRAFICOS]
+    huella_correlaciones = grafo_etapas.huella_archivos([os.path.join(DIRECTORIO_SCRIPTS, 'correlaciones.py')])
+    for descripcion, funcion, _ in visualizations.GRAFICOS:
+        otras = [f for f in funciones if f is not funcion]
+        tareas.append({
+            'nombre': f"grafico:{funcion.__name__}",
+            'descripcion': descripcion,
+            'etapa': 'visualizaciones',
+            'grafico': funcion.__name__,
+            'huella': grafo_etapas.huella(huella_datos, huella_correlaciones,
+                                          grafo_etapas.huella_funcion(funcion, otras)),
+            'salidas': visualizations.salidas_grafico(funcion.__name__),
+            'salidas_opcionales': visualizations.salidas_opcionales_grafico(funcion.__name__),
+        })
+    
+    tareas.append({
+        'nombre': 'reporte',
+        'descripcion': 'Reporte Final',
+        'etapa': 'reporte',
+        'huella': huella_reporte(tareas),
+        'salidas': [os.path.abspath(RUTA_REPORTE)],
+    })
+    return tareas
+
+def huella_reporte(tareas):
+    """
+    Huella de las entradas del reporte
+    
+    Se calcula sobre los archivos que el reporte presenta (el artefacto JSON
+    del análisis y las salidas de los gráficos) y sobre reporte.py y su
+    plantilla. Si el análisis o algún gráfico se vuelven a ejecutar, hay que
+    recalcularla después, cuando sus salidas ya están escritas.
+    
+    Args:
+        tareas (list): Tareas de construir_tareas
+        
+    Returns:
+        str: Hash hexadecimal
+    """
+    import grafo_etapas
+    
+    salidas_graficos = [ruta for tarea in tareas if tarea['etapa'] == 'visualizaciones'
+                        for ruta in tarea['salidas']]
+    return grafo_etapas.huella(grafo_etapas.huella_archivos(
+        [os.path.abspath(RUTA_ANALISIS_JSON), *salidas_graficos,
+         os.path.join(DIRECTORIO_SCRIPTS, 'reporte.py'),
+         os.path.join(DIRECTORIO_SCRIPTS, 'plantillas', 'reporte_eda.html')]))
+
+def registrar_tareas(manifiesto, tareas):
+    """
+    Anota en el manifiesto las tareas completadas y lo guarda
+    
+    Args:
+        manifiesto (dict): Manifiesto de ejecuciones
+        tareas (list): Tareas completadas (ver construir_tareas)
+    """
+    if not tareas:
+        return
+    import grafo_etapas
+    
+    for tarea in tareas:
+        grafo_etapas.registrar_tarea(manifiesto, tarea['nombre'], tarea['huella'], tarea['salidas'],
+                                     tarea.get('salidas_opcionales', ()))
+    grafo_etapas.guardar_manifiesto(manifiesto)
+
 def crear_reporte_final():
     """
-    Crea un reporte final en HTML con todos los hallazgos
+    Crea el reporte final en HTML a partir de los resultados del análisis
+    
+    Returns:
+        bool: True si el reporte se generó
     """
     print(f"\n{'='*60}")
     print("CREANDO REPORTE FINAL")
     print(f"{'='*60}")
     
-    # Cargar datos limpios para el reporte
-    try:
-        df = pd.read_csv("data/laptop_limpio.csv")
-    except FileNotFoundError:
-        print("❌ No se encontró el archivo de datos limpios")
-        return
+    _habilitar_importacion_scripts()
+    import reporte
     
-    # Crear reporte HTML
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="es">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Reporte EDA - Dataset de Laptops</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }}
-            .container {{ max-width: 1200px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
-            h1 {{ color: #2c3e50; text-align: center; border-bottom: 3px solid #3498db; padding-bottom: 10px; }}
-            h2 {{ color: #34495e; margin-top: 30px; }}
-            h3 {{ color: #7f8c8d; }}
-            .metric {{ background-color: #ecf0f1; padding: 15px; margin: 10px 0; border-radius: 5px; border-left: 4px solid #3498db; }}
-            .highlight {{ background-color: #fff3cd; padding: 10px; border-radius: 5px; border-left: 4px solid #ffc107; }}
-            .success {{ background-color: #d4edda; padding: 10px; border-radius: 5px; border-left: 4px solid #28a745; }}
-            .warning {{ background-color: #f8d7da; padding: 10px; border-radius: 5px; border-left: 4px solid #dc3545; }}
-            table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-            th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
-            th {{ background-color: #3498db; color: white; }}
-            tr:nth-child(even) {{ background-color: #f2f2f2; }}
-            .image-container {{ text-align: center; margin: 20px 0; }}
-            .image-container img {{ max-width: 100%; height: auto; border-radius: 5px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>📊 Reporte de Análisis Exploratorio de Datos</h1>
-            <h2>Dataset de Laptops</h2>
-            
-            <div class="metric">
-                <h3>📅 Información del Análisis</h3>
-                <p><strong>Fecha de análisis:</strong> {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}</p>
-                <p><strong>Autor:</strong> [Tu nombre]</p>
-            </div>
-            
-            <h2>📈 Resumen Ejecutivo</h2>
-            <div class="metric">
-                <p><strong>Total de observaciones:</strong> {len(df):,}</p>
-                <p><strong>Total de variables:</strong> {len(df.columns)}</p>
-                <p><strong>Variables numéricas:</strong> {len(df.select_dtypes(include=['number']).columns)}</p>
-                <p><strong>Variables categóricas:</strong> {len(df.select_dtypes(include=['object']).columns)}</p>
-            </div>
-            
-            <h2>🔍 Hallazgos Principales</h2>
-            
-            <h3>1. Calidad de los Datos</h3>
-            <div class="success">
-                <p><strong>✅ Limpieza completada:</strong> Los datos han sido limpiados exitosamente, eliminando duplicados y manejando valores faltantes.</p>
-            </div>
-            
-            <h3>2. Análisis Estadístico</h3>
-            <div class="metric">
-                <p><strong>Estadísticas descriptivas calculadas</strong></p>
-                <p><strong>Outliers detectados y analizados</strong></p>
-                <p><strong>Correlaciones identificadas</strong></p>
-            </div>
-            
-            <h3>3. Visualizaciones Generadas</h3>
-            <div class="metric">
-                <p>Se han creado múltiples visualizaciones incluyendo:</p>
-                <ul>
-                    <li>Distribuciones de variables numéricas</li>
-                    <li>Matriz de correlaciones</li>
-                    <li>Análisis de variables categóricas</li>
-                    <li>Gráficos de caja para outliers</li>
-                    <li>Visualizaciones interactivas</li>
-                </ul>
-            </div>
-            
-            <h2>📊 Estadísticas Detalladas</h2>
-            
-            <h3>Variables Numéricas</h3>
-            {df.describe().to_html()}
-            
-            <h3>Valores Faltantes</h3>
-            <div class="metric">
-                {df.isnull().sum().to_frame('Valores Faltantes').to_html()}
-            </div>
-            
-            <h2>🎯 Conclusiones</h2>
-            <div class="highlight">
-                <p><strong>El análisis exploratorio ha revelado patrones importantes en el dataset de laptops:</strong></p>
-                <ul>
-                    <li>La calidad de los datos es buena después de la limpieza</li>
-                    <li>Se han identificado correlaciones significativas entre variables</li>
-                    <li>Los outliers han sido detectados y documentados</li>
-                    <li>Las distribuciones muestran características interesantes del mercado</li>
-                </ul>
-            </div>
-            
-            <h2>📋 Próximos Pasos Recomendados</h2>
-            <div class="metric">
-                <ol>
-                    <li><strong>Análisis más profundo:</strong> Investigar relaciones específicas entre variables</li>
-                    <li><strong>Modelado:</strong> Desarrollar modelos predictivos basados en los hallazgos</li>
-                    <li><strong>Segmentación:</strong> Identificar segmentos de mercado específicos</li>
-                    <li><strong>Optimización:</strong> Aplicar técnicas de optimización para precios o características</li>
-                </ol>
-            </div>
-            
-            <h2>📁 Archivos Generados</h2>
-            <div class="metric">
-                <p><strong>Datos procesados:</strong> data/laptop_limpio.csv</p>
-                <p><strong>Visualizaciones:</strong> reports/images/</p>
-                <p><strong>Scripts de análisis:</strong> scripts/</p>
-                <p><strong>Notebook principal:</strong> notebooks/EDA_Laptops.ipynb</p>
-            </div>
-            
-            <div class="success">
-                <h3>✅ Análisis Completado</h3>
-                <p>El análisis exploratorio de datos ha sido completado exitosamente. Todos los archivos han sido generados y organizados en la estructura del proyecto.</p>
-            </div>
-        </div>
-    </body>
-    </html>
+    if not reporte.main(ruta_salida=os.path.abspath(RUTA_REPORTE)):
+        return False
+    print("✅ Reporte HTML creado exitosamente en reports/EDA_Report.html")
+    return True
+
+def parsear_argumentos(argv=None):
     """
+    Lee las opciones de línea de comandos
     
-    # Guardar reporte HTML
-    with open("reports/EDA_Report.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
-    
-    print("✅ Reporte HTML creado exitosamente en reports/EDA_Report.html")
+    Args:
+        argv (list): Argumentos a interpretar (por defecto sys.argv)
+        
+    Returns:
+        argparse.Namespace: Opciones de ejecución
+    """
+    parser = argparse.ArgumentParser(description="Análisis EDA completo del dataset de laptops")
+    parser.add_argument("--en-proceso", action="store_true",
+                        help="Ejecuta las etapas en el mismo intérprete pasando el DataFrame en memoria")
+    parser.add_argument("--exportar-csv", action="store_true",
+                        help="Con --en-proceso, escribe igualmente data/laptop_limpio.csv")
+    parser.add_argument("--procesos-graficos", type=int, default=1, metavar="N",
+                        help="Genera los gráficos en paralelo con N procesos")
+    parser.add_argument("--compactar", action="store_true",
+                        help="Con --en-proceso, compacta el DataFrame en memoria antes del análisis")
+    parser.add_argument("--vecinos", type=int, metavar="K",
+                        help="Rellena las especificaciones faltantes con los K vecinos más cercanos")
+    parser.add_argument("--registro", default=RUTA_REGISTRO_METRICAS, metavar="RUTA",
+                        help="Archivo JSON lines donde se añaden las métricas de cada etapa")
+    parser.add_argument("--perfilar", action="store_true",
+                        help="Guarda un perfil de cProfile por etapa en reports/perfiles/")
+    parser.add_argument("--forzar", action="store_true",
+                        help="Vuelve a generar todas las salidas aunque estén al día")
+    opciones = parser.parse_args(argv)
+    if opciones.compactar and not opciones.en_proceso:
+        parser.error("--compactar requiere --en-proceso")
+    return opciones
 
-def main():
+def main(argv=None):
     """
     Función principal que ejecuta todo el análisis
+    
+    Args:
+        argv (list): Argumentos de línea de comandos (por defecto sys.argv)
     """
+    opciones = parsear_argumentos(argv)
+    
     print("🚀 INICIANDO ANÁLISIS EXPLORATORIO DE DATOS COMPLETO")
     print("=" * 60)
     print(f"Fecha y hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
@@ -213,20 +412,82 @@ def main():
     # Crear carpetas necesarias
     os.makedirs("reports/images", exist_ok=True)
     
-    # Ejecutar scripts en orden
-    scripts = [
-        ("scripts/data_cleaning.py", "Limpieza y Transformación de Datos"),
-        ("scripts/data_analysis.py", "Análisis Estadístico"),
-        ("scripts/visualizations.py", "Generación de Visualizaciones")
-    ]
+    # Registro de métricas compartido con los subprocesos
+    _habilitar_importacion_scripts()
+    import instrumentacion
+    id_ejecucion = instrumentacion.configurar_registro(opciones.registro)
+    directorio_perfiles = None
+    if opciones.perfilar:
+        directorio_perfiles = os.path.join(DIRECTORIO_PERFILES, id_ejecucion)
     
-    for script_path, descripcion in scripts:
-        if not ejecutar_script(script_path, descripcion):
+    # Decidir qué salidas están al día
+    import grafo_etapas
+    tareas = construir_tareas(opciones.compactar, opciones.vecinos)
+    manifiesto = grafo_etapas.cargar_manifiesto()
+    pendientes = grafo_etapas.tareas_pendientes(tareas, manifiesto, opciones.forzar)
+    # Si cambian el análisis o los gráficos, también cambian las entradas del reporte
+    if any(t['etapa'] != 'reporte' for t in pendientes):
+        pendientes += [t for t in tareas if t['etapa'] == 'reporte' and t not in pendientes]
+    nombres_pendientes = {t['nombre'] for t in pendientes}
+    for tarea in tareas:
+        if tarea['nombre'] not in nombres_pendientes:
+            print(f"⏭️  {tarea['descripcion']}: al día, se reutilizan sus salidas")
+    
+    falta_csv = opciones.exportar_csv and not os.path.exists("data/laptop_limpio.csv")
+    etapas_pendientes = {t['etapa'] for t in pendientes}
+    
+    df = None
+    if not (etapas_pendientes - {'reporte'}) and not falta_csv:
+        # Nada que recalcular antes del reporte
+        pass
+    elif opciones.en_proceso:
+        # Ejecutar las etapas en memoria dentro de este intérprete
+        df = ejecutar_en_proceso(exportar_csv=opciones.exportar_csv,
+                                 procesos_graficos=opciones.procesos_graficos,
+                                 compactar=opciones.compactar,
+                                 directorio_perfiles=directorio_perfiles,
+                                 pendientes=pendientes,
+                                 manifiesto=manifiesto,
+                                 vecinos=opciones.vecinos)
+        if df is None:
             print(f"❌ Error en el proceso. Deteniendo ejecución.")
             return
+    else:
+        # Ejecutar scripts en orden
+        # Los gráficos se generan sin pantalla: solo se escriben a disco
+        graficos = [t for t in pendientes if t['etapa'] == 'visualizaciones']
+        # Todas las etapas leen la entrada de la caché de la misma imputación
+        argumentos_vecinos = ("--vecinos", str(opciones.vecinos)) if opciones.vecinos else ()
+        argumentos_graficos = ("--sin-pantalla", "--procesos", str(opciones.procesos_graficos),
+                               *argumentos_vecinos, "--graficos", *[t['grafico'] for t in graficos])
+        scripts = [
+            ("scripts/data_cleaning.py", "Limpieza y Transformación de Datos", argumentos_vecinos, []),
+            ("scripts/data_analysis.py", "Análisis Estadístico", argumentos_vecinos,
+             [t for t in pendientes if t['etapa'] == 'analisis']),
+            ("scripts/visualizations.py", "Generación de Visualizaciones", argumentos_graficos, graficos)
+        ]
+        
+        for numero, (script_path, descripcion, argumentos, tareas_script) in enumerate(scripts, start=1):
+            if numero > 1 and not tareas_script:
+                continue
+            nombre = os.path.splitext(os.path.basename(script_path))[0]
+            ruta_perfil = _ruta_perfil(directorio_perfiles, numero, nombre)
+            ruta_texto = RUTA_ANALISIS_TEXTO if nombre == "data_analysis" else None
+            if not ejecutar_script(script_path, descripcion, argumentos, ruta_perfil, ruta_texto):
+                print(f"❌ Error en el proceso. Deteniendo ejecución.")
+                return
+            registrar_tareas(manifiesto, tareas_script)
     
     # Crear reporte final
-    crear_reporte_final()
+    reporte = [t for t in pendientes if t['etapa'] == 'reporte']
+    if reporte:
+        with instrumentacion.medir("Reporte Final",
+                                   ruta_perfil=_ruta_perfil(directorio_perfiles, 4, "reporte")):
+            creado = crear_reporte_final()
+        if creado:
+            for tarea in reporte:
+                tarea['huella'] = huella_reporte(tareas)
+            registrar_tareas(manifiesto, reporte)
     
     print(f"\n{'='*60}")
     print("🎉 ANÁLISIS COMPLETADO EXITOSAMENTE")
@@ -235,6 +496,9 @@ def main():
     print("   - data/laptop_limpio.csv (datos procesados)")
     print("   - reports/images/ (visualizaciones)")
     print("   - reports/EDA_Report.html (reporte final)")
+    print(f"   - {opciones.registro} (métricas por etapa, ejecución {id_ejecucion})")
+    if directorio_perfiles:
+        print(f"   - {directorio_perfiles}/ (perfiles de cProfile por etapa)")
     print("   - notebooks/EDA_Laptops.ipynb (notebook principal)")
     print("\n📖 Para ver el análisis completo, abre:")
     print("   - reports/EDA_Report.html (reporte ejecutivo)")
@@ -0,0 +1,198 @@
+"""
+Bloque Numérico Compartido - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script guarda las columnas numéricas de los datos limpios en un único
+archivo binario (una columna tras otra, cada una con su propio tipo) y
+describe su contenido en un pequeño esquema JSON al lado: filas, orden de
+todas las columnas del DataFrame y tipo y posición de cada columna del
+bloque.
+
+Los procesos que necesitan los datos abren el archivo con numpy.memmap:
+cada columna es una vista sobre el archivo, sin copias ni deserialización,
+y el sistema operativo solo lee las páginas de las columnas que se usan.
+Todos los procesos comparten esas páginas, así que la memoria no crece al
+añadir workers y abrir el bloque es casi inmediato. La proyección es de
+copia en escritura: si alguna operación modifica un array (algunas
+funciones de pandas lo hacen con sus argumentos), el proceso recibe una
+copia privada de esas páginas y el archivo no cambia.
+
+Las columnas de texto, categóricas o con tipos de extensión (enteros
+nulables, dispersas) no forman parte del bloque y se pasan aparte.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Incrementar si cambia el formato del archivo o del esquema
+VERSION_BLOQUE = 1
+
+# Cada columna empieza en un múltiplo de estos bytes
+ALINEACION = 64
+
+# Tipos de numpy que se guardan en el bloque: booleanos, enteros, flotantes y fechas
+TIPOS_BLOQUE = 'biufmM'
+
+def ruta_esquema(ruta):
+    """
+    Ruta del esquema JSON que acompaña a un bloque
+    """
+    return os.path.splitext(ruta)[0] + '.json'
+
+def columnas_bloque(df):
+    """
+    Columnas de un DataFrame que se pueden guardar en el bloque
+
+    Args:
+        df (pandas.DataFrame): Datos
+
+    Returns:
+        list: Columnas con tipo numérico, booleano o de fecha de numpy
+    """
+    return [col for col, tipo in df.dtypes.items()
+            if isinstance(tipo, np.dtype) and tipo.kind in TIPOS_BLOQUE]
+
+def guardar_bloque(df, ruta, columnas=None):
+    """
+    Escribe las columnas numéricas en el bloque y su esquema
+
+    El esquema se escribe al final, así que un bloque sin esquema está
+    incompleto y no se abre.
+
+    Args:
+        df (pandas.DataFrame): Datos
+        ruta (str): Archivo del bloque
+        columnas (list): Columnas a guardar (por defecto, columnas_bloque)
+
+    Returns:
+        list: Columnas guardadas
+    """
+    if columnas is None:
+        columnas = columnas_bloque(df)
+    esquema = {
+        'version': VERSION_BLOQUE,
+        'filas': len(df),
+        'orden': list(df.columns),
+        'columnas': [],
+    }
+
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    os.makedirs(directorio, exist_ok=True)
+    temporal = ruta + '.tmp'
+    posicion = 0
+    with open(temporal, 'wb') as f:
+        for col in columnas:
+            valores = np.ascontiguousarray(df[col].to_numpy())
+            relleno = -posicion % ALINEACION
+            f.write(b'\0' * relleno)
+            posicion += relleno
+            esquema['columnas'].append({'nombre': col, 'tipo': valores.dtype.str, 'posicion': posicion})
+            f.write(memoryview(valores.view(np.uint8)))
+            posicion += valores.nbytes
+    os.replace(temporal, ruta)
+
+    with open(ruta_esquema(ruta) + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(esquema, f, ensure_ascii=False, indent=1)
+    os.replace(ruta_esquema(ruta) + '.tmp', ruta_esquema(ruta))
+    return columnas
+
+def leer_esquema(ruta):
+    """
+    Lee el esquema de un bloque
+
+    Args:
+        ruta (str): Archivo del bloque
+
+    Returns:
+        dict: version, filas, orden y columnas (nombre, tipo y posición)
+
+    Raises:
+        FileNotFoundError: Si el bloque no tiene esquema
+        ValueError: Si el esquema es de otra versión
+    """
+    with open(ruta_esquema(ruta), encoding='utf-8') as f:
+        esquema = json.load(f)
+    if esquema.get('version') != VERSION_BLOQUE:
+        raise ValueError(f"Versión de bloque no compatible: {esquema.get('version')}")
+    return esquema
+
+def abrir_bloque(ruta, columnas=None, indice=None, esquema=None):
+    """
+    Abre las columnas del bloque como vistas sobre el archivo
+
+    Args:
+        ruta (str): Archivo del bloque
+        columnas (list): Columnas a abrir (por defecto todas las del bloque)
+        indice (pandas.Index): Índice del resultado (por defecto 0..filas-1)
+        esquema (dict): Esquema ya leído con leer_esquema
+
+    Returns:
+        pandas.DataFrame: Columnas del bloque, sin copiar los datos
+    """
+    if esquema is None:
+        esquema = leer_esquema(ruta)
+    filas = esquema['filas']
+    # No se puede proyectar en memoria un archivo vacío
+    mapa = np.memmap(ruta, dtype=np.uint8, mode='c') if os.path.getsize(ruta) else bytearray()
+
+    datos = {}
+    for info in esquema['columnas']:
+        if columnas is not None and info['nombre'] not in columnas:
+            continue
+        datos[info['nombre']] = np.frombuffer(mapa, dtype=np.dtype(info['tipo']), count=filas,
+                                              offset=info['posicion'])
+    if indice is None:
+        indice = pd.RangeIndex(filas)
+    return pd.DataFrame(datos, index=indice, copy=False)
+
+def combinar(ruta, resto, columnas=None):
+    """
+    Reconstruye el DataFrame completo con el bloque y el resto de columnas
+
+    Args:
+        ruta (str): Archivo del bloque
+        resto (pandas.DataFrame): Columnas que no están en el bloque, con el
+            índice de los datos
+        columnas (list): Columnas del resultado (por defecto todas, en el
+            orden original)
+
+    Returns:
+        pandas.DataFrame: Datos con las columnas del bloque sin copiar y los
+            atributos (df.attrs) del resto
+    """
+    esquema = leer_esquema(ruta)
+    if columnas is None:
+        columnas = esquema['orden']
+    numericas = abrir_bloque(ruta, columnas, resto.index, esquema)
+    datos = {col: numericas[col] if col in numericas.columns else resto[col] for col in columnas}
+    df = pd.DataFrame(datos, index=resto.index, copy=False)
+    df.attrs = dict(resto.attrs)
+    return df
+
+@contextlib.contextmanager
+def bloque_temporal(df):
+    """
+    Guarda las columnas numéricas de df en un bloque temporal
+
+    El bloque se borra al salir del bloque with.
+
+    Args:
+        df (pandas.DataFrame): Datos
+
+    Yields:
+        tuple: (ruta del bloque, DataFrame con las columnas que no están en él)
+    """
+    directorio = tempfile.mkdtemp(prefix='bloque_numerico_')
+    try:
+        ruta = os.path.join(directorio, 'bloque.bin')
+        numericas = guardar_bloque(df, ruta)
+        yield ruta, df.drop(columns=numericas)
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
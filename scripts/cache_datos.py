@@ -0,0 +1,450 @@
+"""
+Caché de Datos Limpios - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script guarda el DataFrame limpio en un formato binario columnar
+(Parquet) para que las siguientes ejecuciones no tengan que volver a
+limpiar ni a reinterpretar el CSV. La clave de la caché combina el hash
+del archivo original y el de los scripts de limpieza, así que cualquier
+cambio en los datos o en el código invalida la entrada automáticamente.
+La imputación (por defecto o por K vecinos, ver imputacion.py) forma parte
+del nombre de la entrada: cada modo tiene la suya y no se sustituyen entre sí.
+
+Junto a cada entrada se guardan sus columnas numéricas como bloque
+proyectable en memoria (ver bloque_numerico.py): cargar_datos_limpios abre
+esas columnas sin copiarlas y solo lee del archivo de caché las demás.
+"""
+
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+import bloque_numerico
+
+# Rutas por defecto (independientes del directorio de trabajo)
+DIRECTORIO_SCRIPTS = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO_PROYECTO = os.path.dirname(DIRECTORIO_SCRIPTS)
+DIRECTORIO_CACHE = os.path.join(DIRECTORIO_PROYECTO, 'data', 'cache')
+RUTA_DATOS = os.path.join(DIRECTORIO_PROYECTO, 'data', 'laptop.xlsx')
+RUTA_DATOS_LIMPIOS = os.path.join(DIRECTORIO_PROYECTO, 'data', 'laptop_limpio.csv')
+
+# Scripts cuyo contenido forma parte de la clave de la caché
+ARCHIVOS_CODIGO_LIMPIEZA = ['data_cleaning.py', 'parser_especificaciones.py', 'perfil_categoricas.py',
+                            'deduplicacion.py', 'deteccion_outliers.py', 'imputacion.py']
+
+# Incrementar si cambia la forma en que se guarda la caché
+VERSION_FORMATO = 1
+
+# Incrementar si cambia la forma en que se leen los libros Excel
+VERSION_INGESTA = 1
+
+def _formato_disponible():
+    """
+    Devuelve la extensión de la caché según las librerías instaladas
+
+    Returns:
+        str: 'parquet' si pyarrow está disponible, 'pkl' en caso contrario
+    """
+    try:
+        import pyarrow  # noqa: F401
+        return 'parquet'
+    except ImportError:
+        return 'pkl'
+
+def huella_archivo(ruta_archivo):
+    """
+    Calcula el hash SHA-256 del contenido de un archivo
+
+    El resultado se memoriza por (ruta, tamaño, fecha de modificación) para
+    no volver a leer archivos grandes que no han cambiado.
+
+    Args:
+        ruta_archivo (str): Ruta al archivo
+
+    Returns:
+        str: Hash hexadecimal del contenido
+    """
+    ruta_archivo = os.path.abspath(ruta_archivo)
+    estado = os.stat(ruta_archivo)
+    clave_memo = f"{ruta_archivo}|{estado.st_size}|{estado.st_mtime_ns}"
+
+    ruta_memo = os.path.join(DIRECTORIO_CACHE, 'huellas.json')
+    try:
+        with open(ruta_memo, encoding='utf-8') as f:
+            memo = json.load(f)
+    except (FileNotFoundError, ValueError):
+        memo = {}
+
+    if clave_memo in memo:
+        return memo[clave_memo]
+
+    sha = hashlib.sha256()
+    with open(ruta_archivo, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            sha.update(bloque)
+    huella = sha.hexdigest()
+
+    # Conservar solo la última huella de cada archivo
+    memo = {k: v for k, v in memo.items() if not k.startswith(f"{ruta_archivo}|")}
+    memo[clave_memo] = huella
+    os.makedirs(DIRECTORIO_CACHE, exist_ok=True)
+    with open(ruta_memo, 'w', encoding='utf-8') as f:
+        json.dump(memo, f, indent=1)
+
+    return huella
+
+def version_codigo_limpieza():
+    """
+    Calcula la versión del código de limpieza a partir de su contenido
+
+    Returns:
+        str: Hash hexadecimal de los scripts de limpieza
+    """
+    sha = hashlib.sha256(str(VERSION_FORMATO).encode())
+    for nombre in ARCHIVOS_CODIGO_LIMPIEZA:
+        with open(os.path.join(DIRECTORIO_SCRIPTS, nombre), 'rb') as f:
+            sha.update(f.read())
+    return sha.hexdigest()
+
+def _prefijo_cache(ruta_datos):
+    """
+    Devuelve el prefijo de los archivos de caché de un archivo de datos
+
+    Incluye un hash corto de la ruta absoluta: al guardar una entrada se
+    borran las anteriores con el mismo prefijo, y dos archivos con el mismo
+    nombre en carpetas distintas no deben borrarse la caché entre sí.
+
+    Args:
+        ruta_datos (str): Ruta al archivo de datos original
+
+    Returns:
+        str: Prefijo, por ejemplo 'laptop_xlsx_5d41402a_'
+    """
+    ruta = hashlib.sha256(os.path.abspath(ruta_datos).encode()).hexdigest()[:8]
+    return f"{os.path.basename(ruta_datos).replace('.', '_')}_{ruta}_"
+
+def _prefijo_limpios(ruta_datos, vecinos=None):
+    """
+    Prefijo de la caché de datos limpios de un archivo con un modo de imputación
+
+    Args:
+        ruta_datos (str): Ruta al archivo de datos original
+        vecinos (int): Vecinos de la imputación (None para la imputación por defecto)
+
+    Returns:
+        str: Prefijo, por ejemplo 'laptop_xlsx_5d41402a_vecinos5_'
+    """
+    return f"{_prefijo_cache(ruta_datos)}{f'vecinos{vecinos}' if vecinos else 'global'}_"
+
+def ruta_cache(ruta_datos, vecinos=None):
+    """
+    Devuelve la ruta de la caché que corresponde al archivo y código actuales
+
+    Args:
+        ruta_datos (str): Ruta al archivo de datos original
+        vecinos (int): Vecinos de la imputación (None para la imputación por defecto)
+
+    Returns:
+        str: Ruta del archivo de caché (exista o no)
+    """
+    clave = hashlib.sha256(
+        (huella_archivo(ruta_datos) + version_codigo_limpieza()).encode()
+    ).hexdigest()[:16]
+    return os.path.join(DIRECTORIO_CACHE, f"{_prefijo_limpios(ruta_datos, vecinos)}{clave}.{_formato_disponible()}")
+
+def ruta_bloque(ruta_cache_datos):
+    """
+    Devuelve la ruta del bloque numérico de una entrada de la caché
+
+    Args:
+        ruta_cache_datos (str): Ruta del archivo de caché (ver ruta_cache)
+
+    Returns:
+        str: Ruta del bloque (exista o no), con el prefijo 'bloque_'
+    """
+    nombre = os.path.splitext(os.path.basename(ruta_cache_datos))[0]
+    return os.path.join(os.path.dirname(ruta_cache_datos), f"bloque_{nombre}.bin")
+
+def bloque_vigente(ruta_datos, vecinos=None):
+    """
+    Devuelve el bloque numérico de la entrada actual de la caché, si existe
+
+    Args:
+        ruta_datos (str): Ruta al archivo de datos original
+        vecinos (int): Vecinos de la imputación (None para la imputación por defecto)
+
+    Returns:
+        str: Ruta del bloque, o None si no hay datos o bloque completo de
+            la versión actual
+    """
+    if not os.path.exists(ruta_datos):
+        return None
+    ruta = ruta_bloque(ruta_cache(ruta_datos, vecinos))
+    try:
+        bloque_numerico.leer_esquema(ruta)
+    except (OSError, ValueError):
+        return None
+    return ruta
+
+def _leer_archivo_cache(ruta, columnas=None):
+    """
+    Lee un archivo de caché
+
+    Args:
+        ruta (str): Ruta del archivo de caché
+        columnas (list): Columnas a leer (por defecto todas). Con Parquet solo
+            se leen del disco esas columnas
+
+    Returns:
+        pandas.DataFrame: Contenido de la caché, o None si no existe o no se puede leer
+    """
+    if not os.path.exists(ruta):
+        return None
+
+    try:
+        if ruta.endswith('.parquet'):
+            return pd.read_parquet(ruta, columns=columnas)
+        df = pd.read_pickle(ruta)
+        return df if columnas is None else df[columnas]
+    except Exception as e:
+        print(f"No se pudo leer la caché {ruta}: {e}")
+        return None
+
+def _escribir_archivo_cache(df, ruta, prefijo):
+    """
+    Escribe un archivo de caché y elimina las versiones anteriores
+
+    Se escribe primero en un archivo temporal, así que un proceso que lea
+    la caché a la vez nunca ve un archivo a medio escribir.
+
+    Args:
+        df (pandas.DataFrame): Datos a guardar
+        ruta (str): Ruta del archivo de caché
+        prefijo (str): Prefijo común a todas las versiones de esta entrada
+
+    Returns:
+        str: Ruta del archivo de caché, o None si no se pudo guardar
+    """
+    os.makedirs(DIRECTORIO_CACHE, exist_ok=True)
+    temporal = ruta + '.tmp'
+
+    try:
+        if ruta.endswith('.parquet'):
+            df.to_parquet(temporal, index=False)
+        else:
+            df.to_pickle(temporal, compression=None)
+        os.replace(temporal, ruta)
+    except Exception as e:
+        print(f"No se pudo guardar la caché: {e}")
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        return None
+
+    # Eliminar versiones anteriores de la misma entrada
+    for nombre in os.listdir(DIRECTORIO_CACHE):
+        anterior = os.path.join(DIRECTORIO_CACHE, nombre)
+        if nombre.startswith(prefijo) and anterior != ruta:
+            os.remove(anterior)
+
+    return ruta
+
+def cargar_cache(ruta_datos, vecinos=None):
+    """
+    Carga los datos limpios desde la caché si está al día
+
+    Args:
+        ruta_datos (str): Ruta al archivo de datos original
+        vecinos (int): Vecinos de la imputación (None para la imputación por defecto)
+
+    Returns:
+        pandas.DataFrame: Datos limpios con sus tipos, o None si no hay caché válida
+    """
+    if not os.path.exists(ruta_datos):
+        return None
+    return _leer_archivo_cache(ruta_cache(ruta_datos, vecinos))
+
+def guardar_cache(df, ruta_datos, vecinos=None):
+    """
+    Guarda los datos limpios en la caché y elimina entradas obsoletas
+
+    Args:
+        df (pandas.DataFrame): Datos limpios
+        ruta_datos (str): Ruta al archivo de datos original
+        vecinos (int): Vecinos de la imputación (None para la imputación por defecto)
+
+    Returns:
+        str: Ruta del archivo de caché, o None si no se pudo guardar
+    """
+    ruta = _escribir_archivo_cache(df, ruta_cache(ruta_datos, vecinos), _prefijo_limpios(ruta_datos, vecinos))
+    if ruta is None:
+        return None
+
+    print(f"Caché de datos limpios guardada en: {ruta}")
+    guardar_bloque_cache(df, ruta_datos, ruta, vecinos)
+    return ruta
+
+def guardar_bloque_cache(df, ruta_datos, ruta_cache_datos=None, vecinos=None):
+    """
+    Guarda las columnas numéricas de los datos limpios como bloque proyectable
+
+    Elimina los bloques de versiones anteriores del mismo archivo de datos
+    y modo de imputación.
+
+    Args:
+        df (pandas.DataFrame): Datos limpios
+        ruta_datos (str): Ruta al archivo de datos original
+        ruta_cache_datos (str): Ruta de la caché, si ya se calculó
+        vecinos (int): Vecinos de la imputación (None para la imputación por defecto)
+
+    Returns:
+        str: Ruta del bloque, o None si no se pudo guardar
+    """
+    ruta = ruta_bloque(ruta_cache_datos or ruta_cache(ruta_datos, vecinos))
+    try:
+        bloque_numerico.guardar_bloque(df, ruta)
+    except Exception as e:
+        print(f"No se pudo guardar el bloque numérico: {e}")
+        return None
+
+    prefijo = f"bloque_{_prefijo_limpios(ruta_datos, vecinos)}"
+    actual = os.path.splitext(os.path.basename(ruta))[0]
+    for nombre in os.listdir(DIRECTORIO_CACHE):
+        if nombre.startswith(prefijo) and os.path.splitext(nombre)[0] != actual:
+            os.remove(os.path.join(DIRECTORIO_CACHE, nombre))
+
+    print(f"Bloque numérico guardado en: {ruta}")
+    return ruta
+
+def cargar_cache_con_bloque(ruta_datos, vecinos=None):
+    """
+    Carga los datos limpios abriendo las columnas numéricas desde el bloque
+
+    Las columnas del bloque son vistas sobre el archivo (sin copiarlas); del
+    archivo de caché solo se leen las demás columnas (con Parquet).
+
+    Args:
+        ruta_datos (str): Ruta al archivo de datos original
+        vecinos (int): Vecinos de la imputación (None para la imputación por defecto)
+
+    Returns:
+        pandas.DataFrame: Datos limpios, o None si no hay caché o bloque válidos
+    """
+    bloque = bloque_vigente(ruta_datos, vecinos)
+    ruta = ruta_cache(ruta_datos, vecinos) if bloque else None
+    if bloque is None or not os.path.exists(ruta):
+        return None
+
+    try:
+        esquema = bloque_numerico.leer_esquema(bloque)
+        numericas = {info['nombre'] for info in esquema['columnas']}
+        columnas_resto = [col for col in esquema['orden'] if col not in numericas]
+        resto = _leer_archivo_cache(ruta, columnas_resto)
+        if resto is None:
+            return None
+        if not columnas_resto:
+            resto = pd.DataFrame(index=pd.RangeIndex(esquema['filas']))
+        return bloque_numerico.combinar(bloque, resto)
+    except Exception as e:
+        print(f"No se pudo abrir el bloque numérico {bloque}: {e}")
+        return None
+
+def _prefijo_libro(ruta_libro, hoja=None, columnas=None):
+    """
+    Prefijo de la caché de un libro Excel convertido, por hoja y columnas
+
+    Args:
+        ruta_libro (str): Ruta al libro Excel
+        hoja (str o int): Hoja leída (None para la primera)
+        columnas (list): Columnas seleccionadas (None para todas)
+
+    Returns:
+        str: Prefijo, por ejemplo 'libro_laptop_xlsx_5d41402a_3f2a9c01_'
+    """
+    seleccion = hashlib.sha256(repr((hoja, columnas and list(columnas))).encode()).hexdigest()[:8]
+    return f"libro_{_prefijo_cache(ruta_libro)}{seleccion}_"
+
+def ruta_cache_libro(ruta_libro, hoja=None, columnas=None):
+    """
+    Devuelve la ruta de la conversión columnar de un libro Excel
+
+    La clave depende solo del contenido del libro, de la hoja y columnas
+    elegidas y de VERSION_INGESTA, no del código de limpieza, así que la
+    conversión sigue siendo válida aunque cambie la limpieza.
+
+    Args:
+        ruta_libro (str): Ruta al libro Excel
+        hoja (str o int): Hoja leída (None para la primera)
+        columnas (list): Columnas seleccionadas (None para todas)
+
+    Returns:
+        str: Ruta del archivo de caché (exista o no)
+    """
+    clave = hashlib.sha256(
+        (huella_archivo(ruta_libro) + str(VERSION_INGESTA)).encode()
+    ).hexdigest()[:16]
+    return os.path.join(DIRECTORIO_CACHE,
+                        f"{_prefijo_libro(ruta_libro, hoja, columnas)}{clave}.{_formato_disponible()}")
+
+def cargar_libro_cacheado(ruta_libro, hoja=None, columnas=None):
+    """
+    Carga la conversión columnar de un libro Excel si está al día
+
+    Args:
+        ruta_libro (str): Ruta al libro Excel
+        hoja (str o int): Hoja leída (None para la primera)
+        columnas (list): Columnas seleccionadas (None para todas)
+
+    Returns:
+        pandas.DataFrame: Datos del libro, o None si no hay conversión válida
+    """
+    if not os.path.exists(ruta_libro):
+        return None
+    return _leer_archivo_cache(ruta_cache_libro(ruta_libro, hoja, columnas))
+
+def guardar_libro_cacheado(df, ruta_libro, hoja=None, columnas=None):
+    """
+    Guarda la conversión columnar de un libro Excel
+
+    Args:
+        df (pandas.DataFrame): Datos leídos del libro
+        ruta_libro (str): Ruta al libro Excel
+        hoja (str o int): Hoja leída (None para la primera)
+        columnas (list): Columnas seleccionadas (None para todas)
+
+    Returns:
+        str: Ruta del archivo de caché, o None si no se pudo guardar
+    """
+    ruta = _escribir_archivo_cache(df, ruta_cache_libro(ruta_libro, hoja, columnas),
+                                   _prefijo_libro(ruta_libro, hoja, columnas))
+    if ruta is not None:
+        print(f"Libro convertido a formato columnar en: {ruta}")
+    return ruta
+
+def cargar_datos_limpios(ruta_datos=RUTA_DATOS, ruta_csv=RUTA_DATOS_LIMPIOS, vecinos=None):
+    """
+    Carga los datos limpios, preferentemente desde la caché tipada
+
+    Si la entrada de la caché tiene bloque numérico, las columnas numéricas
+    del resultado son vistas sobre él (ver
+    cargar_cache_con_bloque).
+
+    Args:
+        ruta_datos (str): Ruta al archivo de datos original
+        ruta_csv (str): CSV limpio usado cuando no hay caché válida
+        vecinos (int): Vecinos de la imputación (None para la imputación por defecto)
+
+    Returns:
+        pandas.DataFrame: Datos limpios
+
+    Raises:
+        FileNotFoundError: Si no hay caché válida ni CSV limpio
+    """
+    df = cargar_cache_con_bloque(ruta_datos, vecinos)
+    if df is None:
+        df = cargar_cache(ruta_datos, vecinos)
+    if df is not None:
+        return df
+    return pd.read_csv(ruta_csv)
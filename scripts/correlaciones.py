@@ -0,0 +1,165 @@
+"""
+Motor de Correlaciones - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script calcula las matrices de correlación que usan el análisis
+estadístico y las visualizaciones. Cada matriz se calcula una vez por
+ejecución y se guarda en memoria (indexada por el contenido de los datos),
+de modo que data_analysis y visualizations comparten el resultado cuando
+corren en el mismo proceso.
+
+Pearson se calcula por bloques de columnas con productos de matrices,
+usando para cada par solo las filas donde ambas columnas tienen valor
+(pairwise-complete), lo que permite procesar los cientos de columnas que
+deja transformar_datos sin recorrer pares en Python.
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from deteccion_outliers import columnas_variables
+
+METODOS = ('pearson', 'spearman', 'kendall')
+
+# Matrices ya calculadas: (huella de los datos, columnas, método) -> matriz
+_cache_correlaciones = {}
+MAX_MATRICES_EN_CACHE = 16
+
+def _pearson_por_bloques(X, tamano_bloque=256):
+    """
+    Correlación de Pearson pairwise-complete calculada por bloques
+
+    Args:
+        X (numpy.ndarray): Matriz filas x columnas con NaN en los faltantes
+        tamano_bloque (int): Número de columnas por bloque
+
+    Returns:
+        numpy.ndarray: Matriz de correlaciones columnas x columnas
+    """
+    validos = ~np.isnan(X)
+    M = validos.astype(float)
+
+    # Centrar cada columna reduce la cancelación numérica en las sumas
+    with np.errstate(invalid='ignore', divide='ignore'):
+        medias = np.where(validos, X, 0).sum(axis=0) / M.sum(axis=0)
+    Z = np.where(validos, X - np.nan_to_num(medias), 0.0)
+    Z2 = Z * Z
+
+    columnas = X.shape[1]
+    resultado = np.empty((columnas, columnas))
+    for i in range(0, columnas, tamano_bloque):
+        a = slice(i, min(i + tamano_bloque, columnas))
+        for j in range(i, columnas, tamano_bloque):
+            b = slice(j, min(j + tamano_bloque, columnas))
+
+            # Sumas restringidas a las filas válidas en ambas columnas
+            n = M[:, a].T @ M[:, b]
+            sx = Z[:, a].T @ M[:, b]
+            sy = M[:, a].T @ Z[:, b]
+            sxy = Z[:, a].T @ Z[:, b]
+            sxx = Z2[:, a].T @ M[:, b]
+            syy = M[:, a].T @ Z2[:, b]
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                cov = n * sxy - sx * sy
+                var_x = n * sxx - sx * sx
+                var_y = n * syy - sy * sy
+                bloque = cov / np.sqrt(var_x * var_y)
+            bloque[(n < 2) | (var_x <= 0) | (var_y <= 0)] = np.nan
+
+            resultado[a, b] = np.clip(bloque, -1, 1)
+            resultado[b, a] = resultado[a, b].T
+
+    diagonal = np.diag(resultado).copy()
+    np.fill_diagonal(resultado, np.where(np.isnan(diagonal), np.nan, 1.0))
+    return resultado
+
+def _huella_datos(X, columnas, metodo):
+    """
+    Clave de caché a partir del contenido del bloque numérico
+    """
+    sha = hashlib.sha1(np.ascontiguousarray(X).tobytes())
+    sha.update(repr((tuple(columnas), X.shape, metodo)).encode())
+    return sha.hexdigest()
+
+def calcular_matriz_correlacion(df, columnas_numericas=None, metodo='pearson', tamano_bloque=256):
+    """
+    Calcula (o recupera de la caché) la matriz de correlaciones
+
+    Args:
+        df (pandas.DataFrame): DataFrame a analizar
+        columnas_numericas (list): Lista de columnas numéricas a analizar
+        metodo (str): 'pearson', 'spearman' o 'kendall'
+        tamano_bloque (int): Columnas por bloque para Pearson/Spearman
+
+    Returns:
+        pandas.DataFrame: Matriz de correlaciones
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método de correlación no soportado: {metodo}. Use {', '.join(METODOS)}")
+
+    if columnas_numericas is None:
+        columnas_numericas = columnas_variables(df)
+    columnas_numericas = list(columnas_numericas)
+
+    X = df[columnas_numericas].to_numpy(dtype=float)
+    clave = _huella_datos(X, columnas_numericas, metodo)
+    if clave in _cache_correlaciones:
+        return _cache_correlaciones[clave].copy()
+
+    hay_faltantes = np.isnan(X).any()
+    if metodo == 'pearson':
+        valores = _pearson_por_bloques(X, tamano_bloque)
+    elif metodo == 'spearman' and not hay_faltantes:
+        # Sin faltantes, Spearman es Pearson sobre los rangos (con empates promediados)
+        rangos = pd.DataFrame(X).rank(method='average').to_numpy()
+        valores = _pearson_por_bloques(rangos, tamano_bloque)
+    else:
+        # Kendall, y Spearman con faltantes (hay que volver a rankear cada par),
+        # usan las rutinas pairwise-complete de pandas
+        valores = pd.DataFrame(X, columns=columnas_numericas).corr(method=metodo).to_numpy()
+
+    matriz = pd.DataFrame(valores, index=columnas_numericas, columns=columnas_numericas)
+
+    if len(_cache_correlaciones) >= MAX_MATRICES_EN_CACHE:
+        _cache_correlaciones.pop(next(iter(_cache_correlaciones)))
+    _cache_correlaciones[clave] = matriz
+    return matriz.copy()
+
+def pares_correlacionados(matriz_corr, umbral=0.5):
+    """
+    Extrae los pares con |correlación| mayor que el umbral
+
+    Solo se usa el triángulo superior de la matriz, con operaciones sobre
+    arreglos en lugar de recorrer los pares en Python.
+
+    Args:
+        matriz_corr (pandas.DataFrame): Matriz de correlaciones
+        umbral (float): Valor absoluto mínimo (exclusivo)
+
+    Returns:
+        list: Diccionarios con variable1, variable2 y correlacion, ordenados
+            por valor absoluto descendente
+    """
+    valores = matriz_corr.to_numpy()
+    filas, columnas = np.triu_indices(len(valores), k=1)
+    seleccion = valores[filas, columnas]
+    fuertes = np.abs(seleccion) > umbral
+    filas, columnas, seleccion = filas[fuertes], columnas[fuertes], seleccion[fuertes]
+
+    orden = np.argsort(-np.abs(seleccion), kind='stable')
+    nombres = matriz_corr.columns
+    return [
+        {'variable1': nombres[filas[k]], 'variable2': nombres[columnas[k]],
+         'correlacion': float(seleccion[k])}
+        for k in orden
+    ]
+
+def limpiar_cache():
+    """
+    Elimina las matrices guardadas en memoria
+    """
+    _cache_correlaciones.clear()
@@ -0,0 +1,368 @@
+"""
+Cubo de Precios por Segmento - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script precalcula las estadísticas de precio (conteo, media, mínimo,
+cuartiles y máximo) para todas las combinaciones de las dimensiones de
+segmentación: marca, RAM, almacenamiento, familia de CPU, sistema operativo
+y categoría de precio. Con 6 dimensiones son 64 agregaciones, desde el
+total general hasta el segmento más detallado.
+
+Una vez construido, cualquier corte se responde desde el cubo sin volver a
+agrupar las filas: agrupar por menos dimensiones es un roll-up y agrupar por
+más es un drill-down, y filtrar por un valor selecciona las filas de la
+agregación que incluye esa dimensión. Las medianas y cuartiles son exactos
+porque cada agregación se calcula sobre los precios, no a partir de otras.
+
+Los precios se ordenan una sola vez; para cada combinación de dimensiones
+basta una ordenación estable por segmento para que los precios de cada
+segmento queden contiguos y ordenados, y los cuartiles se leen por posición.
+
+Uso:
+    python cubo_precios.py --agrupar marca --agrupar ram_gb --filtro sistema_operativo="Windows 11 OS"
+"""
+
+import argparse
+import os
+import re
+import sys
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+import cache_datos
+from parser_especificaciones import parsear_columna, parsear_marca
+
+DIRECTORIO_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_CUBO = os.path.join(DIRECTORIO_PROYECTO, 'reports', 'cubo_precios.pkl')
+
+DIMENSIONES = ['marca', 'ram_gb', 'almacenamiento_gb', 'familia_cpu', 'sistema_operativo', 'precio_categoria']
+ESTADISTICAS = ['conteo', 'media', 'min', 'q1', 'mediana', 'q3', 'max']
+
+# Familias de procesador reconocidas en la columna generation, en orden de prioridad
+PATRONES_FAMILIA_CPU = [
+    (r'Core Ultra \d', None),
+    (r'Core i\d', None),
+    (r'Ryzen \d', None),
+    (r'Apple M\d|\bM\d (?:Pro|Max|Ultra)\b|\bM\d\b', 'Apple M'),
+    (r'Celeron', None),
+    (r'Pentium', None),
+    (r'Athlon', None),
+    (r'MediaTek|Mediatek|Kompanio', 'MediaTek'),
+    (r'Qualcomm|Snapdragon', 'Qualcomm'),
+]
+
+def _por_valor_unico(serie, funcion):
+    """
+    Aplica una transformación de texto una vez por valor distinto en lugar
+    de una vez por fila
+    """
+    codigos, valores = pd.factorize(serie)
+    transformados = funcion(pd.Series(valores, dtype=object)).to_numpy(dtype=object)
+    resultado = np.where(codigos >= 0, transformados[codigos], np.nan) if len(valores) else \
+        np.full(len(serie), np.nan, dtype=object)
+    return pd.Series(resultado, index=serie.index, name=serie.name).astype('category')
+
+def marca_desde_modelo(modelos):
+    """
+    Marca de cada laptop: la primera palabra del modelo, sin caracteres de
+    formato (ver parser_especificaciones.parsear_marca)
+
+    Args:
+        modelos (pandas.Series): Columna model
+
+    Returns:
+        pandas.Series: Marca (categórica)
+    """
+    return parsear_columna(modelos, parsear_marca)['marca'].astype('category')
+
+def familia_cpu(generaciones):
+    """
+    Familia de procesador (Core i5, Ryzen 7, Apple M...) a partir de la
+    descripción del procesador
+
+    Args:
+        generaciones (pandas.Series): Columna generation
+
+    Returns:
+        pandas.Series: Familia, u 'Otra' si no se reconoce
+    """
+    def extraer(valores):
+        texto = valores.astype(str)
+        familia = pd.Series(np.nan, index=valores.index, dtype=object)
+        for patron, nombre in PATRONES_FAMILIA_CPU:
+            pendientes = familia.isna()
+            encontrado = texto[pendientes].str.extract(f'({patron})', flags=re.IGNORECASE, expand=False)
+            if nombre is not None:
+                encontrado = encontrado.where(encontrado.isna(), nombre)
+            familia[pendientes] = encontrado
+        return familia.fillna('Otra')
+
+    return _por_valor_unico(generaciones, extraer)
+
+def sistema_operativo(valores):
+    """
+    Sistema operativo con los espacios normalizados; los valores que no son
+    un sistema operativo (columnas desplazadas en el origen) quedan como NaN
+
+    Args:
+        valores (pandas.Series): Columna os
+
+    Returns:
+        pandas.Series: Sistema operativo (categórica)
+    """
+    def normalizar(unicos):
+        normalizado = unicos.astype(str).str.split().str.join(' ')
+        return normalizado.where(normalizado.str.endswith(' OS'))
+
+    return _por_valor_unico(valores, normalizar)
+
+def dimensiones_segmentacion(df):
+    """
+    Columnas de segmentación del cubo, derivadas de los datos limpios
+
+    Args:
+        df (pandas.DataFrame): Datos limpios
+
+    Returns:
+        pandas.DataFrame: Una columna por dimensión disponible en df
+    """
+    derivadas = {
+        'marca': lambda: marca_desde_modelo(df['model']) if 'model' in df.columns else None,
+        'familia_cpu': lambda: familia_cpu(df['generation']) if 'generation' in df.columns else None,
+        'sistema_operativo': lambda: sistema_operativo(df['os']) if 'os' in df.columns else None,
+    }
+    columnas = {}
+    for dimension in DIMENSIONES:
+        if dimension in df.columns:
+            columnas[dimension] = df[dimension]
+        elif dimension in derivadas:
+            serie = derivadas[dimension]()
+            if serie is not None:
+                columnas[dimension] = serie
+    return pd.DataFrame(columnas, index=df.index)
+
+def _estadisticas_por_segmento(precios, claves):
+    """
+    Estadísticas de precio por segmento
+
+    Args:
+        precios (numpy.ndarray): Precios ordenados de menor a mayor
+        claves (numpy.ndarray): Segmento de cada precio (entero)
+
+    Returns:
+        tuple: (claves de los segmentos, dict estadística -> array)
+    """
+    orden = np.argsort(claves, kind='stable')
+    ordenados = precios[orden]
+    claves = claves[orden]
+    # Inicio y tamaño de cada segmento en las claves ya ordenadas
+    inicios = np.flatnonzero(np.r_[len(claves) > 0, claves[1:] != claves[:-1]])
+    conteos = np.diff(np.r_[inicios, len(claves)])
+    segmentos = claves[inicios]
+
+    def cuantil(q):
+        # Interpolación lineal, igual que Series.quantile
+        posicion = inicios + (conteos - 1) * q
+        inferior = np.floor(posicion).astype(np.int64)
+        superior = np.ceil(posicion).astype(np.int64)
+        fraccion = posicion - inferior
+        return ordenados[inferior] * (1 - fraccion) + ordenados[superior] * fraccion
+
+    return segmentos, {
+        'conteo': conteos,
+        'media': np.add.reduceat(ordenados, inicios) / conteos,
+        'min': ordenados[inicios],
+        'q1': cuantil(0.25),
+        'mediana': cuantil(0.5),
+        'q3': cuantil(0.75),
+        'max': ordenados[inicios + conteos - 1],
+    }
+
+def construir_cubo(df, columna='precio', dimensiones=None):
+    """
+    Precalcula las estadísticas de precio de todas las combinaciones de dimensiones
+
+    Args:
+        df (pandas.DataFrame): Datos limpios
+        columna (str): Variable numérica a resumir
+        dimensiones (pandas.DataFrame): Columnas de segmentación (por
+            defecto, dimensiones_segmentacion(df))
+
+    Returns:
+        dict: Tupla de dimensiones -> DataFrame con una fila por segmento
+            (índice: las dimensiones) y una columna por estadística. La
+            tupla vacía es el total general. Los faltantes de una dimensión
+            forman su propio segmento.
+    """
+    if dimensiones is None:
+        dimensiones = dimensiones_segmentacion(df)
+    nombres = list(dimensiones.columns)
+
+    precios = df[columna].to_numpy(dtype=float)
+    validos = ~np.isnan(precios)
+    orden = np.argsort(precios[validos], kind='stable')
+    precios = precios[validos][orden]
+
+    # Cada dimensión se factoriza una vez (los NaN reciben su propio código)
+    codigos, categorias = {}, {}
+    for nombre in nombres:
+        codigos_dim, categorias[nombre] = pd.factorize(dimensiones[nombre], sort=True, use_na_sentinel=False)
+        codigos[nombre] = codigos_dim[validos][orden].astype(np.int64)
+
+    cubo = {}
+    for nivel in range(len(nombres) + 1):
+        for combinacion in combinations(nombres, nivel):
+            tamanos = [len(categorias[nombre]) for nombre in combinacion]
+            if combinacion:
+                claves = np.ravel_multi_index([codigos[nombre] for nombre in combinacion], tamanos)
+            else:
+                claves = np.zeros(len(precios), dtype=np.int64)
+            segmentos, estadisticas = _estadisticas_por_segmento(precios, claves)
+
+            if combinacion:
+                posiciones = np.unravel_index(segmentos, tamanos)
+                valores = [categorias[nombre].take(pos) for nombre, pos in zip(combinacion, posiciones)]
+                if len(combinacion) == 1:
+                    indice = pd.Index(valores[0], name=combinacion[0])
+                else:
+                    indice = pd.MultiIndex.from_arrays(valores, names=list(combinacion))
+            else:
+                indice = pd.Index(['Total'] * len(segmentos))
+            cubo[combinacion] = pd.DataFrame(estadisticas, index=indice)[ESTADISTICAS]
+    return cubo
+
+def consultar_cubo(cubo, agrupar_por=None, filtros=None, ordenar_por=None, limite=None):
+    """
+    Responde un corte del cubo sin volver a agrupar las filas
+
+    Agrupar por menos dimensiones que en la consulta anterior es un roll-up;
+    agrupar por más, un drill-down.
+
+    Args:
+        cubo (dict): Resultado de construir_cubo
+        agrupar_por (str o list): Dimensiones del resultado
+        filtros (dict): Dimensión -> valor. Con una lista de valores, la
+            dimensión se conserva en el resultado (las medianas de varios
+            segmentos no se pueden combinar)
+        ordenar_por (str): Estadística; con '-' delante, descendente
+        limite (int): Número máximo de filas
+
+    Returns:
+        pandas.DataFrame: Una fila por segmento con las estadísticas de precio
+
+    Raises:
+        ValueError: Si una dimensión no está en el cubo
+    """
+    if isinstance(agrupar_por, str):
+        agrupar_por = [agrupar_por]
+    agrupar_por = list(agrupar_por or [])
+    filtros = dict(filtros or {})
+    for dimension, valor in filtros.items():
+        if isinstance(valor, (list, tuple, set)) and dimension not in agrupar_por:
+            agrupar_por.append(dimension)
+
+    disponibles = max(cubo, key=len)
+    desconocidas = [d for d in [*agrupar_por, *filtros] if d not in disponibles]
+    if desconocidas:
+        raise ValueError(f"Dimensiones desconocidas: {', '.join(desconocidas)} "
+                         f"(disponibles: {', '.join(disponibles)})")
+
+    combinacion = tuple(d for d in disponibles if d in agrupar_por or d in filtros)
+    resultado = cubo[combinacion]
+    if filtros:
+        mascara = np.ones(len(resultado), dtype=bool)
+        for dimension, valor in filtros.items():
+            niveles = resultado.index.get_level_values(dimension)
+            if isinstance(valor, (list, tuple, set)):
+                mascara &= niveles.isin(list(valor))
+            else:
+                mascara &= niveles == valor
+        resultado = resultado[mascara]
+        # Las dimensiones filtradas por un único valor no se muestran
+        fijas = [d for d in combinacion if d not in agrupar_por]
+        if len(fijas) == len(combinacion):
+            resultado = resultado.set_axis(pd.Index(['Total'] * len(resultado)))
+        elif fijas:
+            resultado = resultado.droplevel(fijas)
+
+    if agrupar_por and list(resultado.index.names) != agrupar_por:
+        resultado = resultado.reorder_levels(agrupar_por)
+    if ordenar_por:
+        resultado = resultado.sort_values(ordenar_por.lstrip('-'), ascending=not ordenar_por.startswith('-'),
+                                          kind='stable')
+    if limite is not None:
+        resultado = resultado.head(limite)
+    return resultado
+
+def guardar_cubo(cubo, ruta=RUTA_CUBO):
+    """
+    Guarda el cubo para el notebook y otros procesos
+
+    Args:
+        cubo (dict): Resultado de construir_cubo
+        ruta (str): Archivo de destino (pickle)
+
+    Returns:
+        str: Ruta del archivo
+    """
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    temporal = ruta + '.tmp'
+    pd.to_pickle(cubo, temporal)
+    os.replace(temporal, ruta)
+    return ruta
+
+def cargar_cubo(ruta=RUTA_CUBO):
+    """
+    Carga un cubo guardado con guardar_cubo
+
+    Args:
+        ruta (str): Archivo del cubo
+
+    Returns:
+        dict: Cubo de precios
+
+    Raises:
+        FileNotFoundError: Si el cubo no se ha construido
+    """
+    return pd.read_pickle(ruta)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estadísticas de precio por segmento desde el cubo precalculado")
+    parser.add_argument("--agrupar", action="append", metavar="DIMENSION",
+                        help=f"Dimensión del resultado (repetible; {', '.join(DIMENSIONES)})")
+    parser.add_argument("--filtro", action="append", metavar="DIMENSION=VALOR",
+                        help='Segmento a seleccionar, p. ej. marca=HP o ram_gb=16 (repetible)')
+    parser.add_argument("--ordenar", metavar="ESTADISTICA", help="Estadística; con '-' delante, descendente")
+    parser.add_argument("--limite", type=int, help="Número máximo de filas")
+    parser.add_argument("--reconstruir", action="store_true",
+                        help="Construye el cubo desde los datos limpios aunque ya esté guardado")
+    argumentos = parser.parse_args()
+
+    if argumentos.reconstruir or not os.path.exists(RUTA_CUBO):
+        try:
+            cubo = construir_cubo(cache_datos.cargar_datos_limpios())
+        except FileNotFoundError:
+            print("Error: No se encontraron datos limpios. Ejecuta primero data_cleaning.py")
+            sys.exit(1)
+        guardar_cubo(cubo)
+    else:
+        cubo = cargar_cubo()
+
+    filtros = {}
+    for texto in argumentos.filtro or []:
+        dimension, _, valor = texto.partition('=')
+        # Las dimensiones numéricas (ram_gb, almacenamiento_gb) se comparan como números
+        try:
+            filtros[dimension] = float(valor)
+        except ValueError:
+            filtros[dimension] = valor
+
+    try:
+        resultado = consultar_cubo(cubo, argumentos.agrupar, filtros, argumentos.ordenar, argumentos.limite)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(resultado.to_string(float_format=lambda x: f"{x:,.0f}"))
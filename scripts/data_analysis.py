@@ -7,18 +7,146 @@ Este script contiene funciones para realizar análisis estadístico
 y exploratorio del conjunto de datos de laptops.
 """
 
+import json
+import math
+import os
+from datetime import datetime
+
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
 import warnings
 warnings.filterwarnings('ignore')
 
-# Configurar estilo de gráficos
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+import cache_datos
+import cubo_precios
+from correlaciones import calcular_matriz_correlacion, pares_correlacionados
+from deteccion_outliers import columnas_variables, limites_guardados, resumen_outliers
+from instrumentacion import instrumentar
+from perfil_categoricas import TOP_K, perfilar_categoricas
+
+DIRECTORIO_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_ARTEFACTO = os.path.join(DIRECTORIO_PROYECTO, 'reports', 'analisis_estadistico.json')
+
+# Umbral de |correlación| para los pares destacados
+UMBRAL_CORRELACION = 0.5
+
+@instrumentar
+def calcular_estadisticas_numericas(df, columnas_numericas=None):
+    """
+    Calcula todas las estadísticas numéricas en una sola pasada
+    
+    Las columnas se convierten una vez en un bloque 2-D de NumPy; los momentos
+    salen de sumas sobre ese bloque y el mínimo, máximo, cuartiles y moda de
+    una única ordenación por columnas, en lugar de recorrer cada columna
+    por separado para cada métrica.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame a analizar
+        columnas_numericas (list): Lista de columnas numéricas a analizar
+        
+    Returns:
+        pandas.DataFrame: Una fila por columna con conteo, media, desv_std,
+            varianza, min, q1, mediana, q3, max, asimetria, curtosis, moda,
+            iqr, limite_inferior, limite_superior y outliers
+    """
+    if columnas_numericas is None:
+        columnas_numericas = columnas_variables(df)
+    columnas_numericas = list(columnas_numericas)
+    
+    X = df[columnas_numericas].to_numpy(dtype=float)
+    filas = X.shape[0]
+    validos = ~np.isnan(X)
+    n = validos.sum(axis=0)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Momentos centrales (las posiciones NaN no aportan a las sumas)
+        media = np.where(validos, X, 0).sum(axis=0) / n
+        desvios = np.where(validos, X - media, 0)
+        cuadrados = desvios ** 2
+        m2 = cuadrados.sum(axis=0)
+        m3 = (cuadrados * desvios).sum(axis=0)
+        m4 = (cuadrados ** 2).sum(axis=0)
+        varianza = np.where(n > 1, m2 / (n - 1), np.nan)
+        
+        # Asimetría y curtosis con la misma corrección de sesgo que pandas
+        g1 = (m3 / n) / (m2 / n) ** 1.5
+        g2 = (m4 / n) / (m2 / n) ** 2 - 3
+        asimetria = np.sqrt(n * (n - 1)) / (n - 2) * g1
+        curtosis = ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+        asimetria = np.where((n > 2) & (m2 > 0), asimetria, np.where(n > 2, 0.0, np.nan))
+        curtosis = np.where((n > 3) & (m2 > 0), curtosis, np.where(n > 3, 0.0, np.nan))
+    
+    # Una sola ordenación (los NaN quedan al final de cada columna)
+    ordenado = np.sort(X, axis=0)
+    indices_columnas = np.arange(X.shape[1])
+    
+    def cuantil(q):
+        posicion = (n - 1) * q
+        inferior = np.floor(posicion).astype(int).clip(0, max(filas - 1, 0))
+        superior = np.ceil(posicion).astype(int).clip(0, max(filas - 1, 0))
+        fraccion = posicion - np.floor(posicion)
+        valor = (ordenado[inferior, indices_columnas] * (1 - fraccion)
+                 + ordenado[superior, indices_columnas] * fraccion)
+        return np.where(n > 0, valor, np.nan)
+    
+    q1, mediana, q3 = cuantil(0.25), cuantil(0.5), cuantil(0.75)
+    minimo = cuantil(0.0)
+    maximo = cuantil(1.0)
+    
+    # Moda: la racha más larga de valores iguales en cada columna ordenada
+    # (en caso de empate gana el valor más pequeño, igual que Series.mode)
+    if filas > 0:
+        posiciones = np.arange(filas)[:, None]
+        inicio_racha = np.ones_like(ordenado, dtype=bool)
+        inicio_racha[1:] = ordenado[1:] != ordenado[:-1]
+        inicio = np.maximum.accumulate(np.where(inicio_racha, posiciones, 0), axis=0)
+        longitud = np.where(posiciones < n, posiciones - inicio + 1, 0)
+        moda = np.where(n > 0, ordenado[longitud.argmax(axis=0), indices_columnas], np.nan)
+    else:
+        moda = np.full(X.shape[1], np.nan)
+    
+    # Límites IQR: los guardados por la detección de outliers y, en las
+    # columnas que no los traen, los de los cuartiles anteriores
+    iqr = q3 - q1
+    inferior, superior, guardado = limites_guardados(df, columnas_numericas)
+    limite_inferior = np.where(guardado, inferior, q1 - 1.5 * iqr)
+    limite_superior = np.where(guardado, superior, q3 + 1.5 * iqr)
+    outliers = ((X < limite_inferior) | (X > limite_superior)).sum(axis=0)
+    
+    return pd.DataFrame({
+        'conteo': n,
+        'media': media,
+        'desv_std': np.sqrt(varianza),
+        'varianza': varianza,
+        'min': minimo,
+        'q1': q1,
+        'mediana': mediana,
+        'q3': q3,
+        'max': maximo,
+        'asimetria': asimetria,
+        'curtosis': curtosis,
+        'moda': moda,
+        'iqr': iqr,
+        'limite_inferior': limite_inferior,
+        'limite_superior': limite_superior,
+        'outliers': outliers,
+    }, index=columnas_numericas)
+
+def tabla_descriptiva(estadisticas):
+    """
+    Presenta las estadísticas en el mismo formato que DataFrame.describe()
+    
+    Args:
+        estadisticas (pandas.DataFrame): Resultado de calcular_estadisticas_numericas
+        
+    Returns:
+        pandas.DataFrame: Tabla con filas count, mean, std, min, 25%, 50%, 75%, max
+    """
+    columnas = {'conteo': 'count', 'media': 'mean', 'desv_std': 'std', 'min': 'min',
+                'q1': '25%', 'mediana': '50%', 'q3': '75%', 'max': 'max'}
+    return estadisticas[list(columnas)].rename(columns=columnas).astype(float).T
 
+@instrumentar
 def resumen_estadistico(df):
     """
     Genera un resumen estadístico completo del dataset
@@ -40,60 +168,71 @@ def resumen_estadistico(df):
     resumen['columnas'] = list(df.columns)
     resumen['tipos_datos'] = df.dtypes.to_dict()
     
-    # Estadísticas descriptivas
-    resumen['estadisticas_descriptivas'] = df.describe()
-    
     # Información de valores faltantes
     resumen['valores_faltantes'] = df.isnull().sum().to_dict()
     resumen['porcentaje_faltantes'] = (df.isnull().sum() / len(df) * 100).to_dict()
     
     # Información de columnas numéricas
-    columnas_numericas = df.select_dtypes(include=[np.number]).columns
+    columnas_numericas = columnas_variables(df)
     resumen['columnas_numericas'] = list(columnas_numericas)
     
     # Información de columnas categóricas
-    columnas_categoricas = df.select_dtypes(include=['object']).columns
+    columnas_categoricas = df.select_dtypes(include=['object', 'category']).columns
     resumen['columnas_categoricas'] = list(columnas_categoricas)
     
-    # Estadísticas por tipo de columna
+    # Estadísticas por tipo de columna (una sola pasada sobre el bloque numérico)
     if len(columnas_numericas) > 0:
-        print("\nESTADÍSTICAS DE COLUMNAS NUMÉRICAS:")
-        print(df[columnas_numericas].describe())
+        estadisticas = calcular_estadisticas_numericas(df, columnas_numericas)
+        resumen['estadisticas_numericas'] = estadisticas
+        resumen['estadisticas_descriptivas'] = tabla_descriptiva(estadisticas)
         
-        # Detectar outliers usando IQR
-        outliers_info = {}
-        for col in columnas_numericas:
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            outliers = df[(df[col] < Q1 - 1.5*IQR) | (df[col] > Q3 + 1.5*IQR)]
-            outliers_info[col] = len(outliers)
+        print("\nESTADÍSTICAS DE COLUMNAS NUMÉRICAS:")
+        print(resumen['estadisticas_descriptivas'])
         
+        # Outliers detectados con el método IQR
+        outliers_info = estadisticas['outliers'].astype(int).to_dict()
         resumen['outliers'] = outliers_info
         print(f"\nOUTLIERS DETECTADOS (método IQR):")
         for col, count in outliers_info.items():
             print(f"{col}: {count} outliers")
     
+    # Filas marcadas por la etapa de detección de outliers (si se ejecutó)
+    outliers_filas = resumen_outliers(df)
+    if outliers_filas:
+        resumen['outliers_filas'] = outliers_filas
+        print(f"\nFILAS MARCADAS COMO OUTLIERS (por método):")
+        for metodo, filas in outliers_filas.items():
+            print(f"{metodo}: {filas} filas")
+    
     if len(columnas_categoricas) > 0:
+        # Un solo conteo por columna, reutilizado por analizar_categoricas
+        perfiles = perfilar_categoricas(df, columnas_categoricas)
+        resumen['perfiles_categoricas'] = perfiles
+        
         print("\nINFORMACIÓN DE COLUMNAS CATEGÓRICAS:")
-        for col in columnas_categoricas:
+        for col, perfil in perfiles.items():
             print(f"\n{col}:")
-            print(f"  Valores únicos: {df[col].nunique()}")
+            print(f"  Valores únicos: {perfil['n_categorias']}")
             print(f"  Top 5 valores más frecuentes:")
-            print(df[col].value_counts().head())
+            print(perfil['conteos'].head())
     
     return resumen
 
-def analizar_distribuciones(df, columnas_numericas=None):
+@instrumentar
+def analizar_distribuciones(df, columnas_numericas=None, estadisticas=None):
     """
     Analiza las distribuciones de las variables numéricas
     
     Args:
         df (pandas.DataFrame): DataFrame a analizar
         columnas_numericas (list): Lista de columnas numéricas a analizar
+        estadisticas (pandas.DataFrame): Resultado previo de
+            calcular_estadisticas_numericas, para no volver a recorrer los datos
     """
     if columnas_numericas is None:
-        columnas_numericas = df.select_dtypes(include=[np.number]).columns
+        columnas_numericas = columnas_variables(df)
+    if estadisticas is None or not set(columnas_numericas) <= set(estadisticas.index):
+        estadisticas = calcular_estadisticas_numericas(df, columnas_numericas)
     
     print("=" * 60)
     print("ANÁLISIS DE DISTRIBUCIONES")
@@ -104,13 +243,14 @@ def analizar_distribuciones(df, columnas_numericas=None):
         print("-" * 40)
         
         # Estadísticas básicas
-        media = df[col].mean()
-        mediana = df[col].median()
-        moda = df[col].mode()[0] if len(df[col].mode()) > 0 else "No hay moda única"
-        desv_std = df[col].std()
-        varianza = df[col].var()
-        skewness = df[col].skew()
-        kurtosis = df[col].kurtosis()
+        fila = estadisticas.loc[col]
+        media = fila['media']
+        mediana = fila['mediana']
+        moda = fila['moda'] if fila['conteo'] > 0 else "No hay moda única"
+        desv_std = fila['desv_std']
+        varianza = fila['varianza']
+        skewness = fila['asimetria']
+        kurtosis = fila['curtosis']
         
         print(f"Media: {media:.2f}")
         print(f"Mediana: {mediana:.2f}")
@@ -136,84 +276,84 @@ def analizar_distribuciones(df, columnas_numericas=None):
         else:
             print("Distribución platicúrtica (picos más planos)")
 
-def analizar_correlaciones(df, columnas_numericas=None):
+@instrumentar
+def analizar_correlaciones(df, columnas_numericas=None, metodo='pearson', umbral=0.5):
     """
     Analiza las correlaciones entre variables numéricas
     
     Args:
         df (pandas.DataFrame): DataFrame a analizar
         columnas_numericas (list): Lista de columnas numéricas a analizar
+        metodo (str): 'pearson', 'spearman' o 'kendall'
+        umbral (float): Valor absoluto a partir del cual una correlación se
+            considera moderada o fuerte
         
     Returns:
         pandas.DataFrame: Matriz de correlaciones
     """
-    if columnas_numericas is None:
-        columnas_numericas = df.select_dtypes(include=[np.number]).columns
-    
     print("=" * 60)
     print("ANÁLISIS DE CORRELACIONES")
     print("=" * 60)
     
-    # Calcular matriz de correlaciones
-    matriz_corr = df[columnas_numericas].corr()
+    # Calcular matriz de correlaciones (compartida con las visualizaciones)
+    matriz_corr = calcular_matriz_correlacion(df, columnas_numericas, metodo)
     
     print("\nMatriz de correlaciones:")
     print(matriz_corr.round(3))
     
-    # Encontrar correlaciones más fuertes
+    # Encontrar correlaciones más fuertes (ordenadas por valor absoluto)
     print("\nCORRELACIONES MÁS FUERTES:")
-    correlaciones_fuertes = []
-    
-    for i in range(len(matriz_corr.columns)):
-        for j in range(i+1, len(matriz_corr.columns)):
-            corr_valor = matriz_corr.iloc[i, j]
-            if abs(corr_valor) > 0.5:  # Correlación moderada o fuerte
-                correlaciones_fuertes.append({
-                    'variable1': matriz_corr.columns[i],
-                    'variable2': matriz_corr.columns[j],
-                    'correlacion': corr_valor
-                })
-    
-    # Ordenar por valor absoluto de correlación
-    correlaciones_fuertes.sort(key=lambda x: abs(x['correlacion']), reverse=True)
+    correlaciones_fuertes = pares_correlacionados(matriz_corr, umbral)
     
     for corr in correlaciones_fuertes:
         print(f"{corr['variable1']} - {corr['variable2']}: {corr['correlacion']:.3f}")
     
     return matriz_corr
 
-def analizar_categoricas(df, columnas_categoricas=None):
+@instrumentar
+def analizar_categoricas(df, columnas_categoricas=None, perfiles=None, top_k=TOP_K):
     """
     Analiza las variables categóricas
     
     Args:
         df (pandas.DataFrame): DataFrame a analizar
         columnas_categoricas (list): Lista de columnas categóricas a analizar
+        perfiles (dict): Perfiles ya calculados por perfilar_categoricas
+            (por ejemplo los de resumen_estadistico); las columnas que
+            falten se perfilan aquí
+        top_k (int): Número de categorías mostradas por columna
+        
+    Returns:
+        dict: Columna -> perfil de la variable
     """
     if columnas_categoricas is None:
-        columnas_categoricas = df.select_dtypes(include=['object']).columns
+        columnas_categoricas = df.select_dtypes(include=['object', 'category']).columns
+    perfiles = dict(perfiles or {})
+    faltan = [col for col in columnas_categoricas if col not in perfiles]
+    perfiles.update(perfilar_categoricas(df, faltan, top_k))
     
     print("=" * 60)
     print("ANÁLISIS DE VARIABLES CATEGÓRICAS")
     print("=" * 60)
     
     for col in columnas_categoricas:
+        perfil = perfiles[col]
         print(f"\nANÁLISIS DE: {col}")
         print("-" * 40)
         
-        # Frecuencias
-        frecuencias = df[col].value_counts()
-        frecuencias_relativas = df[col].value_counts(normalize=True) * 100
-        
+        # Frecuencias (solo las top_k categorías en columnas de alta cardinalidad)
         print("Frecuencias absolutas:")
-        print(frecuencias)
+        print(perfil['conteos'].head(top_k))
         
         print("\nFrecuencias relativas (%):")
-        print(frecuencias_relativas.round(2))
+        print(perfil['frecuencias'].head(top_k).round(2))
+        
+        if perfil['otros_categorias'] > 0:
+            print(f"... y {perfil['otros_categorias']} categorías más ({perfil['otros_filas']} filas)")
         
         # Estadísticas de diversidad
-        n_categorias = df[col].nunique()
-        entropia = stats.entropy(frecuencias)
+        n_categorias = perfil['n_categorias']
+        entropia = perfil['entropia']
         
         print(f"\nNúmero de categorías: {n_categorias}")
         print(f"Entropía: {entropia:.3f}")
@@ -225,6 +365,57 @@ def analizar_categoricas(df, columnas_categoricas=None):
             print("Diversidad moderada")
         else:
             print("Alta diversidad (distribución más uniforme)")
+    
+    return {col: perfiles[col] for col in columnas_categoricas}
+
+@instrumentar
+def analizar_segmentos(df, cubo=None, columna='precio', top_k=10):
+    """
+    Analiza el precio por segmento (marca, RAM, almacenamiento, familia de
+    CPU, sistema operativo y categoría de precio)
+    
+    Args:
+        df (pandas.DataFrame): DataFrame a analizar
+        cubo (dict): Cubo ya construido por cubo_precios.construir_cubo
+        columna (str): Variable de precio
+        top_k (int): Segmentos mostrados por dimensión (los de más laptops)
+        
+    Returns:
+        dict: Cubo de precios, o None si no hay columna de precio
+    """
+    if cubo is None:
+        if columna not in df.columns:
+            return None
+        cubo = cubo_precios.construir_cubo(df, columna)
+    
+    print("=" * 60)
+    print("ANÁLISIS POR SEGMENTOS")
+    print("=" * 60)
+    
+    for (dimension,) in [combinacion for combinacion in cubo if len(combinacion) == 1]:
+        segmentos = cubo_precios.consultar_cubo(cubo, dimension, ordenar_por='-conteo', limite=top_k)
+        print(f"\n{columna.upper()} POR {dimension.upper()}:")
+        print(segmentos[['conteo', 'media', 'mediana', 'q1', 'q3']].round(0))
+    
+    return cubo
+
+def resumen_segmentos(cubo, top_k=10):
+    """
+    Desglose del precio por cada dimensión, listo para el artefacto
+    
+    Args:
+        cubo (dict): Cubo de precios
+        top_k (int): Segmentos por dimensión (los de más laptops)
+        
+    Returns:
+        dict: Dimensión -> lista de segmentos con sus estadísticas
+    """
+    desglose = {}
+    for (dimension,) in [combinacion for combinacion in cubo if len(combinacion) == 1]:
+        segmentos = cubo_precios.consultar_cubo(cubo, dimension, ordenar_por='-conteo', limite=top_k)
+        desglose[dimension] = [{'segmento': segmento, **estadisticas}
+                               for segmento, estadisticas in segmentos.to_dict('index').items()]
+    return desglose
 
 def detectar_patrones_temporales(df, columna_fecha=None):
     """
@@ -269,6 +460,7 @@ def detectar_patrones_temporales(df, columna_fecha=None):
         except Exception as e:
             print(f"No se pudo realizar análisis temporal: {e}")
 
+@instrumentar
 def generar_insights(df, resumen):
     """
     Genera insights automáticos basados en el análisis
@@ -309,36 +501,128 @@ def generar_insights(df, resumen):
             col_con_mas_outliers = max(resumen['outliers'].items(), key=lambda x: x[1])
             insights.append(f"La variable con más outliers es {col_con_mas_outliers[0]} ({col_con_mas_outliers[1]} outliers)")
     
+    if 'al_menos_2_metodos' in resumen.get('outliers_filas', {}):
+        insights.append(f"{resumen['outliers_filas']['al_menos_2_metodos']} filas son outliers según al menos "
+                        f"2 métodos de detección (columna outlier_metodos)")
+    
     # Imprimir insights
     for i, insight in enumerate(insights, 1):
         print(f"{i}. {insight}")
     
     return insights
 
-def main():
+def _valor_json(valor):
+    """
+    Convierte un resultado del análisis en un valor serializable en JSON
+    
+    Los DataFrames pasan a {columna: {fila: valor}}, los escalares de NumPy
+    a tipos de Python y los NaN a None.
+    """
+    if isinstance(valor, pd.DataFrame):
+        return _valor_json(valor.to_dict())
+    if isinstance(valor, dict):
+        return {str(clave): _valor_json(v) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_valor_json(v) for v in valor]
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, float) and math.isnan(valor):
+        return None
+    if isinstance(valor, (str, int, float, bool)) or valor is None:
+        return valor
+    return str(valor)
+
+def guardar_artefacto(resumen, correlaciones_fuertes, insights, ruta=RUTA_ARTEFACTO, cubo=None):
+    """
+    Guarda los resultados del análisis en un JSON para el reporte final
+    
+    Así el reporte (reporte.py) se genera sin volver a cargar los datos ni
+    repetir cálculos.
+    
+    Args:
+        resumen (dict): Resultado de resumen_estadistico
+        correlaciones_fuertes (list): Pares de pares_correlacionados
+        insights (list): Resultado de generar_insights
+        ruta (str): Archivo de destino
+        cubo (dict): Cubo de precios; se guarda su desglose por dimensión
+        
+    Returns:
+        dict: Artefacto guardado
+    """
+    claves = ['dimensiones', 'columnas', 'tipos_datos', 'valores_faltantes', 'porcentaje_faltantes',
+              'columnas_numericas', 'columnas_categoricas', 'estadisticas_descriptivas', 'outliers',
+              'outliers_filas']
+    artefacto = {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        **{clave: _valor_json(resumen[clave]) for clave in claves if clave in resumen},
+        'correlaciones_fuertes': _valor_json(correlaciones_fuertes),
+        'umbral_correlacion': UMBRAL_CORRELACION,
+        'insights': list(insights),
+    }
+    if cubo is not None:
+        artefacto['segmentacion'] = _valor_json(resumen_segmentos(cubo))
+    
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(artefacto, f, ensure_ascii=False, indent=1)
+    os.replace(temporal, ruta)
+    return artefacto
+
+def main(df=None, ruta_artefacto=RUTA_ARTEFACTO, ruta_cubo=cubo_precios.RUTA_CUBO, vecinos=None):
     """
     Función principal que ejecuta todo el análisis estadístico
+    
+    Args:
+        df (pandas.DataFrame): Datos limpios ya cargados en memoria. Si es None
+            se leen desde data/laptop_limpio.csv
+        ruta_artefacto (str): Archivo donde se guardan los resultados para
+            el reporte final (None para no guardarlos)
+        ruta_cubo (str): Archivo donde se guarda el cubo de precios por
+            segmento (None para no guardarlo)
+        vecinos (int): Lee de la caché los datos imputados con ese número
+            de vecinos (ver data_cleaning.main)
+        
+    Returns:
+        dict: Resumen estadístico, o None si no hay datos
     """
     # Cargar datos limpios
-    try:
-        df = pd.read_csv("../data/laptop_limpio.csv")
-        print("Datos cargados exitosamente para análisis")
-    except FileNotFoundError:
-        print("Error: No se encontró el archivo laptop_limpio.csv")
-        print("Ejecuta primero el script de limpieza de datos")
-        return
+    if df is None:
+        try:
+            df = cache_datos.cargar_datos_limpios(vecinos=vecinos)
+            print("Datos cargados exitosamente para análisis")
+        except FileNotFoundError:
+            print("Error: No se encontró el archivo laptop_limpio.csv")
+            print("Ejecuta primero el script de limpieza de datos")
+            return None
     
     # Ejecutar análisis completo
     resumen = resumen_estadistico(df)
-    analizar_distribuciones(df)
-    matriz_corr = analizar_correlaciones(df)
-    analizar_categoricas(df)
+    analizar_distribuciones(df, estadisticas=resumen.get('estadisticas_numericas'))
+    matriz_corr = analizar_correlaciones(df, umbral=UMBRAL_CORRELACION)
+    analizar_categoricas(df, perfiles=resumen.get('perfiles_categoricas'))
+    cubo = analizar_segmentos(df)
     detectar_patrones_temporales(df)
     insights = generar_insights(df, resumen)
     
+    if ruta_cubo and cubo is not None:
+        cubo_precios.guardar_cubo(cubo, ruta_cubo)
+    if ruta_artefacto:
+        guardar_artefacto(resumen, pares_correlacionados(matriz_corr, UMBRAL_CORRELACION),
+                          insights, ruta_artefacto, cubo)
+    
     print("\n" + "=" * 60)
     print("ANÁLISIS ESTADÍSTICO COMPLETADO")
     print("=" * 60)
+    
+    return resumen
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Análisis estadístico del dataset de laptops")
+    parser.add_argument("--vecinos", type=int, metavar="K",
+                        help="Analiza los datos limpiados con la imputación por K vecinos")
+    argumentos = parser.parse_args()
+    
+    main(vecinos=argumentos.vecinos) 
\ No newline at end of file
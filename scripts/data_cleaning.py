@@ -12,29 +12,50 @@ import numpy as np
 import os
 import sys
 
+import cache_datos
+from deduplicacion import deduplicar, hashes_filas
+from deteccion_outliers import puntuar_outliers
+from imputacion import imputar_faltantes
+from instrumentacion import instrumentar
+from perfil_categoricas import perfilar_categoricas
+from parser_especificaciones import parsear_especificaciones
+
 # Configurar codificación para evitar problemas en Windows
-import sys
-import codecs
-sys.stdout = codecs.getwriter('utf-8')(sys.stdout.detach())
+# (reconfigure no separa el buffer, así que el módulo también puede
+# importarse desde run_analysis sin romper la salida del proceso)
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
 
 # Agregar el directorio padre al path para importar módulos
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DIRECTORIO_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(DIRECTORIO_PROYECTO)
 
-def cargar_datos(ruta_archivo):
+# Rutas por defecto (independientes del directorio de trabajo)
+RUTA_DATOS = os.path.join(DIRECTORIO_PROYECTO, 'data', 'laptop.xlsx')
+RUTA_DATOS_LIMPIOS = os.path.join(DIRECTORIO_PROYECTO, 'data', 'laptop_limpio.csv')
+RUTA_DUPLICADOS = os.path.join(DIRECTORIO_PROYECTO, 'reports', 'duplicados_agrupados.csv')
+
+@instrumentar
+def cargar_datos(ruta_archivo, hoja=None, columnas=None, usar_cache_libro=True):
     """
     Carga los datos desde un archivo Excel o CSV
     
     Args:
         ruta_archivo (str): Ruta al archivo de datos
+        hoja (str o int): Hoja del libro Excel (nombre o posición; por
+            defecto la primera)
+        columnas (list): Columnas a cargar (por defecto todas)
+        usar_cache_libro (bool): Reutiliza la conversión columnar del libro
+            Excel mientras el archivo no cambie
         
     Returns:
         pandas.DataFrame: DataFrame con los datos cargados
     """
     try:
         if ruta_archivo.endswith('.xlsx'):
-            df = pd.read_excel(ruta_archivo)
+            df = leer_libro(ruta_archivo, hoja, columnas, usar_cache_libro)
         elif ruta_archivo.endswith('.csv'):
-            df = pd.read_csv(ruta_archivo)
+            df = pd.read_csv(ruta_archivo, usecols=columnas)
         else:
             raise ValueError("Formato de archivo no soportado. Use .xlsx o .csv")
         
@@ -73,12 +94,17 @@ def explorar_datos(df):
     print("\nTipos de datos:")
     print(df.dtypes)
 
-def limpiar_datos(df):
+@instrumentar
+def limpiar_datos(df, ruta_duplicados=None, vecinos=None):
     """
     Limpia y transforma los datos
     
     Args:
         df (pandas.DataFrame): DataFrame original
+        ruta_duplicados (str): Si se indica, guarda en este CSV los grupos
+            de casi duplicados fusionados
+        vecinos (int): Si se indica, las especificaciones faltantes se
+            rellenan con ese número de vecinos más cercanos (ver imputacion.py)
         
     Returns:
         pandas.DataFrame: DataFrame limpio
@@ -87,59 +113,381 @@ def limpiar_datos(df):
     print("PROCESO DE LIMPIEZA DE DATOS")
     print("=" * 50)
     
-    # Crear una copia para no modificar el original
-    df_limpio = df.copy()
-    
-    # 1. Eliminar filas duplicadas
-    filas_antes = len(df_limpio)
-    df_limpio = df_limpio.drop_duplicates()
-    filas_despues = len(df_limpio)
-    print(f"Filas duplicadas eliminadas: {filas_antes - filas_despues}")
-    
-    # 2. Manejar valores faltantes
+    # 1. Eliminar filas duplicadas y casi duplicadas (devuelve una copia)
+    df_limpio, duplicados = deduplicar(df)
+    df_limpio = df_limpio.copy()
+    print(f"Filas duplicadas eliminadas: {duplicados['exactos']}")
+    print(f"Casi duplicados fusionados: {duplicados['casi_duplicados']} filas "
+          f"en {len(duplicados['grupos'])} grupos")
+    for _, grupo in duplicados['grupos'].head(5).iterrows():
+        print(f"  - {grupo['filas']} listados: {grupo['variantes']}")
+    if ruta_duplicados is not None:
+        os.makedirs(os.path.dirname(ruta_duplicados), exist_ok=True)
+        duplicados['grupos'].to_csv(ruta_duplicados, index=False)
+        print(f"Grupos de duplicados guardados en: {ruta_duplicados}")
+    
+    # 1b. Extraer columnas numéricas de las especificaciones en texto
+    columnas_antes = set(df_limpio.columns)
+    df_limpio = parsear_especificaciones(df_limpio)
+    nuevas = [col for col in df_limpio.columns if col not in columnas_antes]
+    if nuevas:
+        print(f"Columnas derivadas de las especificaciones: {', '.join(nuevas)}")
+    
+    # 2. Manejar valores faltantes: mediana por grupo (precio por marca),
+    # vecinos más cercanos (opcional), mediana global o moda, todo en una pasada
+    faltantes = df_limpio.isnull().sum()
     print("\nValores faltantes antes de la limpieza:")
-    print(df_limpio.isnull().sum())
+    print(faltantes)
     
-    # Para columnas numéricas, reemplazar con la mediana
-    columnas_numericas = df_limpio.select_dtypes(include=[np.number]).columns
-    for col in columnas_numericas:
-        if df_limpio[col].isnull().sum() > 0:
-            mediana = df_limpio[col].median()
-            df_limpio[col].fillna(mediana, inplace=True)
-            print(f"Valores faltantes en {col} reemplazados con mediana: {mediana}")
-    
-    # Para columnas categóricas, reemplazar con la moda
-    columnas_categoricas = df_limpio.select_dtypes(include=['object']).columns
-    for col in columnas_categoricas:
-        if df_limpio[col].isnull().sum() > 0:
-            moda = df_limpio[col].mode()[0]
-            df_limpio[col].fillna(moda, inplace=True)
-            try:
-                print(f"Valores faltantes en {col} reemplazados con moda: {moda}")
-            except UnicodeEncodeError:
-                print(f"Valores faltantes en {col} reemplazados con moda")
+    imputar_faltantes(df_limpio, vecinos=vecinos, faltantes=faltantes)
     
     print("\nValores faltantes después de la limpieza:")
     print(df_limpio.isnull().sum())
     
     # 3. Limpiar nombres de columnas
-    df_limpio.columns = df_limpio.columns.str.strip().str.lower().str.replace(' ', '_')
+    normalizar_columnas(df_limpio)
     print(f"\nNombres de columnas normalizados")
     
     # 4. Convertir tipos de datos apropiados
+    for col in convertir_tipos(df_limpio):
+        print(f"Columna {col} convertida a numérica")
+    
+    return df_limpio
+
+def normalizar_columnas(df):
+    """
+    Normaliza los nombres de columnas (minúsculas, sin espacios) en el lugar
+    
+    Args:
+        df (pandas.DataFrame): DataFrame a modificar
+    """
+    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+
+def convertir_tipos(df):
+    """
+    Convierte a numéricas las columnas de texto en el lugar
+    
+    Solo se convierten las columnas cuyos valores son todos numéricos; las
+    columnas de texto libre (modelo, pantalla, etc.) se conservan, ya que
+    sus valores numéricos se extraen con parsear_especificaciones.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame a modificar
+        
+    Returns:
+        list: Columnas convertidas
+    """
+    convertidas = []
+    
     # Identificar columnas que deberían ser numéricas
-    for col in df_limpio.columns:
-        if df_limpio[col].dtype == 'object':
-            # Intentar convertir a numérico si es posible
+    for col in df.columns:
+        if df[col].dtype == 'object':
+            # Convertir solo si ningún valor se pierde en la conversión
+            convertida = pd.to_numeric(df[col], errors='coerce')
+            if convertida.notnull().any() and convertida.notnull().sum() == df[col].notnull().sum():
+                df[col] = convertida
+                convertidas.append(col)
+    
+    return convertidas
+
+def leer_por_bloques(ruta_archivo, tamano_bloque=100_000, hoja=None, columnas=None):
+    """
+    Lee un archivo Excel o CSV en bloques de tamaño acotado
+    
+    Los CSV se leen con el modo chunksize de pandas; los Excel se recorren
+    fila a fila con el lector de solo lectura de openpyxl.
+    
+    Args:
+        ruta_archivo (str): Ruta al archivo de datos
+        tamano_bloque (int): Número máximo de filas por bloque
+        hoja (str o int): Hoja del libro Excel (nombre o posición; por
+            defecto la primera, como pd.read_excel)
+        columnas (list): Columnas a leer (por defecto todas)
+        
+    Yields:
+        pandas.DataFrame: Bloques consecutivos del archivo
+        
+    Raises:
+        KeyError: Si alguna columna pedida no existe en el libro
+    """
+    if ruta_archivo.endswith('.csv'):
+        yield from pd.read_csv(ruta_archivo, chunksize=tamano_bloque, usecols=columnas)
+    elif ruta_archivo.endswith('.xlsx'):
+        from openpyxl import load_workbook
+        
+        libro = load_workbook(ruta_archivo, read_only=True, data_only=True)
+        try:
+            if hoja is None:
+                hoja_libro = libro.worksheets[0]
+            elif isinstance(hoja, int):
+                hoja_libro = libro.worksheets[hoja]
+            else:
+                hoja_libro = libro[hoja]
+            
+            filas = hoja_libro.iter_rows(values_only=True)
+            encabezado = next(filas, None)
+            if encabezado is None:
+                return
+            nombres = [f"Unnamed: {i}" if nombre is None else str(nombre)
+                       for i, nombre in enumerate(encabezado)]
+            
+            # Selección de columnas por posición, sin construir las descartadas
+            if columnas is None:
+                posiciones = list(range(len(nombres)))
+            else:
+                faltantes = [col for col in columnas if col not in nombres]
+                if faltantes:
+                    raise KeyError(f"Columnas no encontradas en el libro: {faltantes}")
+                posiciones = [nombres.index(col) for col in columnas]
+            nombres = [nombres[i] for i in posiciones]
+            ancho = len(encabezado)
+            
+            bloque = []
+            for fila in filas:
+                # El modo de solo lectura omite las celdas vacías al final de la fila
+                if len(fila) < ancho:
+                    fila = fila + (None,) * (ancho - len(fila))
+                bloque.append([fila[i] for i in posiciones])
+                if len(bloque) == tamano_bloque:
+                    yield _inferir_tipos(pd.DataFrame(bloque, columns=nombres))
+                    bloque = []
+            if bloque:
+                yield _inferir_tipos(pd.DataFrame(bloque, columns=nombres))
+        finally:
+            libro.close()
+    else:
+        raise ValueError("Formato de archivo no soportado. Use .xlsx o .csv")
+
+def leer_libro(ruta_libro, hoja=None, columnas=None, usar_cache=True, tamano_bloque=100_000):
+    """
+    Lee un libro Excel completo con el lector de solo lectura de openpyxl
+    
+    La primera lectura convierte el libro a un archivo columnar en
+    data/cache/; las siguientes lo reutilizan mientras el libro no cambie.
+    
+    Args:
+        ruta_libro (str): Ruta al libro Excel
+        hoja (str o int): Hoja a leer (por defecto la primera)
+        columnas (list): Columnas a leer (por defecto todas)
+        usar_cache (bool): Reutiliza y guarda la conversión columnar
+        tamano_bloque (int): Filas por bloque durante la lectura
+        
+    Returns:
+        pandas.DataFrame: Contenido de la hoja
+    """
+    if usar_cache:
+        df = cache_datos.cargar_libro_cacheado(ruta_libro, hoja, columnas)
+        if df is not None:
+            print(f"Libro cargado desde su conversión columnar: {ruta_libro}")
+            # Parquet devuelve None en los textos vacíos; se restauran los NaN
+            return _inferir_tipos(df)
+    
+    bloques = list(leer_por_bloques(ruta_libro, tamano_bloque, hoja, columnas))
+    if not bloques:
+        return pd.DataFrame()
+    
+    # Los tipos se vuelven a inferir sobre el total: un bloque aislado
+    # puede parecer numérico aunque otro tenga texto en la misma columna
+    df = pd.concat(bloques, ignore_index=True) if len(bloques) > 1 else bloques[0]
+    if len(bloques) > 1:
+        df = _inferir_tipos(df)
+    
+    if usar_cache:
+        cache_datos.guardar_libro_cacheado(df, ruta_libro, hoja, columnas)
+    return df
+
+def _inferir_tipos(bloque):
+    """
+    Convierte a numéricas las columnas de texto que contienen solo números
+    
+    Replica la inferencia de pd.read_excel, que interpreta las celdas con
+    números guardados como texto y representa las celdas vacías como NaN.
+    
+    Args:
+        bloque (pandas.DataFrame): Bloque leído con openpyxl
+        
+    Returns:
+        pandas.DataFrame: Bloque con los tipos inferidos
+    """
+    bloque = bloque.infer_objects()
+    for col in bloque.columns:
+        if bloque[col].dtype == 'object':
             try:
-                df_limpio[col] = pd.to_numeric(df_limpio[col], errors='coerce')
-                if not df_limpio[col].isnull().all():
-                    print(f"Columna {col} convertida a numérica")
-            except:
-                pass
+                bloque[col] = pd.to_numeric(bloque[col])
+            except (ValueError, TypeError):
+                # openpyxl devuelve None en las celdas vacías
+                bloque[col] = bloque[col].where(bloque[col].notna(), np.nan)
+    return bloque
+
+def _filtrar_duplicados(bloque, hashes_vistos):
+    """
+    Elimina del bloque las filas ya vistas en este u otros bloques
     
-    return df_limpio
+    Args:
+        bloque (pandas.DataFrame): Bloque de datos
+        hashes_vistos (numpy.ndarray): Hashes (uint64, ordenados) de filas ya vistas
+        
+    Returns:
+        tuple: (bloque sin duplicados, hashes_vistos actualizados)
+    """
+    hashes = hashes_filas(bloque)
+    
+    # Duplicados dentro del bloque y contra los bloques anteriores
+    nuevos = ~pd.Series(hashes).duplicated().to_numpy()
+    if len(hashes_vistos) > 0:
+        posiciones = np.searchsorted(hashes_vistos, hashes)
+        posiciones[posiciones == len(hashes_vistos)] = 0
+        nuevos &= hashes_vistos[posiciones] != hashes
+    
+    hashes_vistos = np.union1d(hashes_vistos, hashes[nuevos])
+    return bloque[nuevos], hashes_vistos
 
+def _actualizar_muestra(muestra, claves, valores, tamano_muestra, generador):
+    """
+    Actualiza una muestra aleatoria uniforme de tamaño acotado (bottom-k)
+    
+    Cada valor recibe una clave aleatoria y se conservan las tamano_muestra
+    claves más pequeñas, lo que equivale a muestrear sin reemplazo.
+    """
+    nuevas_claves = generador.random(len(valores))
+    muestra = np.concatenate([muestra, valores])
+    claves = np.concatenate([claves, nuevas_claves])
+    if len(muestra) > tamano_muestra:
+        conservar = np.argpartition(claves, tamano_muestra)[:tamano_muestra]
+        muestra, claves = muestra[conservar], claves[conservar]
+    return muestra, claves
+
+def calcular_estadisticas_por_bloques(ruta_archivo, tamano_bloque=100_000,
+                                      tamano_muestra=100_000, max_categorias=10_000,
+                                      semilla=42):
+    """
+    Primera pasada del modo por bloques: reúne los valores de imputación
+    
+    Las medianas se calculan sobre una muestra uniforme de tamaño acotado
+    (exactas mientras haya menos filas únicas que tamano_muestra) y las modas
+    sobre un conteo de categorías que se poda a las max_categorias más
+    frecuentes, de modo que la memoria no depende del tamaño del archivo.
+    
+    Args:
+        ruta_archivo (str): Ruta al archivo de datos
+        tamano_bloque (int): Número máximo de filas por bloque
+        tamano_muestra (int): Tamaño de la muestra para estimar medianas
+        max_categorias (int): Categorías conservadas por columna para las modas
+        semilla (int): Semilla del muestreo aleatorio
+        
+    Returns:
+        dict: Valores de imputación por columna (nombres originales) y conteos
+    """
+    generador = np.random.default_rng(semilla)
+    hashes_vistos = np.array([], dtype=np.uint64)
+    muestras, conteos = {}, {}
+    columnas_texto = set()
+    faltantes = None
+    filas_leidas = filas_unicas = 0
+    
+    for bloque in leer_por_bloques(ruta_archivo, tamano_bloque):
+        filas_leidas += len(bloque)
+        bloque, hashes_vistos = _filtrar_duplicados(bloque, hashes_vistos)
+        bloque = parsear_especificaciones(bloque)
+        filas_unicas += len(bloque)
+        
+        nulos = bloque.isnull().sum()
+        faltantes = nulos if faltantes is None else faltantes.add(nulos, fill_value=0)
+        
+        for col in bloque.columns:
+            serie = bloque[col].dropna()
+            if pd.api.types.is_numeric_dtype(bloque[col]):
+                muestra, claves = muestras.get(col, (np.array([]), np.array([])))
+                muestras[col] = _actualizar_muestra(muestra, claves, serie.to_numpy(dtype=float),
+                                                    tamano_muestra, generador)
+            elif len(serie) > 0:
+                columnas_texto.add(col)
+                conteo = serie.value_counts()
+                if col in conteos:
+                    conteo = conteos[col].add(conteo, fill_value=0)
+                conteos[col] = conteo.nlargest(max_categorias)
+    
+    valores = {}
+    for col, (muestra, _) in muestras.items():
+        if col not in columnas_texto and len(muestra) > 0:
+            valores[col] = float(np.median(muestra))
+    for col in columnas_texto:
+        valores[col] = conteos[col].idxmax()
+    
+    return {
+        'valores_imputacion': valores,
+        'valores_faltantes': {} if faltantes is None else faltantes.astype(int).to_dict(),
+        'filas_leidas': filas_leidas,
+        'filas_unicas': filas_unicas,
+    }
+
+def limpiar_por_bloques(ruta_archivo, ruta_salida, tamano_bloque=100_000, **opciones):
+    """
+    Limpia un archivo mayor que la memoria disponible, bloque a bloque
+    
+    Aplica los mismos pasos que limpiar_datos (duplicados, especificaciones,
+    imputación con mediana/moda, nombres de columnas y tipos) en dos pasadas: la primera
+    reúne los valores de imputación y la segunda los aplica y escribe el
+    CSV de salida de forma incremental. La memoria máxima depende del
+    tamaño de bloque, no del tamaño del archivo (salvo 8 bytes por fila
+    única para detectar duplicados entre bloques).
+    
+    La transformación (categorías de precio, variables dummy) y la
+    detección de outliers necesitan el dataset completo y no se aplican en
+    este modo. Tampoco la fusión de
+    casi duplicados (ver deduplicacion.py): aquí solo se eliminan los
+    duplicados exactos.
+    
+    Args:
+        ruta_archivo (str): Ruta al archivo de datos
+        ruta_salida (str): Ruta del CSV limpio
+        tamano_bloque (int): Número máximo de filas por bloque
+        **opciones: Parámetros adicionales para calcular_estadisticas_por_bloques
+        
+    Returns:
+        dict: Resumen con filas leídas, duplicados eliminados y filas escritas
+    """
+    print("=" * 50)
+    print("PROCESO DE LIMPIEZA POR BLOQUES")
+    print("=" * 50)
+    
+    # 1. Primera pasada: estadísticas para la imputación
+    estadisticas = calcular_estadisticas_por_bloques(ruta_archivo, tamano_bloque, **opciones)
+    valores = estadisticas['valores_imputacion']
+    duplicados = estadisticas['filas_leidas'] - estadisticas['filas_unicas']
+    print(f"Filas leídas: {estadisticas['filas_leidas']}")
+    print(f"Filas duplicadas eliminadas: {duplicados}")
+    for col, cantidad in estadisticas['valores_faltantes'].items():
+        if cantidad > 0 and col in valores:
+            print(f"Valores faltantes en {col} ({cantidad}) reemplazados con: {valores[col]}")
+    
+    # 2. Segunda pasada: aplicar y escribir de forma incremental
+    hashes_vistos = np.array([], dtype=np.uint64)
+    filas_escritas = 0
+    columnas = None
+    for i, bloque in enumerate(leer_por_bloques(ruta_archivo, tamano_bloque)):
+        bloque, hashes_vistos = _filtrar_duplicados(bloque, hashes_vistos)
+        bloque = parsear_especificaciones(bloque).fillna(valores)
+        normalizar_columnas(bloque)
+        convertir_tipos(bloque)
+        
+        # Los bloques se añaden sin cabecera: mismas columnas y orden que el primero
+        if columnas is None:
+            columnas = list(bloque.columns)
+        bloque = bloque.reindex(columns=columnas)
+        bloque.to_csv(ruta_salida, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+        filas_escritas += len(bloque)
+    
+    print(f"Datos limpios guardados en: {ruta_salida} ({filas_escritas} filas)")
+    
+    return {
+        'filas_leidas': estadisticas['filas_leidas'],
+        'duplicados_eliminados': duplicados,
+        'filas_escritas': filas_escritas,
+        'valores_imputacion': valores,
+    }
+
+@instrumentar
 def transformar_datos(df):
     """
     Realiza transformaciones adicionales en los datos
@@ -181,7 +529,8 @@ def transformar_datos(df):
     
     # Crear variables dummy para columnas categóricas importantes (solo las primeras 5)
     columnas_categoricas = df_transformado.select_dtypes(include=['object']).columns
-    columnas_importantes = [col for col in columnas_categoricas if df_transformado[col].nunique() <= 10][:5]
+    perfiles = perfilar_categoricas(df_transformado, columnas_categoricas, top_k=0)
+    columnas_importantes = [col for col in columnas_categoricas if perfiles[col]['n_categorias'] <= 10][:5]
     
     for col in columnas_importantes:
         try:
@@ -193,6 +542,88 @@ def transformar_datos(df):
     
     return df_transformado
 
+def reporte_memoria(df_antes, df_despues):
+    """
+    Compara el uso de memoria por columna antes y después de compactar
+    
+    Args:
+        df_antes (pandas.DataFrame): DataFrame original
+        df_despues (pandas.DataFrame): DataFrame compactado
+        
+    Returns:
+        pandas.DataFrame: Bytes por columna (antes, despues, tipo_antes, tipo_despues)
+    """
+    reporte = pd.DataFrame({
+        'antes': df_antes.memory_usage(deep=True, index=False),
+        'despues': df_despues.memory_usage(deep=True, index=False),
+        'tipo_antes': df_antes.dtypes.astype(str),
+        'tipo_despues': df_despues.dtypes.astype(str),
+    })
+    reporte = reporte.sort_values('antes', ascending=False)
+    
+    cambiadas = reporte[reporte['antes'] != reporte['despues']]
+    for col, fila in cambiadas.head(15).iterrows():
+        print(f"  {col}: {fila['antes'] / 1024:.1f} KB ({fila['tipo_antes']}) -> "
+              f"{fila['despues'] / 1024:.1f} KB ({fila['tipo_despues']})")
+    if len(cambiadas) > 15:
+        print(f"  ... y {len(cambiadas) - 15} columnas más")
+    
+    total_antes, total_despues = reporte['antes'].sum(), reporte['despues'].sum()
+    print(f"Memoria total: {total_antes / 1024 ** 2:.2f} MB -> {total_despues / 1024 ** 2:.2f} MB "
+          f"({total_despues / max(total_antes, 1):.0%} del original)")
+    
+    return reporte
+
+@instrumentar
+def compactar_datos(df, umbral_cardinalidad=0.5, dummies_dispersos=False):
+    """
+    Reduce la memoria del DataFrame sin cambiar sus valores
+    
+    Las columnas de texto con pocos valores distintos pasan a 'category',
+    los enteros se reducen al tipo más pequeño que los contiene y los
+    flotantes pasan a float32 solo si la conversión no altera ningún valor.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame limpio
+        umbral_cardinalidad (float): Proporción máxima de valores únicos
+            para convertir una columna de texto a 'category'
+        dummies_dispersos (bool): Guarda las variables dummy (booleanas) en
+            formato disperso. Útil con muchas dummies, pero el resultado no
+            se puede guardar en Parquet
+        
+    Returns:
+        pandas.DataFrame: DataFrame compactado
+    """
+    print("=" * 50)
+    print("COMPACTACIÓN EN MEMORIA")
+    print("=" * 50)
+    
+    df_compacto = df.copy()
+    filas = max(len(df_compacto), 1)
+    
+    for col in df_compacto.columns:
+        serie = df_compacto[col]
+        
+        if serie.dtype == 'object':
+            if serie.nunique() / filas <= umbral_cardinalidad:
+                df_compacto[col] = serie.astype('category')
+        
+        elif pd.api.types.is_integer_dtype(serie):
+            df_compacto[col] = pd.to_numeric(serie, downcast='integer')
+        
+        elif pd.api.types.is_float_dtype(serie) and serie.dtype != np.float32:
+            reducida = serie.astype(np.float32)
+            # Solo si float32 representa exactamente todos los valores
+            if np.array_equal(reducida.to_numpy(dtype=float), serie.to_numpy(), equal_nan=True):
+                df_compacto[col] = reducida
+        
+        elif serie.dtype == bool and dummies_dispersos:
+            df_compacto[col] = serie.astype(pd.SparseDtype(bool, False))
+    
+    reporte_memoria(df, df_compacto)
+    return df_compacto
+
+@instrumentar
 def guardar_datos_limpios(df, ruta_salida):
     """
     Guarda los datos limpios en formato CSV
@@ -207,39 +638,93 @@ def guardar_datos_limpios(df, ruta_salida):
     except Exception as e:
         print(f"Error al guardar los datos: {e}")
 
-def main():
+def main(ruta_datos=RUTA_DATOS, ruta_salida=RUTA_DATOS_LIMPIOS, usar_cache=True, compactar=False, vecinos=None):
     """
     Función principal que ejecuta todo el proceso de limpieza
-    """
-    # Rutas de archivos
-    ruta_datos = "../data/laptop.xlsx"
-    ruta_salida = "../data/laptop_limpio.csv"
     
+    Args:
+        ruta_datos (str): Ruta al archivo de datos original
+        ruta_salida (str): Ruta del CSV limpio. Si es None no se escribe a disco
+        usar_cache (bool): Reutiliza la caché tipada si los datos y el código
+            de limpieza no han cambiado
+        compactar (bool): Devuelve el DataFrame compactado (ver compactar_datos).
+            El CSV y la caché se guardan siempre sin compactar
+        vecinos (int): Imputa las especificaciones con ese número de vecinos
+            más cercanos. Cada número de vecinos tiene su propia entrada en
+            la caché, separada de la de la imputación por defecto
+        
+    Returns:
+        pandas.DataFrame: DataFrame final, o None si no se pudieron cargar los datos
+    """
     print("INICIANDO PROCESO DE LIMPIEZA DE DATOS")
     print("=" * 50)
     
+    # 0. Reutilizar la caché si está al día
+    if usar_cache:
+        df_final = cache_datos.cargar_cache(ruta_datos, vecinos)
+        if df_final is not None:
+            print(f"Datos limpios cargados desde la caché: {df_final.shape}")
+            if cache_datos.bloque_vigente(ruta_datos, vecinos) is None:
+                cache_datos.guardar_bloque_cache(df_final, ruta_datos, vecinos=vecinos)
+            # El CSV puede venir de otra imputación (--vecinos): se reescribe siempre
+            if ruta_salida is not None:
+                guardar_datos_limpios(df_final, ruta_salida)
+            if compactar:
+                df_final = compactar_datos(df_final)
+            return df_final
+    
     # 1. Cargar datos
     df = cargar_datos(ruta_datos)
     if df is None:
-        return
+        return None
     
     # 2. Explorar datos originales
     explorar_datos(df)
     
     # 3. Limpiar datos
-    df_limpio = limpiar_datos(df)
+    df_limpio = limpiar_datos(df, ruta_duplicados=RUTA_DUPLICADOS, vecinos=vecinos)
     
     # 4. Transformar datos
     df_final = transformar_datos(df_limpio)
     
-    # 5. Guardar datos limpios
-    guardar_datos_limpios(df_final, ruta_salida)
+    # 5. Marcar outliers (IQR, z-score, MAD y multivariado) fila a fila
+    df_final = puntuar_outliers(df_final)
+    
+    # 6. Guardar datos limpios (opcional cuando se ejecuta en proceso)
+    if ruta_salida is not None:
+        guardar_datos_limpios(df_final, ruta_salida)
+    if usar_cache:
+        cache_datos.guardar_cache(df_final, ruta_datos, vecinos)
     
     print("\n" + "=" * 50)
     print("PROCESO DE LIMPIEZA COMPLETADO")
     print("=" * 50)
     print(f"Dataset original: {df.shape}")
     print(f"Dataset final: {df_final.shape}")
+    
+    if compactar:
+        df_final = compactar_datos(df_final)
+    
+    return df_final
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Limpieza del dataset de laptops")
+    parser.add_argument("--por-bloques", type=int, metavar="FILAS",
+                        help="Limpia el archivo en bloques de FILAS filas, sin cargarlo completo en memoria")
+    parser.add_argument("--entrada", default=RUTA_DATOS, help="Archivo de datos original")
+    parser.add_argument("--salida", default=RUTA_DATOS_LIMPIOS, help="CSV limpio de salida")
+    parser.add_argument("--sin-cache", action="store_true",
+                        help="Ignora la caché de datos limpios y repite la limpieza")
+    parser.add_argument("--compactar", action="store_true",
+                        help="Muestra cuánta memoria ahorra la compactación del resultado")
+    parser.add_argument("--vecinos", type=int, metavar="K",
+                        help="Rellena las especificaciones faltantes con los K vecinos más cercanos")
+    argumentos = parser.parse_args()
+    
+    if argumentos.por_bloques:
+        limpiar_por_bloques(argumentos.entrada, argumentos.salida, argumentos.por_bloques)
+    else:
+        main(argumentos.entrada, argumentos.salida, usar_cache=not argumentos.sin_cache,
+             compactar=argumentos.compactar, vecinos=argumentos.vecinos) 
\ No newline at end of file
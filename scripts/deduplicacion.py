@@ -0,0 +1,276 @@
+"""
+Deduplicación de Listados - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script elimina los listados repetidos en dos pasos:
+
+1. Duplicados exactos: filas con el mismo contenido (sin contar columnas
+   identificadoras como el índice exportado 'Unnamed: 0'), detectadas con
+   un hash por fila.
+2. Casi duplicados: listados con las mismas especificaciones cuyo texto de
+   Model solo difiere en espacios, puntuación o un sufijo de SKU. El texto
+   se normaliza, se descompone en n-gramas de caracteres y se resume en una
+   firma MinHash; el hashing sensible a la localidad (LSH) por bandas
+   propone como candidatos solo los listados que coinciden en alguna banda,
+   así que el coste crece casi linealmente con el número de listados en
+   lugar de comparar todos los pares. Los candidatos se confirman con la
+   similitud de Jaccard estimada y se agrupan por componentes conexas.
+   Solo se analizan las filas cuyas especificaciones coinciden con las de
+   otra fila, que suelen ser una pequeña parte del total.
+
+De cada grupo se conserva la primera fila, igual que drop_duplicates().
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# Columnas que identifican la fila y no su contenido
+COLUMNAS_IDENTIFICADOR = ['Unnamed: 0']
+
+# Parámetros de MinHash / LSH: 16 bandas de 4 filas detectan pares con
+# Jaccard 0.8 con probabilidad > 0.999 y casi nunca proponen pares < 0.3
+TAMANO_SHINGLE = 5
+NUM_PERMUTACIONES = 64
+FILAS_POR_BANDA = 4
+UMBRAL_JACCARD = 0.8
+
+# En cubetas mayores solo se comparan vecinos, para no volver a lo cuadrático
+MAX_TAMANO_CUBETA = 50
+
+# Textos procesados a la vez al calcular las firmas (limita la memoria)
+TEXTOS_POR_LOTE = 50_000
+
+_PATRON_NO_ALFANUMERICO = re.compile(r'[\W_]+')
+
+def hashes_filas(df, columnas_ignoradas=COLUMNAS_IDENTIFICADOR):
+    """
+    Hash de 64 bits del contenido de cada fila
+
+    Args:
+        df (pandas.DataFrame): Datos
+        columnas_ignoradas (list): Columnas que no forman parte del contenido
+
+    Returns:
+        numpy.ndarray: Un hash uint64 por fila
+    """
+    columnas = [col for col in df.columns if col not in columnas_ignoradas]
+    return pd.util.hash_pandas_object(df[columnas], index=False).to_numpy()
+
+def normalizar_texto(serie):
+    """
+    Normaliza textos para compararlos: Unicode NFKC, minúsculas y sin
+    espacios, puntuación ni marcas invisibles (como U+200E)
+
+    Args:
+        serie (pandas.Series): Textos
+
+    Returns:
+        pandas.Series: Textos normalizados
+    """
+    return (serie.fillna('').astype(str).str.normalize('NFKC').str.lower()
+            .str.replace(_PATRON_NO_ALFANUMERICO, '', regex=True))
+
+def _coeficientes(num_permutaciones, semilla=1):
+    """
+    Coeficientes (a impar, b) de la familia de hash multiplicativa a*x + b
+    """
+    rng = np.random.default_rng(semilla)
+    a = rng.integers(1, 2 ** 63, size=num_permutaciones, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 2 ** 63, size=num_permutaciones, dtype=np.uint64)
+    return a, b
+
+def _hashes_shingles(textos, k):
+    """
+    Hash de cada n-grama de k bytes de cada texto
+
+    Returns:
+        tuple: (hashes uint64 de todos los n-gramas, posición de inicio de
+            los n-gramas de cada texto)
+    """
+    # Los textos cortos se rellenan para tener al menos un n-grama
+    codificados = [t.encode('utf-8').ljust(k, b'_') for t in textos]
+    longitudes = np.fromiter(map(len, codificados), dtype=np.int64, count=len(codificados))
+    datos = np.frombuffer(b''.join(codificados), dtype=np.uint8).astype(np.uint64)
+
+    # Hash polinómico de todas las ventanas de k bytes (módulo 2^64)
+    ventanas = len(datos) - k + 1
+    hashes = np.zeros(ventanas, dtype=np.uint64)
+    base = np.uint64(1_000_003)
+    for j in range(k):
+        hashes = hashes * base + datos[j:j + ventanas]
+
+    # Solo las ventanas que no cruzan de un texto al siguiente
+    inicios_texto = np.concatenate(([0], np.cumsum(longitudes)[:-1]))
+    por_texto = longitudes - k + 1
+    posiciones = np.repeat(inicios_texto - np.concatenate(([0], np.cumsum(por_texto)[:-1])), por_texto) \
+        + np.arange(por_texto.sum())
+    inicios = np.concatenate(([0], np.cumsum(por_texto)[:-1]))
+    return hashes[posiciones], inicios
+
+def firmas_minhash(textos, num_permutaciones=NUM_PERMUTACIONES, k=TAMANO_SHINGLE,
+                   textos_por_lote=TEXTOS_POR_LOTE):
+    """
+    Firma MinHash del conjunto de n-gramas de caracteres de cada texto
+
+    La fracción de posiciones en que coinciden dos firmas estima la
+    similitud de Jaccard entre sus conjuntos de n-gramas.
+
+    Args:
+        textos (list): Textos (ya normalizados)
+        num_permutaciones (int): Longitud de la firma
+        k (int): Tamaño de los n-gramas en bytes
+        textos_por_lote (int): Textos procesados a la vez
+
+    Returns:
+        numpy.ndarray: Matriz uint32 de textos x num_permutaciones
+    """
+    a, b = _coeficientes(num_permutaciones)
+    firmas = np.empty((len(textos), num_permutaciones), dtype=np.uint32)
+    for inicio in range(0, len(textos), textos_por_lote):
+        lote = textos[inicio:inicio + textos_por_lote]
+        hashes, inicios = _hashes_shingles(lote, k)
+        for p in range(num_permutaciones):
+            # Hash multiplicativo: los 32 bits altos de a*x + b (módulo 2^64)
+            valores = ((hashes * a[p] + b[p]) >> np.uint64(32)).astype(np.uint32)
+            firmas[inicio:inicio + len(lote), p] = np.minimum.reduceat(valores, inicios)
+    return firmas
+
+def pares_candidatos(firmas, claves=None, filas_por_banda=FILAS_POR_BANDA,
+                     max_tamano_cubeta=MAX_TAMANO_CUBETA):
+    """
+    Pares de firmas que coinciden en al menos una banda (LSH)
+
+    Args:
+        firmas (numpy.ndarray): Firmas MinHash
+        claves (numpy.ndarray): Clave uint64 por firma; solo se proponen
+            pares con la misma clave (por ejemplo, mismas especificaciones)
+        filas_por_banda (int): Posiciones de la firma por banda
+        max_tamano_cubeta (int): En cubetas mayores solo se emparejan
+            elementos hasta esta distancia en el orden de la cubeta
+
+    Returns:
+        numpy.ndarray: Matriz n x 2 de índices (i < j), sin repetir
+    """
+    n, num_permutaciones = firmas.shape
+    if claves is None:
+        claves = np.zeros(n, dtype=np.uint64)
+    multiplicador = np.uint64(0x9E3779B97F4A7C15)
+    pares = []
+    for banda, inicio in enumerate(range(0, num_permutaciones - filas_por_banda + 1, filas_por_banda)):
+        cubeta = claves ^ np.uint64(banda)
+        for columna in range(inicio, inicio + filas_por_banda):
+            cubeta = cubeta * multiplicador + firmas[:, columna].astype(np.uint64)
+
+        orden = np.argsort(cubeta, kind='stable')
+        ordenadas = cubeta[orden]
+        for distancia in range(1, min(max_tamano_cubeta, n)):
+            misma = ordenadas[distancia:] == ordenadas[:-distancia]
+            if not misma.any():
+                break
+            posiciones = np.flatnonzero(misma)
+            pares.append(np.column_stack((orden[posiciones], orden[posiciones + distancia])))
+
+    if not pares:
+        return np.empty((0, 2), dtype=np.int64)
+    pares = np.sort(np.concatenate(pares), axis=1)
+    return np.unique(pares, axis=0)
+
+def agrupar_casi_duplicados(textos, claves=None, umbral=UMBRAL_JACCARD):
+    """
+    Agrupa textos casi iguales
+
+    Args:
+        textos (list): Textos normalizados (sin repetir)
+        claves (numpy.ndarray): Clave uint64 por texto; solo se agrupan
+            textos con la misma clave
+        umbral (float): Similitud de Jaccard estimada mínima
+
+    Returns:
+        numpy.ndarray: Etiqueta de grupo por texto
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    n = len(textos)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    firmas = firmas_minhash(textos)
+    pares = pares_candidatos(firmas, claves)
+
+    # Confirmar con la similitud estimada por las firmas completas
+    if len(pares):
+        similitud = (firmas[pares[:, 0]] == firmas[pares[:, 1]]).mean(axis=1)
+        pares = pares[similitud >= umbral]
+
+    grafo = coo_matrix((np.ones(len(pares), dtype=np.int8), (pares[:, 0], pares[:, 1])), shape=(n, n))
+    _, etiquetas = connected_components(grafo, directed=False)
+    return etiquetas
+
+def deduplicar(df, columna_texto='Model', columnas_ignoradas=COLUMNAS_IDENTIFICADOR,
+               umbral=UMBRAL_JACCARD):
+    """
+    Elimina duplicados exactos y casi duplicados
+
+    Dos listados son casi duplicados si coinciden en todas las columnas
+    salvo las identificadoras y columna_texto, y sus textos normalizados
+    tienen una similitud de Jaccard estimada de al menos umbral (o son
+    idénticos tras normalizar).
+
+    Args:
+        df (pandas.DataFrame): Datos originales
+        columna_texto (str): Columna de texto libre a comparar por similitud
+        columnas_ignoradas (list): Columnas identificadoras
+        umbral (float): Similitud mínima entre textos
+
+    Returns:
+        tuple: (DataFrame sin duplicados, estadísticas) donde estadísticas
+            tiene 'exactos' (filas eliminadas por ser idénticas),
+            'casi_duplicados' (filas fusionadas) y 'grupos' (DataFrame con
+            una fila por grupo fusionado: filas, modelo conservado y variantes)
+    """
+    # 1. Duplicados exactos por hash de fila
+    exactos = pd.Series(hashes_filas(df, columnas_ignoradas)).duplicated().to_numpy()
+    df_unico = df[~exactos]
+    estadisticas = {'exactos': int(exactos.sum()), 'casi_duplicados': 0, 'grupos': pd.DataFrame(
+        columns=['filas', 'modelo_conservado', 'variantes'])}
+    if columna_texto not in df_unico.columns or len(df_unico) == 0:
+        return df_unico, estadisticas
+
+    # 2. Casi duplicados: mismo resto de columnas y texto parecido. Solo
+    # pueden tenerlos las filas cuyas especificaciones se repiten
+    ignoradas = list(columnas_ignoradas) + [columna_texto]
+    claves = hashes_filas(df_unico, ignoradas)
+    candidatas = np.flatnonzero(pd.Series(claves).duplicated(keep=False).to_numpy())
+    if len(candidatas) == 0:
+        return df_unico, estadisticas
+    claves = claves[candidatas]
+    normalizados = normalizar_texto(df_unico[columna_texto].iloc[candidatas]).to_numpy()
+
+    # Listados idénticos tras normalizar forman un solo nodo
+    nodos, nodo_por_fila = np.unique(
+        pd.util.hash_pandas_object(pd.DataFrame({'c': claves, 't': normalizados}), index=False).to_numpy(),
+        return_inverse=True)
+    primera_fila = np.full(len(nodos), len(candidatas))
+    np.minimum.at(primera_fila, nodo_por_fila, np.arange(len(candidatas)))
+    etiquetas = agrupar_casi_duplicados(list(normalizados[primera_fila]), claves[primera_fila], umbral)
+
+    grupo_por_fila = etiquetas[nodo_por_fila]
+    repetidas_candidatas = pd.Series(grupo_por_fila).duplicated().to_numpy()
+    repetidas = np.zeros(len(df_unico), dtype=bool)
+    repetidas[candidatas[repetidas_candidatas]] = True
+    estadisticas['casi_duplicados'] = int(repetidas.sum())
+
+    if repetidas.any():
+        fusionados = np.isin(grupo_por_fila, grupo_por_fila[repetidas_candidatas])
+        modelos = df_unico[columna_texto].to_numpy()[candidatas[fusionados]]
+        grupos = pd.DataFrame({'grupo': grupo_por_fila[fusionados], 'modelo': modelos})
+        estadisticas['grupos'] = grupos.groupby('grupo', sort=False).agg(
+            filas=('modelo', 'size'),
+            modelo_conservado=('modelo', 'first'),
+            variantes=('modelo', lambda m: ' | '.join(pd.unique(m.astype(str)))),
+        ).sort_values('filas', ascending=False, kind='stable').reset_index(drop=True)
+
+    return df_unico[~repetidas], estadisticas
@@ -0,0 +1,310 @@
+"""
+Detección de Outliers - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script puntúa cada fila con varios métodos de detección de outliers
+sobre todas las variables numéricas a la vez:
+
+- IQR: distancia fuera de los cuartiles, en múltiplos del rango
+  intercuartílico (outlier si supera 1.5, como en resumen_estadistico)
+- z-score: desviaciones estándar respecto a la media (outlier si supera 3)
+- MAD: z-score modificado con la mediana y la desviación absoluta mediana
+  (outlier si supera 3.5), robusto frente a los propios outliers
+- Multivariado: IsolationForest de scikit-learn sobre todas las variables
+  juntas (se omite si scikit-learn no está instalado)
+
+Los parámetros (cuartiles, media, mediana, MAD y el modelo) se ajustan una
+vez con todos los datos y las filas se puntúan por lotes, de modo que la
+memoria temporal depende del tamaño de lote y no del dataset. El resultado
+se añade a los datos limpios como columnas outlier_<método> (marca) y
+puntuacion_<método> (puntuación de la fila: la peor de sus variables), más
+outlier_metodos con el número de métodos que marcan la fila. El análisis y
+los revisores leen estas columnas en lugar de volver a detectar outliers.
+Los límites IQR de cada variable se guardan en df.attrs (la caché Parquet
+y pickle los conserva) y el resumen estadístico y los boxplots los
+reutilizan en lugar de volver a calcular los cuartiles.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from instrumentacion import instrumentar
+
+METODOS = ('iqr', 'zscore', 'mad', 'multivariado')
+UMBRALES = {'iqr': 1.5, 'zscore': 3.0, 'mad': 3.5}
+
+# Filas puntuadas a la vez
+TAMANO_LOTE = 100_000
+
+# Filas usadas para ajustar IsolationForest
+MUESTRA_MULTIVARIADO = 100_000
+
+# Índice exportado en el archivo original (Unnamed: 0 tras normalizar_columnas)
+COLUMNAS_EXCLUIDAS = ['unnamed:_0']
+
+COLUMNA_METODOS = 'outlier_metodos'
+
+# Clave de df.attrs con los límites IQR de cada variable puntuada
+ATRIBUTO_LIMITES_IQR = 'limites_iqr'
+
+def columna_marca(metodo):
+    """
+    Nombre de la columna con la marca de outlier de un método
+    """
+    return f"outlier_{metodo}"
+
+def columna_puntuacion(metodo):
+    """
+    Nombre de la columna con la puntuación de un método
+    """
+    return f"puntuacion_{metodo}"
+
+COLUMNAS_RESULTADO = ([columna_marca(m) for m in METODOS] + [columna_puntuacion(m) for m in METODOS]
+                      + [COLUMNA_METODOS])
+
+def columnas_variables(df):
+    """
+    Columnas numéricas del dataset sin las que añade la detección de outliers
+
+    Args:
+        df (pandas.DataFrame): Datos
+
+    Returns:
+        pandas.Index: Columnas numéricas a analizar
+    """
+    columnas = df.select_dtypes(include=[np.number]).columns
+    return columnas.difference(COLUMNAS_RESULTADO, sort=False)
+
+def ajustar_parametros(X):
+    """
+    Estadísticos por columna que usan los métodos univariados
+
+    Args:
+        X (numpy.ndarray): Bloque numérico (filas x columnas), con NaN
+
+    Returns:
+        dict: q1, q3, iqr, media, desv_std, mediana y mad por columna. Las
+            escalas nulas (columnas constantes) quedan como NaN y esas
+            columnas no puntúan con ese método
+    """
+    if len(X) == 0:
+        X = np.full((1, X.shape[1]), np.nan)
+    with warnings.catch_warnings():
+        # Columnas sin ningún valor válido: sus estadísticos quedan como NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        q1, mediana, q3 = np.nanquantile(X, [0.25, 0.5, 0.75], axis=0)
+        media = np.nanmean(X, axis=0)
+        desv_std = np.nanstd(X, axis=0, ddof=1)
+        mad = np.nanmedian(np.abs(X - mediana), axis=0)
+
+    def escala(valores):
+        return np.where(valores > 0, valores, np.nan)
+
+    return {
+        'q1': q1,
+        'q3': q3,
+        'iqr': escala(q3 - q1),
+        'media': media,
+        'desv_std': escala(desv_std),
+        'mediana': mediana,
+        'mad': escala(mad),
+    }
+
+def ajustar_modelo_multivariado(X, parametros, muestra=MUESTRA_MULTIVARIADO, semilla=0):
+    """
+    Ajusta IsolationForest con una muestra de las filas
+
+    Los faltantes se sustituyen por la mediana de su columna.
+
+    Args:
+        X (numpy.ndarray): Bloque numérico
+        parametros (dict): Resultado de ajustar_parametros
+        muestra (int): Filas usadas para el ajuste como máximo
+        semilla (int): Semilla del muestreo y del modelo
+
+    Returns:
+        sklearn.ensemble.IsolationForest: Modelo ajustado, o None si
+            scikit-learn no está instalado o no hay filas
+    """
+    try:
+        from sklearn.ensemble import IsolationForest
+    except ImportError:
+        print("scikit-learn no está instalado: se omite la detección multivariada")
+        return None
+    if len(X) == 0:
+        return None
+
+    generador = np.random.default_rng(semilla)
+    filas = generador.choice(len(X), muestra, replace=False) if len(X) > muestra else slice(None)
+    modelo = IsolationForest(random_state=semilla)
+    modelo.fit(_imputar(X[filas], parametros))
+    return modelo
+
+def _imputar(X, parametros):
+    """
+    Sustituye los NaN por la mediana de su columna (0 si toda es NaN)
+    """
+    relleno = np.nan_to_num(parametros['mediana'])
+    return np.where(np.isnan(X), relleno, X)
+
+def puntuar_lote(X, parametros, modelo=None):
+    """
+    Puntúa un lote de filas con todos los métodos
+
+    Args:
+        X (numpy.ndarray): Lote numérico (filas x columnas)
+        parametros (dict): Resultado de ajustar_parametros
+        modelo: IsolationForest ajustado, o None para omitir el método
+            multivariado
+
+    Returns:
+        dict: Método -> (puntuación por fila, marca por fila)
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fuera = np.maximum(parametros['q1'] - X, X - parametros['q3'])
+        puntuaciones = {
+            'iqr': np.maximum(fuera, 0) / parametros['iqr'],
+            'zscore': np.abs(X - parametros['media']) / parametros['desv_std'],
+            'mad': 0.6745 * np.abs(X - parametros['mediana']) / parametros['mad'],
+        }
+
+    resultado = {}
+    for metodo, por_columna in puntuaciones.items():
+        # La fila puntúa como su peor variable (0 si no tiene ninguna puntuable)
+        puntuacion = np.fmax.reduce(np.nan_to_num(por_columna, nan=0.0), axis=1) if X.shape[1] else \
+            np.zeros(len(X))
+        resultado[metodo] = (puntuacion, puntuacion > UMBRALES[metodo])
+
+    if modelo is not None:
+        # score_samples es el opuesto de la puntuación de anomalía del artículo
+        # original (entre 0 y 1); el modelo marca las que superan -offset_
+        puntuacion = -modelo.score_samples(_imputar(X, parametros))
+        resultado['multivariado'] = (puntuacion, puntuacion > -modelo.offset_)
+    return resultado
+
+@instrumentar
+def puntuar_outliers(df, columnas=None, multivariado=True, tamano_lote=TAMANO_LOTE):
+    """
+    Añade las marcas y puntuaciones de outliers de cada fila
+
+    Args:
+        df (pandas.DataFrame): Datos limpios
+        columnas (list): Variables a puntuar (por defecto las numéricas,
+            sin el índice exportado)
+        multivariado (bool): Incluye IsolationForest si scikit-learn está
+            disponible
+        tamano_lote (int): Filas puntuadas a la vez
+
+    Returns:
+        pandas.DataFrame: Copia de df con las columnas outlier_<método>,
+            puntuacion_<método> y outlier_metodos (sin las del método
+            multivariado si se omite)
+    """
+    print("=" * 50)
+    print("DETECCIÓN DE OUTLIERS")
+    print("=" * 50)
+
+    if columnas is None:
+        columnas = [col for col in columnas_variables(df) if col not in COLUMNAS_EXCLUIDAS]
+    columnas = list(columnas)
+    X = df[columnas].to_numpy(dtype=float)
+
+    parametros = ajustar_parametros(X)
+    modelo = ajustar_modelo_multivariado(X, parametros) if multivariado and columnas else None
+    metodos = [m for m in METODOS if m != 'multivariado' or modelo is not None]
+
+    puntuaciones = {m: np.empty(len(X), dtype=np.float32) for m in metodos}
+    marcas = {m: np.empty(len(X), dtype=bool) for m in metodos}
+    for inicio in range(0, len(X), tamano_lote):
+        lote = slice(inicio, inicio + tamano_lote)
+        for metodo, (puntuacion, marca) in puntuar_lote(X[lote], parametros, modelo).items():
+            puntuaciones[metodo][lote] = puntuacion
+            marcas[metodo][lote] = marca
+
+    df_resultado = df.drop(columns=[c for c in COLUMNAS_RESULTADO if c in df.columns])
+    nuevas = {}
+    for metodo in metodos:
+        nuevas[columna_marca(metodo)] = marcas[metodo]
+    for metodo in metodos:
+        nuevas[columna_puntuacion(metodo)] = puntuaciones[metodo]
+    nuevas[COLUMNA_METODOS] = np.sum([marcas[m] for m in metodos], axis=0, dtype=np.int8) if metodos else \
+        np.zeros(len(X), dtype=np.int8)
+    df_resultado = pd.concat([df_resultado, pd.DataFrame(nuevas, index=df.index)], axis=1)
+    inferior, superior = _limites(parametros)
+    df_resultado.attrs[ATRIBUTO_LIMITES_IQR] = {
+        col: [float(inferior[i]), float(superior[i])] for i, col in enumerate(columnas)}
+
+    print(f"Variables puntuadas: {len(columnas)}")
+    for metodo in metodos:
+        print(f"Filas marcadas por {metodo}: {int(marcas[metodo].sum())}")
+    print(f"Filas marcadas por al menos 2 métodos: {int((nuevas[COLUMNA_METODOS] >= 2).sum())}")
+
+    return df_resultado
+
+def resumen_outliers(df):
+    """
+    Filas marcadas por cada método, leídas de las columnas ya calculadas
+
+    Args:
+        df (pandas.DataFrame): Datos con las columnas de puntuar_outliers
+
+    Returns:
+        dict: Método -> filas marcadas, más 'al_menos_2_metodos'; vacío si
+            los datos no tienen las columnas
+    """
+    resumen = {metodo: int(df[columna_marca(metodo)].sum())
+               for metodo in METODOS if columna_marca(metodo) in df.columns}
+    if resumen and COLUMNA_METODOS in df.columns:
+        resumen['al_menos_2_metodos'] = int((df[COLUMNA_METODOS] >= 2).sum())
+    return resumen
+
+def _limites(parametros):
+    """
+    Límites IQR (inferior, superior) a partir de los cuartiles de ajustar_parametros
+    """
+    iqr = parametros['q3'] - parametros['q1']
+    return parametros['q1'] - UMBRALES['iqr'] * iqr, parametros['q3'] + UMBRALES['iqr'] * iqr
+
+def limites_guardados(df, columnas):
+    """
+    Límites IQR que puntuar_outliers guardó con los datos
+
+    Args:
+        df (pandas.DataFrame): Datos
+        columnas (list): Columnas numéricas
+
+    Returns:
+        tuple: Arrays (inferior, superior, guardado) en el orden de columnas;
+            guardado es False (y los límites NaN) en las columnas que no
+            se puntuaron o si los datos no traen los límites
+    """
+    guardados = df.attrs.get(ATRIBUTO_LIMITES_IQR, {})
+    limites = np.array([guardados.get(col, [np.nan, np.nan]) for col in columnas], dtype=float).reshape(-1, 2)
+    return limites[:, 0], limites[:, 1], np.array([col in guardados for col in columnas], dtype=bool)
+
+def limites_iqr(df, columnas):
+    """
+    Límites IQR de varias columnas
+
+    Usa los límites guardados por puntuar_outliers; los cuartiles solo se
+    calculan (de una vez) para las columnas que no los traen.
+
+    Args:
+        df (pandas.DataFrame): Datos
+        columnas (list): Columnas numéricas
+
+    Returns:
+        pandas.DataFrame: limite_inferior, limite_superior y outliers por columna
+    """
+    X = df[list(columnas)].to_numpy(dtype=float)
+    inferior, superior, guardado = limites_guardados(df, list(columnas))
+    if not guardado.all():
+        inferior[~guardado], superior[~guardado] = _limites(ajustar_parametros(X[:, ~guardado]))
+    return pd.DataFrame({
+        'limite_inferior': inferior,
+        'limite_superior': superior,
+        'outliers': ((X < inferior) | (X > superior)).sum(axis=0),
+    }, index=list(columnas))
@@ -0,0 +1,181 @@
+"""
+Grafo de Etapas - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script decide qué etapas del análisis hay que volver a ejecutar. Cada
+tarea (análisis, cada gráfico, reporte) declara sus salidas y una huella
+calculada a partir del contenido de sus entradas: los datos, el código que
+la genera y sus parámetros. Las huellas de las tareas de las que depende
+forman parte de la suya, así que un cambio se propaga hacia abajo en el grafo.
+
+El manifiesto (reports/manifiesto_etapas.json) guarda la huella y el
+tamaño y fecha de cada salida de la última ejecución correcta de cada tarea.
+Una tarea está al día si su huella no cambió y sus salidas siguen intactas.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+
+import cache_datos
+
+DIRECTORIO_SCRIPTS = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO_PROYECTO = os.path.dirname(DIRECTORIO_SCRIPTS)
+RUTA_MANIFIESTO = os.path.join(DIRECTORIO_PROYECTO, 'reports', 'manifiesto_etapas.json')
+
+def huella(*partes):
+    """
+    Combina valores serializables en JSON en una huella SHA-256
+
+    Args:
+        *partes: Textos, números, listas o diccionarios
+
+    Returns:
+        str: Hash hexadecimal
+    """
+    texto = json.dumps(partes, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+def huella_archivos(rutas):
+    """
+    Huella del contenido de varios archivos
+
+    Args:
+        rutas (list): Rutas a los archivos
+
+    Returns:
+        str: Hash hexadecimal (los archivos inexistentes cuentan como vacíos)
+    """
+    return huella([
+        (os.path.basename(ruta), cache_datos.huella_archivo(ruta) if os.path.exists(ruta) else None)
+        for ruta in rutas
+    ])
+
+def huella_funcion(funcion, funciones_excluidas=()):
+    """
+    Huella del código de una función y de la parte común de su módulo
+
+    La parte común es el módulo sin el código de las funciones excluidas.
+    Así, si se excluyen las demás funciones de gráficos, cambiar un
+    gráfico no invalida los otros, pero cambiar un auxiliar compartido
+    (estilo, DPI, guardar_figura...) los invalida todos.
+
+    Args:
+        funcion (callable): Función de la tarea
+        funciones_excluidas (list): Funciones del mismo módulo cuyo código
+            no forma parte de la parte común
+
+    Returns:
+        str: Hash hexadecimal
+    """
+    modulo = inspect.getsource(inspect.getmodule(funcion))
+    for otra in funciones_excluidas:
+        modulo = modulo.replace(inspect.getsource(otra), '')
+    return huella(modulo, inspect.getsource(funcion))
+
+def cargar_manifiesto(ruta=RUTA_MANIFIESTO):
+    """
+    Carga el manifiesto de la última ejecución
+
+    Args:
+        ruta (str): Ruta del manifiesto
+
+    Returns:
+        dict: Tarea -> {'huella': str, 'salidas': {ruta: [tamaño, fecha_ns]}}
+    """
+    try:
+        with open(ruta, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def guardar_manifiesto(manifiesto, ruta=RUTA_MANIFIESTO):
+    """
+    Guarda el manifiesto de forma atómica
+
+    Args:
+        manifiesto (dict): Manifiesto a guardar
+        ruta (str): Ruta del manifiesto
+    """
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(manifiesto, f, indent=1, ensure_ascii=False)
+    os.replace(temporal, ruta)
+
+def _estado_archivo(ruta):
+    """
+    Tamaño y fecha de modificación de un archivo, o None si no existe
+    """
+    try:
+        estado = os.stat(ruta)
+    except FileNotFoundError:
+        return None
+    return [estado.st_size, estado.st_mtime_ns]
+
+def esta_al_dia(manifiesto, nombre, huella_tarea):
+    """
+    Indica si una tarea puede omitirse
+
+    Args:
+        manifiesto (dict): Manifiesto de la última ejecución
+        nombre (str): Nombre de la tarea
+        huella_tarea (str): Huella actual de sus entradas
+
+    Returns:
+        bool: True si la huella coincide y todas las salidas registradas
+            siguen como quedaron (existiendo sin modificaciones, o
+            ausentes si la tarea no escribió ninguna)
+    """
+    entrada = manifiesto.get(nombre)
+    if entrada is None or entrada['huella'] != huella_tarea:
+        return False
+    return all(_estado_archivo(ruta) == estado for ruta, estado in entrada['salidas'].items())
+
+def registrar_tarea(manifiesto, nombre, huella_tarea, salidas, opcionales=()):
+    """
+    Registra en el manifiesto una tarea ejecutada correctamente
+
+    Si falta alguna de las salidas obligatorias la tarea no se registra y
+    se volverá a ejecutar la próxima vez (por ejemplo un gráfico opcional
+    que falló: visualizations borra las salidas de cada gráfico antes de
+    generarlo, así que un fallo no deja archivos antiguos). Las salidas
+    opcionales solo se escriben según los datos (el gráfico de faltantes
+    cuando hay valores faltantes, la dispersión 3D con al menos tres
+    variables); si faltan se registra su ausencia, que debe mantenerse
+    para seguir al día.
+
+    Args:
+        manifiesto (dict): Manifiesto a actualizar
+        nombre (str): Nombre de la tarea
+        huella_tarea (str): Huella de sus entradas
+        salidas (list): Rutas de sus salidas declaradas
+        opcionales (list): Rutas de salidas que la tarea puede no escribir
+
+    Returns:
+        bool: True si la tarea quedó registrada
+    """
+    estados = {ruta: _estado_archivo(ruta) for ruta in salidas}
+    if any(estado is None and ruta not in opcionales for ruta, estado in estados.items()):
+        manifiesto.pop(nombre, None)
+        return False
+    manifiesto[nombre] = {'huella': huella_tarea, 'salidas': estados}
+    return True
+
+def tareas_pendientes(tareas, manifiesto, forzar=False):
+    """
+    Filtra las tareas que hay que volver a ejecutar
+
+    Args:
+        tareas (list): Diccionarios con 'nombre' y 'huella'
+        manifiesto (dict): Manifiesto de la última ejecución
+        forzar (bool): Considera pendientes todas las tareas
+
+    Returns:
+        list: Tareas pendientes, en el mismo orden
+    """
+    if forzar:
+        return list(tareas)
+    return [t for t in tareas if not esta_al_dia(manifiesto, t['nombre'], t['huella'])]
@@ -0,0 +1,237 @@
+"""
+Imputación de Valores Faltantes - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script calcula todos los valores de relleno en una sola pasada
+(medianas de las columnas numéricas sobre el bloque completo y modas de las
+de texto a partir de un único conteo de códigos) y los aplica con una sola
+llamada a DataFrame.fillna sobre el diccionario de valores, en lugar de
+encadenar df[col].fillna(..., inplace=True) columna a columna (que en
+pandas 2.x copia los datos y está obsoleto).
+
+Además admite dos rellenos más específicos, que tienen prioridad sobre el
+valor global:
+
+- Por grupo: la mediana del grupo de la fila (por ejemplo el precio
+  mediano de su marca), con un único transform agrupado por clave
+- Por vecinos: KNNImputer de scikit-learn sobre las columnas de
+  especificaciones. Los vecinos se buscan en una muestra acotada de filas
+  completas y solo se procesan, por lotes, las combinaciones distintas de
+  valores de las filas con faltantes, de modo que el coste no crece con el
+  cuadrado del número de filas
+
+Lo que ninguno de los dos cubre (grupos sin datos, filas sin vecinos) se
+rellena con el valor global.
+"""
+
+import numpy as np
+import pandas as pd
+
+from instrumentacion import instrumentar
+
+# Columna -> columna de agrupación cuya mediana se usa como relleno
+IMPUTACION_POR_GRUPO = {'precio': 'marca'}
+
+# Columnas de especificaciones que puede rellenar el imputador por vecinos
+COLUMNAS_VECINOS = ['ram_gb', 'almacenamiento_gb', 'pantalla_pulgadas', 'resolucion_ancho', 'resolucion_alto',
+                    'densidad_ppi', 'nucleos', 'hilos', 'generacion_cpu']
+# Variables que solo se usan para medir la distancia entre filas
+COLUMNAS_REFERENCIA_VECINOS = ['precio']
+
+# Filas completas entre las que se buscan vecinos y filas imputadas a la vez
+MUESTRA_VECINOS = 5_000
+TAMANO_LOTE = 10_000
+
+def moda(serie):
+    """
+    Valor más frecuente de una columna con un único conteo de códigos
+
+    En caso de empate devuelve el menor, igual que Series.mode()[0].
+
+    Args:
+        serie (pandas.Series): Columna
+
+    Returns:
+        Valor más frecuente, o None si la columna no tiene valores
+    """
+    codigos, valores = pd.factorize(serie, sort=True)
+    codigos = codigos[codigos >= 0]
+    if len(codigos) == 0:
+        return None
+    return valores[np.bincount(codigos, minlength=len(valores)).argmax()]
+
+def calcular_valores_imputacion(df, faltantes=None):
+    """
+    Valores de relleno globales de todas las columnas con faltantes
+
+    Args:
+        df (pandas.DataFrame): Datos
+        faltantes (pandas.Series): Faltantes por columna, si ya se contaron
+
+    Returns:
+        tuple: (medianas de las columnas numéricas, modas de las de texto),
+            como diccionarios columna -> valor
+    """
+    if faltantes is None:
+        faltantes = df.isnull().sum()
+    con_faltantes = faltantes.index[faltantes > 0]
+    tipos = df.dtypes[con_faltantes]
+
+    numericas = [col for col, tipo in tipos.items()
+                 if pd.api.types.is_numeric_dtype(tipo) and not pd.api.types.is_bool_dtype(tipo)]
+    medianas = df[numericas].median().dropna().to_dict() if numericas else {}
+
+    texto = [col for col, tipo in tipos.items() if tipo == object]
+    modas = {col: valor for col in texto if (valor := moda(df[col])) is not None}
+    return medianas, modas
+
+def rellenos_por_grupo(df, reglas=IMPUTACION_POR_GRUPO, faltantes=None):
+    """
+    Mediana del grupo de cada fila para las columnas con regla de grupo
+
+    Las columnas que comparten clave se agrupan juntas en un solo transform.
+
+    Args:
+        df (pandas.DataFrame): Datos
+        reglas (dict): Columna -> columna de agrupación
+        faltantes (pandas.Series): Faltantes por columna, si ya se contaron
+
+    Returns:
+        dict: Columna -> pandas.Series con el relleno de cada fila (NaN si
+            su grupo no tiene valores)
+    """
+    if faltantes is None:
+        faltantes = df.isnull().sum()
+    por_clave = {}
+    for columna, grupo in reglas.items():
+        if columna in df.columns and grupo in df.columns and faltantes.get(columna, 0) > 0:
+            por_clave.setdefault(grupo, []).append(columna)
+
+    rellenos = {}
+    for grupo, columnas in por_clave.items():
+        medianas = df.groupby(grupo, observed=True, sort=False)[columnas].transform('median')
+        rellenos.update({col: medianas[col] for col in columnas})
+    return rellenos
+
+def rellenos_por_vecinos(df, columnas=COLUMNAS_VECINOS, referencias=COLUMNAS_REFERENCIA_VECINOS, vecinos=5,
+                         muestra=MUESTRA_VECINOS, tamano_lote=TAMANO_LOTE, semilla=0):
+    """
+    Rellena las especificaciones faltantes con la media de las filas más parecidas
+
+    Las variables se estandarizan antes de medir distancias. Las columnas
+    cuyos valores son todos enteros (núcleos, RAM...) se redondean.
+
+    Args:
+        df (pandas.DataFrame): Datos
+        columnas (list): Columnas a rellenar
+        referencias (list): Columnas que solo se usan para la distancia
+        vecinos (int): Número de vecinos
+        muestra (int): Filas completas entre las que se buscan vecinos
+        tamano_lote (int): Combinaciones de valores imputadas a la vez
+        semilla (int): Semilla del muestreo
+
+    Returns:
+        pandas.DataFrame: Relleno de las filas con faltantes (índice de
+            esas filas), o None si scikit-learn no está instalado o no hay
+            filas completas
+    """
+    try:
+        from sklearn.impute import KNNImputer
+    except ImportError:
+        print("scikit-learn no está instalado: se omite la imputación por vecinos")
+        return None
+
+    columnas = [col for col in columnas if col in df.columns]
+    variables = columnas + [col for col in referencias if col in df.columns and col not in columnas]
+    X = df[variables].to_numpy(dtype=float)
+    incompletas = np.flatnonzero(np.isnan(X[:, :len(columnas)]).any(axis=1))
+    completas = np.flatnonzero(~np.isnan(X).any(axis=1))
+    if len(incompletas) == 0 or len(completas) == 0:
+        return None
+
+    generador = np.random.default_rng(semilla)
+    if len(completas) > muestra:
+        completas = np.sort(generador.choice(completas, muestra, replace=False))
+
+    # Estandarizar para que ninguna variable domine la distancia
+    media = np.nanmean(X, axis=0)
+    escala = np.nanstd(X, axis=0)
+    escala = np.where(escala > 0, escala, 1.0)
+    imputador = KNNImputer(n_neighbors=vecinos).fit((X[completas] - media) / escala)
+
+    # Cada combinación distinta de valores (con sus faltantes) se imputa una vez
+    consultas = np.where(np.isnan(X[incompletas]), np.inf, X[incompletas])
+    distintas, inversa = np.unique(consultas, axis=0, return_inverse=True)
+    distintas[np.isinf(distintas)] = np.nan
+
+    imputados = np.empty(distintas.shape)
+    for inicio in range(0, len(distintas), tamano_lote):
+        lote = distintas[inicio:inicio + tamano_lote]
+        imputados[inicio:inicio + len(lote)] = imputador.transform((lote - media) / escala)
+    imputados = imputados[inversa.ravel(), :len(columnas)] * escala[:len(columnas)] + media[:len(columnas)]
+
+    resultado = pd.DataFrame(imputados, index=df.index[incompletas], columns=columnas)
+    for col in columnas:
+        valores = df[col].dropna()
+        if len(valores) and np.array_equal(valores, np.round(valores)):
+            resultado[col] = resultado[col].round()
+    # Solo se rellenan las posiciones que faltaban
+    return resultado.where(df[columnas].iloc[incompletas].isna())
+
+@instrumentar
+def imputar_faltantes(df, reglas_por_grupo=IMPUTACION_POR_GRUPO, vecinos=None, faltantes=None):
+    """
+    Rellena todos los valores faltantes (modifica df)
+
+    Prioridad: mediana del grupo (reglas_por_grupo), vecinos más cercanos
+    (si vecinos no es None) y, para el resto, mediana global (numéricas) o
+    moda (texto).
+
+    Args:
+        df (pandas.DataFrame): Datos con faltantes
+        reglas_por_grupo (dict): Columna -> columna de agrupación
+        vecinos (int): Número de vecinos para las columnas de
+            especificaciones (None para no usar el imputador por vecinos)
+        faltantes (pandas.Series): Faltantes por columna, si ya se contaron
+
+    Returns:
+        dict: Columna -> método con el que se rellenó
+    """
+    if faltantes is None:
+        faltantes = df.isnull().sum()
+    medianas, modas = calcular_valores_imputacion(df, faltantes)
+    reglas_por_grupo = reglas_por_grupo or {}
+    metodos = {}
+
+    rellenos = rellenos_por_grupo(df, reglas_por_grupo, faltantes)
+    for col in rellenos:
+        metodos[col] = f"mediana por {reglas_por_grupo[col]}"
+
+    if vecinos:
+        por_vecinos = rellenos_por_vecinos(df, vecinos=vecinos)
+        if por_vecinos is not None:
+            for col in por_vecinos.columns:
+                if col not in rellenos and faltantes[col] > 0:
+                    rellenos[col] = por_vecinos[col]
+                    metodos[col] = f"{vecinos} vecinos más cercanos"
+
+    for col in rellenos:
+        print(f"Valores faltantes en {col} ({faltantes[col]}) reemplazados con: {metodos[col]}")
+    # Valores globales para lo que no cubren los rellenos anteriores
+    for col, mediana in medianas.items():
+        metodos.setdefault(col, 'mediana')
+        if col not in rellenos:
+            print(f"Valores faltantes en {col} reemplazados con mediana: {mediana}")
+    for col, valor in modas.items():
+        metodos[col] = 'moda'
+        try:
+            print(f"Valores faltantes en {col} reemplazados con moda: {valor}")
+        except UnicodeEncodeError:
+            print(f"Valores faltantes en {col} reemplazados con moda")
+
+    if rellenos:
+        df.fillna(pd.DataFrame(rellenos, index=df.index), inplace=True)
+    if medianas or modas:
+        df.fillna({**medianas, **modas}, inplace=True)
+    return metodos
@@ -0,0 +1,295 @@
+"""
+Instrumentación de Etapas - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script registra el tiempo real, el tiempo de CPU, el pico de memoria
+residente (RSS) y las filas por segundo de cada etapa del análisis y de sus
+funciones principales, en un registro JSON lines (una línea por medición).
+
+El pico de RSS es el de cada bloque medido, no el acumulado del proceso: se
+muestrea la memoria del bloque (o se toma el pico exacto del proceso si el
+bloque lo supera), y las etapas que se ejecutan como subprocesos toman el
+pico de ese subproceso al esperarlo. Donde no se puede muestrear, se
+registra el pico acumulado del proceso con otro nombre (rss_pico_proceso_mb).
+
+El registro se activa con configurar_registro(), que guarda la ruta en una
+variable de entorno: así los scripts lanzados como subprocesos y los
+procesos que generan gráficos escriben en el mismo archivo. Sin registro
+activo, las funciones decoradas se ejecutan sin ningún coste añadido.
+"""
+
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Variables de entorno compartidas con los subprocesos
+VARIABLE_REGISTRO = 'EDA_REGISTRO_METRICAS'
+VARIABLE_EJECUCION = 'EDA_ID_EJECUCION'
+
+def configurar_registro(ruta_registro, id_ejecucion=None):
+    """
+    Activa el registro de métricas para este proceso y sus subprocesos
+
+    Args:
+        ruta_registro (str): Archivo JSON lines donde se añaden las mediciones
+        id_ejecucion (str): Identificador común de todas las mediciones de
+            la ejecución (por defecto, la fecha y hora actuales)
+
+    Returns:
+        str: Identificador de la ejecución
+    """
+    id_ejecucion = id_ejecucion or datetime.now().strftime('%Y%m%d_%H%M%S')
+    directorio = os.path.dirname(os.path.abspath(ruta_registro))
+    os.makedirs(directorio, exist_ok=True)
+    os.environ[VARIABLE_REGISTRO] = os.path.abspath(ruta_registro)
+    os.environ[VARIABLE_EJECUCION] = id_ejecucion
+    return id_ejecucion
+
+def registro_activo():
+    """
+    Indica si hay un registro de métricas configurado
+
+    Returns:
+        bool: True si las mediciones se están guardando
+    """
+    return VARIABLE_REGISTRO in os.environ
+
+def _ru_maxrss_mb(maximo):
+    """
+    Convierte ru_maxrss a MB (Linux lo devuelve en KB y macOS en bytes)
+    """
+    return maximo / 1024 ** 2 if sys.platform == 'darwin' else maximo / 1024
+
+def pico_rss_mb():
+    """
+    Devuelve el pico de memoria residente de este proceso
+
+    Es el pico acumulado desde el inicio del proceso.
+
+    Returns:
+        float: Pico de RSS en MB, o None si el sistema no lo permite
+    """
+    if resource is None:
+        return None
+    return _ru_maxrss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+# Cada cuántos segundos se muestrea la memoria residente de un bloque medido
+INTERVALO_MUESTREO_RSS = 0.01
+
+def _rss_actual_mb():
+    """
+    Memoria residente actual del proceso (Linux), o None
+    """
+    try:
+        with open('/proc/self/statm', encoding='ascii') as f:
+            paginas = int(f.read().split()[1])
+        return paginas * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+def _muestrear_rss(medicion):
+    """
+    Anota el máximo de RSS del bloque hasta que se pide parar
+    """
+    while not medicion['parar'].wait(INTERVALO_MUESTREO_RSS):
+        medicion['pico'] = max(medicion['pico'], _rss_actual_mb() or 0.0)
+
+def iniciar_pico_rss():
+    """
+    Empieza a medir el pico de memoria residente de un bloque de código
+
+    El pico del proceso (ru_maxrss) no se puede reiniciar sin perder el del
+    proceso completo, así que la RSS del bloque se muestrea en un hilo cada
+    INTERVALO_MUESTREO_RSS segundos. Si el bloque supera el pico anterior
+    del proceso, terminar_pico_rss usa el valor exacto de ru_maxrss.
+
+    Returns:
+        dict: Medición en curso para terminar_pico_rss
+    """
+    actual = _rss_actual_mb()
+    medicion = {'pico_proceso_inicio': pico_rss_mb(), 'pico': actual, 'hilo': None}
+    if actual is not None:
+        medicion['parar'] = threading.Event()
+        medicion['hilo'] = threading.Thread(target=_muestrear_rss, args=(medicion,), daemon=True)
+        medicion['hilo'].start()
+    return medicion
+
+def terminar_pico_rss(medicion):
+    """
+    Termina la medición empezada con iniciar_pico_rss
+
+    Args:
+        medicion (dict): Resultado de iniciar_pico_rss
+
+    Returns:
+        dict: {'rss_pico_mb': pico del bloque} o, si no se puede medir por
+            bloque, {'rss_pico_proceso_mb': pico acumulado del proceso}
+    """
+    if medicion['hilo'] is not None:
+        medicion['parar'].set()
+        medicion['hilo'].join()
+        medicion['pico'] = max(medicion['pico'], _rss_actual_mb() or 0.0)
+
+    pico_proceso = pico_rss_mb()
+    inicio = medicion['pico_proceso_inicio']
+    if pico_proceso is not None and inicio is not None and pico_proceso > inicio:
+        # El bloque marcó un nuevo pico del proceso: es su pico exacto
+        return {'rss_pico_mb': round(pico_proceso, 1)}
+    if medicion['hilo'] is not None:
+        return {'rss_pico_mb': round(medicion['pico'], 1)}
+    return {'rss_pico_proceso_mb': round(pico_proceso, 1) if pico_proceso is not None else None}
+
+def esperar_proceso(proceso):
+    """
+    Espera a un subproceso y devuelve su código de salida y su pico de RSS
+
+    Args:
+        proceso (subprocess.Popen): Subproceso en marcha
+
+    Returns:
+        tuple: (código de salida, pico de RSS en MB del subproceso o de sus
+            propios subprocesos, o None si el sistema no lo permite)
+    """
+    if not hasattr(os, 'wait4'):
+        return proceso.wait(), None
+    _, estado, uso = os.wait4(proceso.pid, 0)
+    proceso.returncode = os.waitstatus_to_exitcode(estado)
+    return proceso.returncode, round(_ru_maxrss_mb(uso.ru_maxrss), 1)
+
+def _cpu_hijos():
+    """
+    Tiempo de CPU consumido por los subprocesos terminados (y esperados)
+    """
+    if resource is None:
+        return 0.0
+    uso = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return uso.ru_utime + uso.ru_stime
+
+def registrar(medicion):
+    """
+    Añade una medición al registro activo
+
+    Args:
+        medicion (dict): Métricas a guardar
+    """
+    ruta = os.environ.get(VARIABLE_REGISTRO)
+    if ruta is None:
+        return
+    medicion = {
+        'id_ejecucion': os.environ.get(VARIABLE_EJECUCION),
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'pid': os.getpid(),
+        **medicion,
+    }
+    # Una sola escritura por línea para que los procesos no se mezclen
+    with open(ruta, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(medicion, ensure_ascii=False, default=str) + '\n')
+
+@contextmanager
+def medir(nombre, nivel='etapa', filas=None, subproceso=False, ruta_perfil=None):
+    """
+    Mide un bloque de código y guarda la medición en el registro
+
+    El bloque puede completar o corregir las filas procesadas asignando
+    medicion['filas'] sobre el diccionario que devuelve el contexto.
+
+    Args:
+        nombre (str): Nombre de la etapa o función
+        nivel (str): 'etapa' o 'funcion'
+        filas (int): Filas procesadas, si se conocen de antemano
+        subproceso (bool): El trabajo lo hace un subproceso; el bloque
+            asigna medicion['rss_pico_mb'] con el pico de ese subproceso (ver
+            esperar_proceso). El tiempo de CPU incluye siempre el de los
+            subprocesos terminados durante el bloque
+        ruta_perfil (str): Si se indica, guarda un perfil de cProfile del bloque
+
+    Yields:
+        dict: Medición en curso
+    """
+    medicion = {'nivel': nivel, 'nombre': nombre, 'filas': filas}
+    perfil = cProfile.Profile() if ruta_perfil else None
+
+    pico = None if subproceso else iniciar_pico_rss()
+    cpu_inicio = time.process_time() + _cpu_hijos()
+    inicio = time.perf_counter()
+    if perfil:
+        perfil.enable()
+    try:
+        yield medicion
+        medicion['ok'] = True
+    except BaseException as e:
+        medicion['ok'] = False
+        medicion['error'] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        if perfil:
+            perfil.disable()
+            os.makedirs(os.path.dirname(os.path.abspath(ruta_perfil)), exist_ok=True)
+            perfil.dump_stats(ruta_perfil)
+            medicion['perfil'] = ruta_perfil
+
+        segundos = time.perf_counter() - inicio
+        cpu = time.process_time() + _cpu_hijos() - cpu_inicio
+        medicion['segundos'] = round(segundos, 4)
+        medicion['cpu_segundos'] = round(cpu, 4)
+        if pico is None:
+            medicion.setdefault('rss_pico_mb', None)
+        else:
+            medicion.update(terminar_pico_rss(pico))
+        if medicion['filas'] and segundos > 0:
+            medicion['filas_por_segundo'] = round(medicion['filas'] / segundos)
+        registrar(medicion)
+
+def _filas_de(valor):
+    """
+    Filas de un DataFrame o Series, o None para cualquier otro valor
+    """
+    # pandas no se importa aquí para no cargarlo en run_analysis; si no está
+    # cargado, el valor no puede ser un DataFrame
+    pd = sys.modules.get('pandas')
+    if pd is not None and isinstance(valor, (pd.DataFrame, pd.Series)):
+        return len(valor)
+    return None
+
+def instrumentar(funcion):
+    """
+    Decorador que mide una función principal cuando hay un registro activo
+
+    Las filas procesadas se toman del primer DataFrame de los argumentos o,
+    si no hay ninguno (por ejemplo al cargar datos), del resultado.
+
+    Args:
+        funcion (callable): Función a medir
+
+    Returns:
+        callable: Función decorada
+    """
+    # Se usa el nombre del archivo: al ejecutar un script su módulo es __main__
+    modulo = os.path.splitext(os.path.basename(funcion.__code__.co_filename))[0]
+    nombre = f"{modulo}.{funcion.__name__}"
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if not registro_activo():
+            return funcion(*args, **kwargs)
+
+        filas = next((_filas_de(a) for a in (*args, *kwargs.values()) if _filas_de(a) is not None), None)
+        with medir(nombre, nivel='funcion', filas=filas) as medicion:
+            resultado = funcion(*args, **kwargs)
+            if medicion['filas'] is None:
+                medicion['filas'] = _filas_de(resultado)
+        return resultado
+
+    return envoltura
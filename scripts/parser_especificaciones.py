@@ -0,0 +1,230 @@
+"""
+Parser de Especificaciones - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script convierte los campos de texto del dataset (precio, RAM,
+almacenamiento, pantalla, núcleos y generación) en columnas numéricas
+tipadas y extrae la marca del modelo. Cada patrón se aplica una sola vez
+sobre los valores únicos de la columna y el resultado se propaga a todas
+las filas mediante los códigos de pd.factorize, porque estas columnas
+tienen muy pocos valores distintos comparados con el número de filas.
+"""
+
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+# Patrones compilados (el texto se normaliza antes: espacios finos -> espacio)
+PATRON_PRECIO = re.compile(r'([\d,]+(?:\.\d+)?)')
+PATRON_RAM = re.compile(r'^(?P<ram_gb>\d+(?:\.\d+)?)\s*GB\b(?P<resto>.*)\bRAM\b', re.IGNORECASE)
+PATRON_TIPO_RAM = re.compile(r'\b((?:LP)?DDR\d+X?)\b', re.IGNORECASE)
+PATRON_ALMACENAMIENTO = re.compile(
+    r'^(?P<cantidad>\d+(?:\.\d+)?)\s*(?P<unidad>GB|TB)\s+(?:SSD|Hard Disk|HDD|EMMC)\b', re.IGNORECASE)
+PATRON_PANTALLA = re.compile(
+    r'(?P<pulgadas>\d+(?:\.\d+)?)\s*inch(?:es)?'
+    r'(?:.*?(?P<ancho>\d{3,4})\s*x\s*(?P<alto>\d{3,4})\s*pixels)?', re.IGNORECASE)
+PATRON_NUCLEOS = re.compile(r'\b(?:(?P<palabra>Dual|Quad|Hexa|Octa)\s+Core|(?P<numero>\d+)\s+Cores?)\b',
+                            re.IGNORECASE)
+PATRON_HILOS = re.compile(r'(\d+)\s+Threads?\b', re.IGNORECASE)
+PATRON_GENERACION = re.compile(r'\b(\d+)(?:st|nd|rd|th)\s+Gen\b', re.IGNORECASE)
+
+NUCLEOS_POR_PALABRA = {'dual': 2, 'quad': 4, 'hexa': 6, 'octa': 8}
+
+def _sin_caracteres_formato(texto):
+    """
+    Quita los caracteres invisibles de formato (categoría Unicode Cf, como
+    la marca de izquierda a derecha U+200E que aparece en los datos)
+    """
+    return ''.join(c for c in texto if unicodedata.category(c) != 'Cf')
+
+def _normalizar_texto(valores):
+    """
+    Normaliza espacios (los datos usan espacios finos U+2009) y quita los
+    caracteres de formato en valores únicos
+
+    Args:
+        valores (pandas.Series): Valores únicos de texto
+
+    Returns:
+        pandas.Series: Valores con espacios simples, sin bordes ni
+            caracteres de formato
+    """
+    # En Python 3 \s también reconoce los espacios Unicode como U+2009
+    return (valores.astype(str).map(_sin_caracteres_formato)
+            .str.replace(r'\s+', ' ', regex=True).str.strip())
+
+def parsear_precio(valores):
+    """
+    Convierte precios como '₹1,39,990' en números
+
+    Args:
+        valores (pandas.Series): Valores únicos de texto
+
+    Returns:
+        pandas.DataFrame: Columna precio
+    """
+    numeros = valores.str.extract(PATRON_PRECIO, expand=False).str.replace(',', '', regex=False)
+    return pd.DataFrame({'precio': pd.to_numeric(numeros, errors='coerce')})
+
+def parsear_ram(valores):
+    """
+    Convierte textos como '8 GB DDR4 RAM' en cantidad y tipo de memoria
+
+    Args:
+        valores (pandas.Series): Valores únicos de texto
+
+    Returns:
+        pandas.DataFrame: Columnas ram_gb y ram_tipo
+    """
+    partes = valores.str.extract(PATRON_RAM)
+    tipo = partes['resto'].str.extract(PATRON_TIPO_RAM, expand=False).str.upper()
+    return pd.DataFrame({
+        'ram_gb': pd.to_numeric(partes['ram_gb'], errors='coerce'),
+        'ram_tipo': tipo,
+    })
+
+def parsear_almacenamiento(valores):
+    """
+    Convierte textos como '512 GB SSD' o '1 TB SSD' en gigabytes
+
+    Args:
+        valores (pandas.Series): Valores únicos de texto
+
+    Returns:
+        pandas.DataFrame: Columna almacenamiento_gb
+    """
+    partes = valores.str.extract(PATRON_ALMACENAMIENTO)
+    cantidad = pd.to_numeric(partes['cantidad'], errors='coerce')
+    factor = np.where(partes['unidad'].str.upper() == 'TB', 1024, 1)
+    return pd.DataFrame({'almacenamiento_gb': cantidad * factor})
+
+def parsear_pantalla(valores):
+    """
+    Convierte textos como '15.6 inches, 1920 x 1080 pixels' en tamaño,
+    resolución y densidad de píxeles
+
+    Args:
+        valores (pandas.Series): Valores únicos de texto
+
+    Returns:
+        pandas.DataFrame: Columnas pantalla_pulgadas, resolucion_ancho,
+            resolucion_alto y densidad_ppi
+    """
+    partes = valores.str.extract(PATRON_PANTALLA)
+    pulgadas = pd.to_numeric(partes['pulgadas'], errors='coerce')
+    ancho = pd.to_numeric(partes['ancho'], errors='coerce')
+    alto = pd.to_numeric(partes['alto'], errors='coerce')
+    return pd.DataFrame({
+        'pantalla_pulgadas': pulgadas,
+        'resolucion_ancho': ancho,
+        'resolucion_alto': alto,
+        'densidad_ppi': np.sqrt(ancho ** 2 + alto ** 2) / pulgadas,
+    })
+
+def parsear_nucleos(valores):
+    """
+    Convierte textos como 'Hexa Core, 12 Threads' en núcleos e hilos
+
+    Args:
+        valores (pandas.Series): Valores únicos de texto
+
+    Returns:
+        pandas.DataFrame: Columnas nucleos e hilos
+    """
+    partes = valores.str.extract(PATRON_NUCLEOS)
+    nucleos = pd.to_numeric(partes['numero'], errors='coerce')
+    nucleos = nucleos.fillna(partes['palabra'].str.lower().map(NUCLEOS_POR_PALABRA))
+    hilos = pd.to_numeric(valores.str.extract(PATRON_HILOS, expand=False), errors='coerce')
+    return pd.DataFrame({'nucleos': nucleos, 'hilos': hilos})
+
+def parsear_generacion(valores):
+    """
+    Convierte textos como '12th Gen Intel Core i5 1235U' en la generación del CPU
+
+    Args:
+        valores (pandas.Series): Valores únicos de texto
+
+    Returns:
+        pandas.DataFrame: Columna generacion_cpu
+    """
+    generacion = valores.str.extract(PATRON_GENERACION, expand=False)
+    return pd.DataFrame({'generacion_cpu': pd.to_numeric(generacion, errors='coerce')})
+
+def parsear_marca(valores):
+    """
+    Extrae la marca: la primera palabra del modelo
+
+    Es la única definición de la marca; cubo_precios.marca_desde_modelo
+    (usada también por servicio_consultas) la aplica con parsear_columna.
+
+    Args:
+        valores (pandas.Series): Valores únicos de la columna Model
+
+    Returns:
+        pandas.DataFrame: Columna marca
+    """
+    return pd.DataFrame({'marca': valores.str.split(n=1).str[0]})
+
+# Columna de origen (nombre normalizado) -> función de parseo
+PARSERS = {
+    'model': parsear_marca,
+    'price': parsear_precio,
+    'ram': parsear_ram,
+    'ssd': parsear_almacenamiento,
+    'display': parsear_pantalla,
+    'core': parsear_nucleos,
+    'generation': parsear_generacion,
+}
+
+def parsear_columna(serie, parser):
+    """
+    Aplica un parser sobre los valores únicos de una serie y lo propaga
+
+    Args:
+        serie (pandas.Series): Columna de texto original
+        parser (callable): Función que recibe valores únicos normalizados
+
+    Returns:
+        pandas.DataFrame: Columnas parseadas, alineadas con el índice de la serie
+    """
+    codigos, unicos = pd.factorize(serie)
+    resultado = parser(_normalizar_texto(pd.Series(unicos, dtype=object)))
+
+    # Fila extra de valores nulos para los códigos -1 (valores faltantes)
+    nulos = pd.DataFrame({col: [np.nan] for col in resultado.columns})
+    resultado = pd.concat([resultado, nulos], ignore_index=True)
+    resultado = resultado.take(np.where(codigos < 0, len(unicos), codigos))
+    resultado.index = serie.index
+    return resultado
+
+def parsear_especificaciones(df):
+    """
+    Añade al DataFrame las columnas numéricas derivadas de las especificaciones
+
+    Las columnas de origen se localizan por su nombre normalizado (minúsculas,
+    sin espacios), así que funciona antes y después de normalizar_columnas.
+    Una columna de origen sin ningún valor (pandas la lee como float64, por
+    ejemplo en un bloque de limpiar_por_bloques) también produce sus
+    columnas, con todos los valores faltantes.
+
+    Args:
+        df (pandas.DataFrame): DataFrame con las columnas de texto originales
+
+    Returns:
+        pandas.DataFrame: DataFrame con las nuevas columnas añadidas
+    """
+    nombres = {col.strip().lower().replace(' ', '_'): col for col in df.columns}
+
+    nuevas = []
+    for origen, parser in PARSERS.items():
+        columna = df[nombres[origen]] if origen in nombres else None
+        if columna is not None and (columna.dtype == 'object' or columna.isna().all()):
+            nuevas.append(parsear_columna(columna, parser))
+
+    if not nuevas:
+        return df
+    nuevas = pd.concat(nuevas, axis=1)
+    return pd.concat([df, nuevas.drop(columns=[c for c in nuevas.columns if c in df.columns])], axis=1)
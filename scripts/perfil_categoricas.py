@@ -0,0 +1,111 @@
+"""
+Perfil de Variables Categóricas - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script calcula en una sola pasada el perfil de cada variable
+categórica: número de categorías, conteos y frecuencias de las más
+comunes, faltantes y entropía. Cada columna se factoriza una vez y sus
+códigos se cuentan con np.bincount; todo lo demás se deriva de esos
+conteos, en lugar de llamar a value_counts() y nunique() por separado en
+cada etapa.
+
+Las columnas se procesan en paralelo con hilos (la factorización y el
+conteo se hacen en código compilado) y solo se conservan las top_k
+categorías, de modo que columnas casi únicas como model no generan tablas
+del tamaño del dataset.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Categorías conservadas por columna
+TOP_K = 20
+
+def _codigos(serie):
+    """
+    Códigos enteros (-1 para faltantes) y categorías de una columna
+    """
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        # Ya está factorizada
+        return serie.cat.codes.to_numpy(), serie.cat.categories
+    return pd.factorize(serie, sort=False)
+
+def perfilar_columna(serie, top_k=TOP_K):
+    """
+    Perfil de una variable categórica a partir de un único conteo de códigos
+
+    Args:
+        serie (pandas.Series): Columna a perfilar
+        top_k (int): Número de categorías más frecuentes a conservar
+
+    Returns:
+        dict: n_validos, n_faltantes, n_categorias, entropia (en nats, como
+            scipy.stats.entropy), conteos y frecuencias (%) de las top_k
+            categorías como Series ordenadas de mayor a menor, y
+            otros_categorias / otros_filas con lo que queda fuera del top
+    """
+    codigos, categorias = _codigos(serie)
+    validos = codigos[codigos >= 0]
+    conteos = np.bincount(validos, minlength=len(categorias))
+    n_validos = len(validos)
+
+    presentes = conteos > 0
+    n_categorias = int(presentes.sum())
+    if n_validos > 0:
+        p = conteos[presentes] / n_validos
+        entropia = float(-(p * np.log(p)).sum())
+    else:
+        entropia = float('nan')
+
+    # Top-k sin ordenar todas las categorías; empates por orden de aparición
+    # (el de los códigos), como value_counts().head(k)
+    k = min(top_k, n_categorias)
+    if k > 0:
+        umbral = np.partition(conteos, len(conteos) - k)[len(conteos) - k]
+        mayores = np.flatnonzero(conteos > umbral)
+        empatados = np.flatnonzero(conteos == umbral)[:k - len(mayores)]
+        candidatos = np.concatenate([mayores, empatados])
+    else:
+        candidatos = np.array([], dtype=np.intp)
+    candidatos = candidatos[np.lexsort((candidatos, -conteos[candidatos]))]
+
+    top = pd.Series(conteos[candidatos], index=categorias[candidatos], name=serie.name)
+    top.index.name = serie.name
+    return {
+        'n_validos': n_validos,
+        'n_faltantes': len(codigos) - n_validos,
+        'n_categorias': n_categorias,
+        'entropia': entropia,
+        'conteos': top,
+        'frecuencias': top / n_validos * 100 if n_validos else top.astype(float),
+        'otros_categorias': n_categorias - len(top),
+        'otros_filas': int(n_validos - top.sum()),
+    }
+
+def perfilar_categoricas(df, columnas=None, top_k=TOP_K, max_workers=None):
+    """
+    Perfila varias variables categóricas en paralelo
+
+    Args:
+        df (pandas.DataFrame): DataFrame a perfilar
+        columnas (list): Columnas a perfilar (por defecto las de tipo
+            object o category)
+        top_k (int): Número de categorías más frecuentes a conservar
+        max_workers (int): Número de hilos (por defecto el de ThreadPoolExecutor)
+
+    Returns:
+        dict: Columna -> perfil (ver perfilar_columna), en el orden de columnas
+    """
+    if columnas is None:
+        columnas = df.select_dtypes(include=['object', 'category']).columns
+    columnas = list(columnas)
+
+    if len(columnas) <= 1 or max_workers == 1:
+        return {col: perfilar_columna(df[col], top_k) for col in columnas}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ejecutor:
+        perfiles = ejecutor.map(lambda col: perfilar_columna(df[col], top_k), columnas)
+        return dict(zip(columnas, perfiles))
@@ -0,0 +1,259 @@
+"""
+Procesamiento por Lotes - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script limpia y resume muchas exportaciones a la vez (por ejemplo una
+por día y por tienda). Acepta directorios, archivos o patrones glob de
+CSV/XLSX y reparte los archivos entre procesos worker que aplican las
+mismas funciones que el análisis de un solo archivo: cargar_datos,
+limpiar_datos y resumen_estadistico.
+
+La concurrencia está acotada por --procesos y cada worker se reinicia tras
+--archivos-por-proceso archivos, así que la memoria máxima es la de los
+archivos más grandes que se procesan a la vez, no la del lote completo. Los
+workers solo devuelven resúmenes pequeños; el resumen combinado se
+construye combinando estados de resumen_incremental a medida que llegan
+los resultados.
+
+Uso:
+    python procesar_lotes.py ../data/exportaciones/ "../data/tienda_*.xlsx" --procesos 4
+"""
+
+import argparse
+import contextlib
+import glob
+import os
+import sys
+import time
+
+DIRECTORIO_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRECTORIO_SALIDA = os.path.join(DIRECTORIO_PROYECTO, 'reports', 'lotes')
+
+EXTENSIONES = ('.csv', '.xlsx')
+
+def expandir_entradas(entradas):
+    """
+    Lista los archivos de datos indicados por directorios, rutas o patrones glob
+
+    Args:
+        entradas (list): Directorios, archivos o patrones (p. ej. "data/*.xlsx")
+
+    Returns:
+        list: Rutas de archivos CSV/XLSX sin repetir, ordenadas
+    """
+    archivos = set()
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            candidatos = [os.path.join(entrada, nombre) for nombre in os.listdir(entrada)]
+        else:
+            candidatos = glob.glob(entrada) or [entrada]
+        archivos.update(os.path.abspath(ruta) for ruta in candidatos
+                        if ruta.lower().endswith(EXTENSIONES) and os.path.isfile(ruta))
+    return sorted(archivos)
+
+def _nombres_salida(rutas):
+    """
+    Nombre base único por archivo (los repetidos en distintos directorios
+    reciben un sufijo numérico)
+    """
+    nombres, usados = {}, {}
+    for ruta in rutas:
+        base = os.path.splitext(os.path.basename(ruta))[0]
+        usados[base] = usados.get(base, 0) + 1
+        nombres[ruta] = base if usados[base] == 1 else f"{base}_{usados[base]}"
+    return nombres
+
+def procesar_archivo(ruta, ruta_limpio=None):
+    """
+    Limpia y resume un archivo dentro de un proceso worker
+
+    La salida por pantalla de la limpieza y el análisis se descarta para que
+    no se mezclen los mensajes de los distintos workers.
+
+    Args:
+        ruta (str): Archivo CSV/XLSX
+        ruta_limpio (str): Si se indica, guarda aquí el CSV limpio
+
+    Returns:
+        tuple: (fila de resumen del archivo, estado de resumen_incremental
+            de sus datos limpios o None si falló)
+    """
+    import data_analysis
+    import data_cleaning
+    import instrumentacion
+    import resumen_incremental
+
+    inicio = time.perf_counter()
+    pico = instrumentacion.iniciar_pico_rss()
+    fila = {'archivo': ruta}
+    try:
+        with open(os.devnull, 'w', encoding='utf-8') as nulo, contextlib.redirect_stdout(nulo):
+            df = data_cleaning.cargar_datos(ruta)
+            if df is None:
+                raise ValueError("no se pudo cargar el archivo")
+            if df.empty:
+                raise ValueError("el archivo no tiene filas")
+            df_limpio = data_cleaning.limpiar_datos(df)
+            resumen = data_analysis.resumen_estadistico(df_limpio)
+            if ruta_limpio is not None:
+                data_cleaning.guardar_datos_limpios(df_limpio, ruta_limpio)
+
+        fila.update({
+            'filas_leidas': len(df),
+            'duplicados_eliminados': len(df) - len(df_limpio),
+            'filas_limpias': len(df_limpio),
+            'columnas': df_limpio.shape[1],
+            'faltantes_originales': int(df.isnull().sum().sum()),
+            'outliers': sum(resumen.get('outliers', {}).values()),
+        })
+        if 'estadisticas_numericas' in resumen and 'precio' in resumen['estadisticas_numericas'].index:
+            precio = resumen['estadisticas_numericas'].loc['precio']
+            fila.update({'precio_media': float(precio['media']), 'precio_mediana': float(precio['mediana'])})
+        estado = resumen_incremental.estado_desde_lote(df_limpio)
+    except Exception as e:
+        fila['error'] = f"{type(e).__name__}: {e}"
+        estado = None
+
+    fila['segundos'] = round(time.perf_counter() - inicio, 3)
+    fila.update(instrumentacion.terminar_pico_rss(pico))
+    return fila, estado
+
+def procesar_lotes(rutas, directorio_salida=DIRECTORIO_SALIDA, max_workers=None,
+                   archivos_por_proceso=1, guardar_limpios=True):
+    """
+    Procesa varios archivos en paralelo y combina sus resúmenes
+
+    Args:
+        rutas (list): Archivos CSV/XLSX
+        directorio_salida (str): Carpeta de los resúmenes (y de los CSV
+            limpios, en la subcarpeta limpios/)
+        max_workers (int): Procesos simultáneos (por defecto uno por CPU)
+        archivos_por_proceso (int): Archivos que procesa cada worker antes de
+            reiniciarse y liberar su memoria
+        guardar_limpios (bool): Guarda el CSV limpio de cada archivo
+
+    Returns:
+        tuple: (pandas.DataFrame con una fila por archivo, estado combinado
+            o None si ningún archivo se pudo procesar)
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    import pandas as pd
+    import resumen_incremental
+
+    directorio_limpios = os.path.join(directorio_salida, 'limpios')
+    os.makedirs(directorio_limpios if guardar_limpios else directorio_salida, exist_ok=True)
+    nombres = _nombres_salida(rutas)
+    max_workers = max_workers or min(len(rutas), os.cpu_count() or 1)
+
+    filas, combinado = [], None
+    with ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=archivos_por_proceso) as executor:
+        futuros = {
+            executor.submit(procesar_archivo, ruta,
+                            os.path.join(directorio_limpios, f"{nombres[ruta]}_limpio.csv")
+                            if guardar_limpios else None): ruta
+            for ruta in rutas
+        }
+        for futuro in as_completed(futuros):
+            fila, estado = futuro.result()
+            filas.append(fila)
+            if estado is None:
+                print(f"✗ {os.path.basename(fila['archivo'])}: {fila['error']}")
+                continue
+            # Combinar al llegar: solo se guarda en memoria el estado acumulado
+            combinado = estado if combinado is None else resumen_incremental.combinar_estados(combinado, estado)
+            print(f"✓ {os.path.basename(fila['archivo'])}: {fila['filas_limpias']:,} filas limpias "
+                  f"({fila['segundos']:.1f} s)")
+
+    por_archivo = pd.DataFrame(filas).sort_values('archivo').reset_index(drop=True)
+    return por_archivo, combinado
+
+def guardar_resumenes(por_archivo, combinado, directorio_salida=DIRECTORIO_SALIDA):
+    """
+    Guarda el resumen por archivo y el combinado
+
+    Escribe resumen_por_archivo.csv, estado_combinado.json (combinable con
+    resumen_incremental.py) y estadisticas_combinadas.csv.
+
+    Args:
+        por_archivo (pandas.DataFrame): Una fila por archivo
+        combinado (dict): Estado de resumen combinado (o None)
+        directorio_salida (str): Carpeta de destino
+
+    Returns:
+        dict: Resumen combinado con el formato de resumen_estadistico, o None
+    """
+    import resumen_incremental
+
+    os.makedirs(directorio_salida, exist_ok=True)
+    por_archivo.to_csv(os.path.join(directorio_salida, 'resumen_por_archivo.csv'), index=False)
+    if combinado is None:
+        return None
+
+    resumen_incremental.guardar_estado(combinado, os.path.join(directorio_salida, 'estado_combinado.json'))
+    resumen = resumen_incremental.resumen_desde_estado(combinado)
+    if 'estadisticas_numericas' in resumen:
+        resumen['estadisticas_numericas'].to_csv(os.path.join(directorio_salida, 'estadisticas_combinadas.csv'))
+    return resumen
+
+def main(entradas, directorio_salida=DIRECTORIO_SALIDA, max_workers=None, archivos_por_proceso=1,
+         guardar_limpios=True):
+    """
+    Procesa un lote de exportaciones y muestra los resúmenes
+
+    Args:
+        entradas (list): Directorios, archivos o patrones glob
+        directorio_salida (str): Carpeta de resultados
+        max_workers (int): Procesos simultáneos
+        archivos_por_proceso (int): Archivos por worker antes de reiniciarlo
+        guardar_limpios (bool): Guarda el CSV limpio de cada archivo
+
+    Returns:
+        pandas.DataFrame: Resumen por archivo, o None si no hay archivos
+    """
+    from data_analysis import generar_insights
+
+    rutas = expandir_entradas(entradas)
+    print("=" * 60)
+    print("PROCESAMIENTO POR LOTES")
+    print("=" * 60)
+    if not rutas:
+        print("No se encontraron archivos CSV/XLSX en las entradas indicadas")
+        return None
+    print(f"Archivos a procesar: {len(rutas)}")
+
+    inicio = time.perf_counter()
+    por_archivo, combinado = procesar_lotes(rutas, directorio_salida, max_workers,
+                                            archivos_por_proceso, guardar_limpios)
+    resumen = guardar_resumenes(por_archivo, combinado, directorio_salida)
+
+    print("\nRESUMEN POR ARCHIVO:")
+    columnas = [c for c in ('filas_leidas', 'duplicados_eliminados', 'filas_limpias', 'outliers',
+                            'precio_mediana', 'segundos', 'rss_pico_mb', 'rss_pico_proceso_mb', 'error')
+                if c in por_archivo]
+    print(por_archivo.assign(archivo=por_archivo['archivo'].map(os.path.basename))
+          .set_index('archivo')[columnas].to_string())
+
+    if resumen is not None:
+        print("\nRESUMEN COMBINADO:")
+        generar_insights(None, resumen)
+
+    print(f"\nTiempo total: {time.perf_counter() - inicio:.1f} s")
+    print(f"Resultados guardados en: {directorio_salida}")
+    return por_archivo
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Limpia y resume muchas exportaciones en paralelo")
+    parser.add_argument("entradas", nargs='+', help="Directorios, archivos o patrones glob de CSV/XLSX")
+    parser.add_argument("--salida", default=DIRECTORIO_SALIDA, help="Carpeta de resultados")
+    parser.add_argument("--procesos", type=int, default=None, metavar="N",
+                        help="Procesos simultáneos (por defecto uno por CPU)")
+    parser.add_argument("--archivos-por-proceso", type=int, default=1, metavar="N",
+                        help="Archivos que procesa cada worker antes de reiniciarse (libera memoria)")
+    parser.add_argument("--sin-csv", action="store_true", help="No guarda el CSV limpio de cada archivo")
+    argumentos = parser.parse_args()
+
+    resultado = main(argumentos.entradas, argumentos.salida, argumentos.procesos,
+                     argumentos.archivos_por_proceso, not argumentos.sin_csv)
+    sys.exit(0 if resultado is not None and 'error' not in resultado else 1)
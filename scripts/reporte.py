@@ -0,0 +1,204 @@
+"""
+Reporte Final - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script genera el reporte HTML a partir de los resultados que guarda el
+análisis estadístico (reports/analisis_estadistico.json) y de la plantilla
+plantillas/reporte_eda.html. No carga los datos ni repite ningún cálculo,
+así que generar el reporte es prácticamente inmediato.
+"""
+
+import html
+import json
+import os
+from datetime import datetime
+from string import Template
+
+# Sin pandas ni NumPy: importar este módulo no carga las librerías de datos
+DIRECTORIO_SCRIPTS = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO_PROYECTO = os.path.dirname(DIRECTORIO_SCRIPTS)
+RUTA_ARTEFACTO = os.path.join(DIRECTORIO_PROYECTO, 'reports', 'analisis_estadistico.json')
+RUTA_PLANTILLA = os.path.join(DIRECTORIO_SCRIPTS, 'plantillas', 'reporte_eda.html')
+RUTA_REPORTE = os.path.join(DIRECTORIO_PROYECTO, 'reports', 'EDA_Report.html')
+
+def cargar_artefacto(ruta=RUTA_ARTEFACTO):
+    """
+    Carga los resultados guardados por data_analysis.guardar_artefacto
+
+    Args:
+        ruta (str): Archivo del artefacto
+
+    Returns:
+        dict: Artefacto del análisis
+
+    Raises:
+        FileNotFoundError: Si el análisis no se ha ejecutado
+    """
+    with open(ruta, encoding='utf-8') as f:
+        return json.load(f)
+
+def _formatear(valor, decimales=3):
+    """
+    Formatea un valor del artefacto para una celda de tabla
+    """
+    if valor is None:
+        return 'NaN'
+    if isinstance(valor, float):
+        return f"{valor:,.{decimales}f}"
+    if isinstance(valor, int):
+        return f"{valor:,}"
+    return html.escape(str(valor))
+
+def tabla_html(encabezados, filas):
+    """
+    Construye una tabla HTML
+
+    Args:
+        encabezados (list): Títulos de las columnas
+        filas (list): Listas de celdas ya formateadas
+
+    Returns:
+        str: Tabla HTML
+    """
+    cabecera = ''.join(f"<th>{html.escape(str(e))}</th>" for e in encabezados)
+    cuerpo = ''.join('<tr>' + ''.join(f"<td>{celda}</td>" for celda in fila) + '</tr>' for fila in filas)
+    return f"<table><thead><tr>{cabecera}</tr></thead><tbody>{cuerpo}</tbody></table>"
+
+def _tabla_descriptiva(estadisticas):
+    """
+    Tabla con el mismo formato que DataFrame.describe(): una fila por
+    estadístico y una columna por variable
+    """
+    if not estadisticas:
+        return "<p>No hay variables numéricas.</p>"
+    columnas = list(estadisticas)
+    nombres = list(estadisticas[columnas[0]])
+    filas = [[f"<strong>{html.escape(nombre)}</strong>"]
+             + [_formatear(estadisticas[col][nombre]) for col in columnas]
+             for nombre in nombres]
+    return tabla_html([''] + columnas, filas)
+
+def _tabla_faltantes(artefacto):
+    """
+    Valores faltantes y su porcentaje por columna
+    """
+    porcentajes = artefacto.get('porcentaje_faltantes', {})
+    filas = [[html.escape(col), _formatear(cantidad), f"{porcentajes.get(col) or 0:.2f}%"]
+             for col, cantidad in artefacto['valores_faltantes'].items()]
+    return tabla_html(['Columna', 'Valores Faltantes', 'Porcentaje'], filas)
+
+def _tabla_outliers(artefacto):
+    """
+    Outliers por variable, de más a menos
+    """
+    outliers = artefacto.get('outliers', {})
+    if not outliers:
+        return "<p>No hay variables numéricas.</p>"
+    ordenados = sorted(outliers.items(), key=lambda par: par[1], reverse=True)
+    tabla = tabla_html(['Variable', 'Outliers'], [[html.escape(col), _formatear(n)] for col, n in ordenados])
+    
+    # Filas marcadas por la detección de outliers de la limpieza
+    filas = artefacto.get('outliers_filas')
+    if filas:
+        tabla += "<p>Filas marcadas por cada método (columnas outlier_* de los datos limpios):</p>"
+        tabla += tabla_html(['Método', 'Filas'], [[html.escape(metodo), _formatear(n)] for metodo, n in filas.items()])
+    return tabla
+
+def _tabla_correlaciones(artefacto):
+    """
+    Pares de variables con correlación por encima del umbral
+    """
+    pares = artefacto.get('correlaciones_fuertes', [])
+    if not pares:
+        return "<p>No se encontraron correlaciones por encima del umbral.</p>"
+    filas = [[html.escape(par['variable1']), html.escape(par['variable2']), _formatear(par['correlacion'])]
+             for par in pares]
+    return tabla_html(['Variable 1', 'Variable 2', 'Correlación'], filas)
+
+def _tablas_segmentacion(artefacto):
+    """
+    Estadísticas de precio por segmento, una tabla por dimensión
+    """
+    segmentacion = artefacto.get('segmentacion')
+    if not segmentacion:
+        return "<p>No hay análisis por segmentos.</p>"
+    tablas = []
+    for dimension, segmentos in segmentacion.items():
+        filas = [[html.escape(str(segmento['segmento'])), _formatear(segmento['conteo'])]
+                 + [_formatear(segmento[estadistica], 0)
+                    for estadistica in ('media', 'q1', 'mediana', 'q3')]
+                 for segmento in segmentos]
+        tablas.append(f"<h3>{html.escape(dimension)}</h3>"
+                      + tabla_html(['Segmento', 'Laptops', 'Media', 'Q1', 'Mediana', 'Q3'], filas))
+    return '\n'.join(tablas)
+
+def renderizar_reporte(artefacto, ruta_plantilla=RUTA_PLANTILLA):
+    """
+    Rellena la plantilla del reporte con los resultados del análisis
+
+    Args:
+        artefacto (dict): Resultados guardados por data_analysis.guardar_artefacto
+        ruta_plantilla (str): Plantilla HTML con marcadores $nombre
+
+    Returns:
+        str: Documento HTML
+    """
+    with open(ruta_plantilla, encoding='utf-8') as f:
+        plantilla = Template(f.read())
+
+    filas, columnas = artefacto['dimensiones']
+    total_faltantes = sum(artefacto['valores_faltantes'].values())
+    if total_faltantes == 0:
+        clase_calidad = 'success'
+        calidad = "<strong>✅ Limpieza completada:</strong> No quedan valores faltantes en el dataset."
+    else:
+        clase_calidad = 'warning'
+        calidad = (f"<strong>⚠️ Limpieza completada:</strong> Quedan {total_faltantes:,} valores "
+                   f"faltantes (ver tabla de valores faltantes).")
+
+    return plantilla.substitute(
+        fecha_analisis=html.escape(artefacto['fecha'].replace('T', ' ')),
+        fecha_reporte=datetime.now().strftime('%d/%m/%Y %H:%M:%S'),
+        observaciones=f"{filas:,}",
+        variables=columnas,
+        numericas=len(artefacto['columnas_numericas']),
+        categoricas=len(artefacto['columnas_categoricas']),
+        clase_calidad=clase_calidad,
+        calidad=calidad,
+        tabla_outliers=_tabla_outliers(artefacto),
+        umbral_correlacion=artefacto['umbral_correlacion'],
+        tabla_correlaciones=_tabla_correlaciones(artefacto),
+        tabla_descriptiva=_tabla_descriptiva(artefacto.get('estadisticas_descriptivas')),
+        tabla_faltantes=_tabla_faltantes(artefacto),
+        tablas_segmentacion=_tablas_segmentacion(artefacto),
+        lista_insights='\n'.join(f"<li>{html.escape(insight)}</li>" for insight in artefacto['insights']),
+    )
+
+def main(ruta_artefacto=RUTA_ARTEFACTO, ruta_salida=RUTA_REPORTE):
+    """
+    Genera el reporte HTML a partir del artefacto del análisis
+
+    Args:
+        ruta_artefacto (str): Resultados del análisis estadístico
+        ruta_salida (str): Archivo HTML de destino
+
+    Returns:
+        bool: True si el reporte se generó
+    """
+    try:
+        artefacto = cargar_artefacto(ruta_artefacto)
+    except FileNotFoundError:
+        print("❌ No se encontraron los resultados del análisis estadístico")
+        print("Ejecuta primero el script de análisis (data_analysis.py)")
+        return False
+
+    contenido = renderizar_reporte(artefacto)
+    os.makedirs(os.path.dirname(ruta_salida), exist_ok=True)
+    with open(ruta_salida, 'w', encoding='utf-8') as f:
+        f.write(contenido)
+    return True
+
+if __name__ == "__main__":
+    if main():
+        print(f"✅ Reporte HTML creado en {RUTA_REPORTE}")
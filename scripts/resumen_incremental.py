@@ -0,0 +1,483 @@
+"""
+Resumen Incremental - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script mantiene un estado de resumen persistente y combinable para
+los lotes diarios de publicaciones. Cada lote actualiza el estado en un
+tiempo proporcional a su tamaño, sin volver a recorrer el histórico:
+
+- Momentos (media, M2, M3, M4) combinados con las fórmulas de Chan/Pébay
+- Cuantiles aproximados con un sketch de centroides (estilo t-digest)
+- Número aproximado de valores distintos con HyperLogLog
+- Categorías más frecuentes con contadores de Misra-Gries
+
+El estado se guarda en JSON y puede transformarse en un diccionario con
+el mismo formato que resumen_estadistico para usar generar_insights.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from data_cleaning import convertir_tipos, normalizar_columnas
+from deteccion_outliers import COLUMNAS_EXCLUIDAS, COLUMNAS_RESULTADO
+from parser_especificaciones import parsear_especificaciones
+
+# Ruta por defecto del estado persistente
+DIRECTORIO_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_ESTADO = os.path.join(DIRECTORIO_PROYECTO, 'data', 'resumen_incremental.json')
+
+# Parámetros de los sketches
+COMPRESION_CUANTILES = 200     # Número aproximado de centroides por columna
+PRECISION_HLL = 12             # 2^12 registros -> error típico ~1.6%
+CONTADORES_FRECUENTES = 100    # Categorías conservadas por columna
+
+VERSION_ESTADO = 1
+
+# Columnas que no son variables de los datos: las marcas y puntuaciones de
+# deteccion_outliers y el índice exportado en el archivo original
+COLUMNAS_DERIVADAS = set(COLUMNAS_RESULTADO) | set(COLUMNAS_EXCLUIDAS)
+
+def estado_vacio():
+    """
+    Crea un estado de resumen sin datos
+
+    Returns:
+        dict: Estado vacío
+    """
+    return {'version': VERSION_ESTADO, 'filas': 0, 'lotes': 0, 'columnas': {}}
+
+# ---------------------------------------------------------------------------
+# Momentos
+# ---------------------------------------------------------------------------
+
+def _momentos_lote(valores):
+    """
+    Calcula los momentos centrales de un lote de valores sin NaN
+    """
+    n = len(valores)
+    if n == 0:
+        return {'n': 0, 'media': 0.0, 'm2': 0.0, 'm3': 0.0, 'm4': 0.0}
+    media = float(valores.mean())
+    desvios = valores - media
+    cuadrados = desvios ** 2
+    return {
+        'n': n,
+        'media': media,
+        'm2': float(cuadrados.sum()),
+        'm3': float((cuadrados * desvios).sum()),
+        'm4': float((cuadrados ** 2).sum()),
+    }
+
+def _combinar_momentos(a, b):
+    """
+    Combina dos conjuntos de momentos centrales (Chan et al. / Pébay)
+    """
+    na, nb = a['n'], b['n']
+    if na == 0:
+        return dict(b)
+    if nb == 0:
+        return dict(a)
+
+    n = na + nb
+    d = b['media'] - a['media']
+    d_n = d / n
+    m2 = a['m2'] + b['m2'] + d * d_n * na * nb
+    m3 = (a['m3'] + b['m3'] + d * d_n ** 2 * na * nb * (na - nb)
+          + 3 * d_n * (na * b['m2'] - nb * a['m2']))
+    m4 = (a['m4'] + b['m4'] + d * d_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+          + 6 * d_n ** 2 * (na * na * b['m2'] + nb * nb * a['m2'])
+          + 4 * d_n * (na * b['m3'] - nb * a['m3']))
+    return {'n': n, 'media': a['media'] + d_n * nb, 'm2': m2, 'm3': m3, 'm4': m4}
+
+# ---------------------------------------------------------------------------
+# Sketch de cuantiles
+# ---------------------------------------------------------------------------
+
+def _comprimir_centroides(medias, pesos, compresion=COMPRESION_CUANTILES):
+    """
+    Agrupa centroides ordenados con la función de escala k1 de t-digest
+
+    Los centroides cercanos a las colas quedan pequeños y los del centro
+    grandes, de modo que los cuantiles extremos conservan precisión. Toda
+    la compresión es vectorizada (sin bucles de Python).
+    """
+    if len(medias) == 0:
+        return medias, pesos
+
+    orden = np.argsort(medias, kind='stable')
+    medias, pesos = medias[orden], pesos[orden]
+    total = pesos.sum()
+
+    # Cuantil del punto medio de cada centroide -> índice en la escala k1
+    q = (np.cumsum(pesos) - pesos / 2) / total
+    k = compresion / (2 * np.pi) * np.arcsin(2 * q - 1)
+    grupos = np.floor(k - k.min()).astype(int)
+
+    pesos_grupo = np.bincount(grupos, weights=pesos)
+    sumas_grupo = np.bincount(grupos, weights=medias * pesos)
+    ocupados = pesos_grupo > 0
+    return sumas_grupo[ocupados] / pesos_grupo[ocupados], pesos_grupo[ocupados]
+
+def _combinar_sketch(a, b):
+    """
+    Combina dos sketches de cuantiles
+    """
+    medias = np.concatenate([np.asarray(a['medias'], dtype=float), np.asarray(b['medias'], dtype=float)])
+    pesos = np.concatenate([np.asarray(a['pesos'], dtype=float), np.asarray(b['pesos'], dtype=float)])
+    medias, pesos = _comprimir_centroides(medias, pesos)
+    return {'medias': medias.tolist(), 'pesos': pesos.tolist()}
+
+def _sketch_lote(valores):
+    """
+    Construye el sketch de cuantiles de un lote de valores sin NaN
+    """
+    medias, pesos = _comprimir_centroides(np.sort(valores), np.ones(len(valores)))
+    return {'medias': medias.tolist(), 'pesos': pesos.tolist()}
+
+def _cuantil_sketch(sketch, q, minimo, maximo):
+    """
+    Estima un cuantil interpolando entre los centroides del sketch
+    """
+    medias = np.asarray(sketch['medias'], dtype=float)
+    pesos = np.asarray(sketch['pesos'], dtype=float)
+    if len(medias) == 0:
+        return np.nan
+    acumulado = np.cumsum(pesos) - pesos / 2
+    posiciones = np.concatenate([[0.0], acumulado, [pesos.sum()]])
+    valores = np.concatenate([[minimo], medias, [maximo]])
+    return float(np.interp(q * pesos.sum(), posiciones, valores))
+
+def _peso_fuera(sketch, inferior, superior):
+    """
+    Estima cuántos valores quedan estrictamente fuera de [inferior, superior]
+
+    Se suma el peso de los centroides cuya media cae fuera del intervalo,
+    sin interpolar, para que los valores repetidos justo en un límite (por
+    ejemplo, cuando el IQR es 0) no se cuenten como outliers.
+    """
+    medias = np.asarray(sketch['medias'], dtype=float)
+    pesos = np.asarray(sketch['pesos'], dtype=float)
+    return float(pesos[(medias < inferior) | (medias > superior)].sum())
+
+# ---------------------------------------------------------------------------
+# HyperLogLog
+# ---------------------------------------------------------------------------
+
+def _hashes(serie):
+    """
+    Calcula hashes de 64 bits estables entre ejecuciones
+    """
+    valores = serie.dropna()
+    # Mismo hash para 8 y 8.0 aunque el tipo cambie entre lotes
+    if pd.api.types.is_numeric_dtype(valores) and not pd.api.types.is_bool_dtype(valores):
+        valores = valores.astype(float)
+    else:
+        valores = valores.astype(str)
+    return pd.util.hash_array(valores.to_numpy())
+
+def _registros_hll(hashes, precision=PRECISION_HLL):
+    """
+    Construye los registros HyperLogLog de un conjunto de hashes
+    """
+    registros = np.zeros(1 << precision, dtype=np.uint8)
+    if len(hashes) == 0:
+        return registros
+    indices = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+    resto = (hashes << np.uint64(precision)) & np.uint64(0xFFFFFFFFFFFFFFFF)
+    # Posición del primer bit a 1 en los 64 - precision bits restantes
+    _, exponente = np.frexp(resto.astype(float))
+    rango = np.where(resto == 0, 64 - precision + 1, 65 - exponente).astype(np.uint8)
+    np.maximum.at(registros, indices, rango)
+    return registros
+
+def _estimar_hll(registros):
+    """
+    Estima el número de valores distintos a partir de los registros
+    """
+    registros = np.asarray(registros, dtype=float)
+    m = len(registros)
+    alfa = 0.7213 / (1 + 1.079 / m)
+    estimacion = alfa * m * m / np.sum(2.0 ** -registros)
+    ceros = int((registros == 0).sum())
+    if estimacion <= 2.5 * m and ceros > 0:
+        estimacion = m * np.log(m / ceros)
+    return int(round(estimacion))
+
+# ---------------------------------------------------------------------------
+# Categorías frecuentes (Misra-Gries)
+# ---------------------------------------------------------------------------
+
+def _combinar_frecuentes(a, b, k=CONTADORES_FRECUENTES):
+    """
+    Combina dos resúmenes de Misra-Gries conservando k contadores
+
+    Los conteos resultantes subestiman el real como máximo en N / (k + 1).
+    """
+    conteos = dict(a)
+    for valor, conteo in b.items():
+        conteos[valor] = conteos.get(valor, 0) + conteo
+    if len(conteos) <= k:
+        return conteos
+    umbral = sorted(conteos.values(), reverse=True)[k]
+    return {valor: conteo - umbral for valor, conteo in conteos.items() if conteo > umbral}
+
+# ---------------------------------------------------------------------------
+# Estado
+# ---------------------------------------------------------------------------
+
+def estado_desde_lote(df):
+    """
+    Construye el estado de resumen de un lote
+
+    Las columnas de COLUMNAS_DERIVADAS no forman parte del estado.
+
+    Args:
+        df (pandas.DataFrame): Lote de datos preparado
+
+    Returns:
+        dict: Estado con las estadísticas del lote
+    """
+    estado = estado_vacio()
+    estado['filas'] = len(df)
+    estado['lotes'] = 1
+
+    for col in df.columns:
+        if col in COLUMNAS_DERIVADAS:
+            continue
+        serie = df[col]
+        info = {'faltantes': int(serie.isnull().sum()),
+                'hll': _registros_hll(_hashes(serie)).tobytes().hex()}
+
+        if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+            valores = serie.dropna().to_numpy(dtype=float)
+            info['tipo'] = 'numerica'
+            info['momentos'] = _momentos_lote(valores)
+            info['min'] = float(valores.min()) if len(valores) else None
+            info['max'] = float(valores.max()) if len(valores) else None
+            info['sketch'] = _sketch_lote(valores)
+        else:
+            info['tipo'] = 'categorica'
+            conteos = serie.dropna().astype(str).value_counts()
+            info['frecuentes'] = _combinar_frecuentes({}, conteos.astype(int).to_dict())
+
+        estado['columnas'][str(col)] = info
+
+    return estado
+
+def _combinar_extremo(a, b, funcion):
+    valores = [v for v in (a, b) if v is not None]
+    return funcion(valores) if valores else None
+
+def combinar_estados(a, b):
+    """
+    Combina dos estados de resumen (operación asociativa y conmutativa)
+
+    Args:
+        a (dict): Primer estado
+        b (dict): Segundo estado
+
+    Returns:
+        dict: Estado combinado
+    """
+    estado = estado_vacio()
+    estado['filas'] = a['filas'] + b['filas']
+    estado['lotes'] = a['lotes'] + b['lotes']
+
+    for col in list(a['columnas']) + [c for c in b['columnas'] if c not in a['columnas']]:
+        # Una columna ausente en un estado cuenta como faltante en todas sus filas
+        ia = a['columnas'].get(col)
+        ib = b['columnas'].get(col)
+        if ia is None or ib is None:
+            presente, filas_ausente = (ia, b['filas']) if ib is None else (ib, a['filas'])
+            info = json.loads(json.dumps(presente))
+            info['faltantes'] += filas_ausente
+            estado['columnas'][col] = info
+            continue
+
+        registros = np.maximum(np.frombuffer(bytes.fromhex(ia['hll']), dtype=np.uint8),
+                               np.frombuffer(bytes.fromhex(ib['hll']), dtype=np.uint8))
+        info = {'faltantes': ia['faltantes'] + ib['faltantes'], 'hll': registros.tobytes().hex()}
+
+        if ia['tipo'] == 'numerica' and ib['tipo'] == 'numerica':
+            info['tipo'] = 'numerica'
+            info['momentos'] = _combinar_momentos(ia['momentos'], ib['momentos'])
+            info['min'] = _combinar_extremo(ia['min'], ib['min'], min)
+            info['max'] = _combinar_extremo(ia['max'], ib['max'], max)
+            info['sketch'] = _combinar_sketch(ia['sketch'], ib['sketch'])
+        else:
+            info['tipo'] = 'categorica'
+            info['frecuentes'] = _combinar_frecuentes(ia.get('frecuentes', {}), ib.get('frecuentes', {}))
+
+        estado['columnas'][col] = info
+
+    return estado
+
+def preparar_lote(df):
+    """
+    Prepara un lote de publicaciones crudas para el resumen
+
+    Aplica los pasos de limpieza que no dependen del histórico (especificaciones,
+    nombres de columnas y tipos). La imputación se omite para que el estado
+    refleje los valores faltantes reales.
+
+    Args:
+        df (pandas.DataFrame): Lote con las columnas originales
+
+    Returns:
+        pandas.DataFrame: Lote preparado
+    """
+    df = parsear_especificaciones(df)
+    normalizar_columnas(df)
+    convertir_tipos(df)
+    return df
+
+def actualizar_estado(estado, df_lote):
+    """
+    Incorpora un lote al estado de resumen
+
+    Args:
+        estado (dict): Estado actual (o None para empezar de cero)
+        df_lote (pandas.DataFrame): Lote preparado con preparar_lote
+
+    Returns:
+        dict: Estado actualizado
+    """
+    lote = estado_desde_lote(df_lote)
+    return lote if estado is None else combinar_estados(estado, lote)
+
+def cargar_estado(ruta=RUTA_ESTADO):
+    """
+    Carga el estado persistente
+
+    Args:
+        ruta (str): Ruta del archivo JSON
+
+    Returns:
+        dict: Estado guardado, o None si no existe
+    """
+    try:
+        with open(ruta, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def guardar_estado(estado, ruta=RUTA_ESTADO):
+    """
+    Guarda el estado persistente
+
+    Args:
+        estado (dict): Estado a guardar
+        ruta (str): Ruta del archivo JSON
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(estado, f, ensure_ascii=False)
+
+def resumen_desde_estado(estado):
+    """
+    Construye un resumen con el formato de resumen_estadistico a partir del estado
+
+    Los cuantiles, límites IQR y conteos de outliers son aproximados (salen
+    del sketch); los momentos y los valores faltantes son exactos. Las
+    columnas de COLUMNAS_DERIVADAS de estados guardados antes de excluirlas
+    se ignoran.
+
+    Args:
+        estado (dict): Estado de resumen
+
+    Returns:
+        dict: Resumen compatible con generar_insights
+    """
+    filas = estado['filas']
+    columnas = [c for c in estado['columnas'] if c not in COLUMNAS_DERIVADAS]
+    numericas = [c for c in columnas if estado['columnas'][c]['tipo'] == 'numerica']
+    categoricas = [c for c in columnas if c not in numericas]
+
+    resumen = {
+        'dimensiones': (filas, len(columnas)),
+        'columnas': columnas,
+        'valores_faltantes': {c: estado['columnas'][c]['faltantes'] for c in columnas},
+        'porcentaje_faltantes': {c: estado['columnas'][c]['faltantes'] / filas * 100 if filas else 0.0
+                                 for c in columnas},
+        'columnas_numericas': numericas,
+        'columnas_categoricas': categoricas,
+    }
+
+    filas_estadisticas = {}
+    for col in numericas:
+        info = estado['columnas'][col]
+        m = info['momentos']
+        n = m['n']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            varianza = m['m2'] / (n - 1) if n > 1 else np.nan
+            g1 = (m['m3'] / n) / (m['m2'] / n) ** 1.5 if n > 0 and m['m2'] > 0 else 0.0
+            g2 = (m['m4'] / n) / (m['m2'] / n) ** 2 - 3 if n > 0 and m['m2'] > 0 else 0.0
+            asimetria = np.sqrt(n * (n - 1)) / (n - 2) * g1 if n > 2 else np.nan
+            curtosis = ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3)) if n > 3 else np.nan
+
+        minimo, maximo = info['min'], info['max']
+        q1, mediana, q3 = (_cuantil_sketch(info['sketch'], q, minimo, maximo) for q in (0.25, 0.5, 0.75))
+        iqr = q3 - q1
+        inferior, superior = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+        outliers = _peso_fuera(info['sketch'], inferior, superior) if n > 0 else 0
+
+        filas_estadisticas[col] = {
+            'conteo': n, 'media': m['media'] if n else np.nan, 'desv_std': np.sqrt(varianza),
+            'varianza': varianza, 'min': minimo, 'q1': q1, 'mediana': mediana, 'q3': q3,
+            'max': maximo, 'asimetria': asimetria, 'curtosis': curtosis, 'iqr': iqr,
+            'limite_inferior': inferior, 'limite_superior': superior,
+            'outliers': int(round(outliers)),
+        }
+
+    if numericas:
+        estadisticas = pd.DataFrame.from_dict(filas_estadisticas, orient='index')
+        resumen['estadisticas_numericas'] = estadisticas
+        resumen['outliers'] = estadisticas['outliers'].astype(int).to_dict()
+
+    resumen['categoricas'] = {}
+    for col in columnas:
+        info = estado['columnas'][col]
+        registros = np.frombuffer(bytes.fromhex(info['hll']), dtype=np.uint8)
+        resumen['categoricas'].setdefault(col, {})['valores_unicos_aprox'] = _estimar_hll(registros)
+        if col in categoricas:
+            frecuentes = sorted(info['frecuentes'].items(), key=lambda x: x[1], reverse=True)
+            resumen['categoricas'][col]['frecuentes'] = frecuentes
+
+    return resumen
+
+def main(rutas_lotes, ruta_estado=RUTA_ESTADO):
+    """
+    Incorpora uno o varios lotes al estado persistente y muestra los insights
+
+    Args:
+        rutas_lotes (list): Archivos CSV/XLSX con los nuevos lotes
+        ruta_estado (str): Ruta del estado persistente
+    """
+    from data_cleaning import cargar_datos
+    from data_analysis import generar_insights
+
+    estado = cargar_estado(ruta_estado)
+    for ruta in rutas_lotes:
+        df = cargar_datos(ruta)
+        if df is None:
+            continue
+        estado = actualizar_estado(estado, preparar_lote(df))
+        print(f"Lote incorporado: {ruta} ({len(df)} filas)")
+
+    if estado is None:
+        print("No hay datos en el estado de resumen")
+        return
+
+    guardar_estado(estado, ruta_estado)
+    print(f"Estado guardado en: {ruta_estado} ({estado['filas']} filas, {estado['lotes']} lotes)")
+
+    resumen = resumen_desde_estado(estado)
+    generar_insights(None, resumen)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,406 @@
+"""
+Servicio de Consultas - Dataset de Laptops
+Autor: [Tu nombre]
+Fecha: [Fecha]
+
+Este script carga una sola vez los datos limpios (desde la caché tipada) y
+responde consultas de filtro y agregación sobre las mismas columnas que usa
+data_analysis, sin volver a ejecutar el pipeline. Se puede usar como API de
+Python o como servicio HTTP local que devuelve JSON.
+
+Las respuestas se guardan en una caché en memoria de tamaño acotado que
+descarta la consulta usada hace más tiempo (LRU), así que las preguntas
+repetidas se responden sin recalcular.
+
+Uso:
+    python servicio_consultas.py --filtro ram_gb=16 --metrica median:precio
+    python servicio_consultas.py --agrupar marca --metrica count --ordenar=-count --limite 10
+    python servicio_consultas.py --servir --puerto 8765
+    curl "http://localhost:8765/consulta?filtro=ram_gb=16&metrica=median:precio"
+"""
+
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import cache_datos
+import cubo_precios
+
+# Número máximo de respuestas guardadas en memoria
+MAX_CONSULTAS_EN_CACHE = 256
+
+AGREGACIONES = ('count', 'sum', 'mean', 'median', 'min', 'max', 'std', 'nunique')
+OPERADORES = ('==', '!=', '<=', '>=', '<', '>', 'in')
+
+# columna, operador y valor; '=' equivale a '==' y una lista separada por
+# comas tras '=' equivale a 'in'
+_PATRON_FILTRO = re.compile(r'^\s*([^<>!=]+?)\s*(==|!=|<=|>=|<|>|=)\s*(.*?)\s*$')
+
+class ServicioConsultas:
+    """
+    Datos limpios en memoria con consultas de filtro y agregación cacheadas
+    """
+
+    def __init__(self, df=None, max_consultas_en_cache=MAX_CONSULTAS_EN_CACHE):
+        """
+        Args:
+            df (pandas.DataFrame): Datos limpios (por defecto se cargan de
+                la caché tipada o de data/laptop_limpio.csv)
+            max_consultas_en_cache (int): Respuestas guardadas como máximo
+        """
+        self.max_consultas_en_cache = max_consultas_en_cache
+        self._cache = OrderedDict()
+        self._bloqueo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.recargar(df)
+
+    def recargar(self, df=None):
+        """
+        Vuelve a cargar los datos y vacía la caché de respuestas
+
+        Args:
+            df (pandas.DataFrame): Datos limpios (por defecto, los de disco)
+        """
+        if df is None:
+            df = cache_datos.cargar_datos_limpios()
+        df = df.copy()
+        # Marca derivada del nombre del modelo, para agrupar por fabricante
+        if 'model' in df.columns and 'marca' not in df.columns:
+            df['marca'] = cubo_precios.marca_desde_modelo(df['model'])
+        with self._bloqueo:
+            self.df = df
+            self._cache.clear()
+
+    def columnas(self):
+        """
+        Columnas consultables y su tipo
+
+        Returns:
+            dict: Columna -> tipo de datos
+        """
+        return {col: str(tipo) for col, tipo in self.df.dtypes.items()}
+
+    def _convertir_valor(self, columna, valor):
+        """
+        Convierte un valor escrito como texto al tipo de la columna
+        """
+        serie = self.df[columna]
+        if not isinstance(valor, str):
+            return valor
+        if pd.api.types.is_bool_dtype(serie):
+            return valor.strip().lower() in ('true', '1', 'si', 'sí')
+        if pd.api.types.is_numeric_dtype(serie):
+            return float(valor)
+        return valor
+
+    def normalizar_filtros(self, filtros):
+        """
+        Convierte los filtros en una tupla canónica (columna, operador, valor)
+
+        Args:
+            filtros: Diccionario {columna: valor | lista | (mínimo, máximo)},
+                o lista de textos como "ram_gb=16", "precio<50000" o
+                "marca=HP,Dell", o de tuplas (columna, operador, valor)
+
+        Returns:
+            tuple: Filtros normalizados y ordenados (clave de la caché)
+
+        Raises:
+            ValueError: Si una columna u operador no existe
+        """
+        if not filtros:
+            return ()
+        if isinstance(filtros, dict):
+            condiciones = []
+            for columna, valor in filtros.items():
+                if isinstance(valor, tuple) and len(valor) == 2:
+                    minimo, maximo = valor
+                    if minimo is not None:
+                        condiciones.append((columna, '>=', minimo))
+                    if maximo is not None:
+                        condiciones.append((columna, '<=', maximo))
+                elif isinstance(valor, (list, set, frozenset)):
+                    condiciones.append((columna, 'in', tuple(valor)))
+                else:
+                    condiciones.append((columna, '==', valor))
+        else:
+            condiciones = [parsear_filtro(f) if isinstance(f, str) else tuple(f) for f in filtros]
+
+        normalizados = []
+        for columna, operador, valor in condiciones:
+            if columna not in self.df.columns:
+                raise ValueError(f"Columna desconocida: {columna}")
+            if operador not in OPERADORES:
+                raise ValueError(f"Operador desconocido: {operador}")
+            if operador == 'in':
+                valor = tuple(sorted({self._convertir_valor(columna, v) for v in valor}, key=str))
+            else:
+                valor = self._convertir_valor(columna, valor)
+            normalizados.append((columna, operador, valor))
+        return tuple(sorted(normalizados, key=str))
+
+    def _mascara(self, filtros):
+        """
+        Filas que cumplen todos los filtros normalizados
+        """
+        mascara = np.ones(len(self.df), dtype=bool)
+        for columna, operador, valor in filtros:
+            serie = self.df[columna]
+            if operador == 'in':
+                condicion = serie.isin(valor)
+            elif operador == '==':
+                condicion = serie == valor
+            elif operador == '!=':
+                condicion = serie != valor
+            elif operador == '<':
+                condicion = serie < valor
+            elif operador == '<=':
+                condicion = serie <= valor
+            elif operador == '>':
+                condicion = serie > valor
+            else:
+                condicion = serie >= valor
+            mascara &= condicion.to_numpy(dtype=bool)
+        return mascara
+
+    def _normalizar_metricas(self, metricas):
+        """
+        Convierte las métricas en una tupla (nombre, columna, agregación)
+        """
+        if not metricas:
+            metricas = ['count']
+        if isinstance(metricas, str):
+            metricas = [metricas]
+        if isinstance(metricas, dict):
+            metricas = [f"{agregacion}:{columna}" for columna, agregacion in metricas.items()]
+        normalizadas = []
+        for metrica in metricas:
+            agregacion, _, columna = metrica.partition(':')
+            if agregacion not in AGREGACIONES:
+                raise ValueError(f"Agregación desconocida: {agregacion} (opciones: {', '.join(AGREGACIONES)})")
+            if columna and columna not in self.df.columns:
+                raise ValueError(f"Columna desconocida: {columna}")
+            if not columna and agregacion != 'count':
+                raise ValueError(f"La agregación {agregacion} necesita una columna ({agregacion}:columna)")
+            nombre = f"{agregacion}_{columna}" if columna else agregacion
+            normalizadas.append((nombre, columna, agregacion))
+        return tuple(normalizadas)
+
+    def consultar(self, filtros=None, agrupar_por=None, metricas=None, ordenar_por=None, limite=None):
+        """
+        Filtra y agrega los datos
+
+        Args:
+            filtros: Condiciones (ver normalizar_filtros)
+            agrupar_por (str o list): Columnas por las que agrupar
+            metricas: "agregación:columna" o lista de ellas (p. ej.
+                "median:precio"; "count" cuenta filas), o diccionario
+                {columna: agregación}
+            ordenar_por (str): Columna del resultado; con '-' delante, descendente
+            limite (int): Número máximo de filas del resultado
+
+        Returns:
+            pandas.DataFrame: Resultado (una fila si no se agrupa)
+
+        Raises:
+            ValueError: Si la consulta usa columnas, operadores o
+                agregaciones desconocidas
+        """
+        if isinstance(agrupar_por, str):
+            agrupar_por = [agrupar_por]
+        agrupar_por = tuple(agrupar_por or ())
+        for columna in agrupar_por:
+            if columna not in self.df.columns:
+                raise ValueError(f"Columna desconocida: {columna}")
+        clave = (self.normalizar_filtros(filtros), agrupar_por, self._normalizar_metricas(metricas),
+                 ordenar_por, limite)
+
+        with self._bloqueo:
+            if clave in self._cache:
+                self._cache.move_to_end(clave)
+                self.aciertos += 1
+                return self._cache[clave].copy()
+            self.fallos += 1
+
+        resultado = self._calcular(*clave)
+
+        with self._bloqueo:
+            self._cache[clave] = resultado
+            while len(self._cache) > self.max_consultas_en_cache:
+                self._cache.popitem(last=False)
+        return resultado.copy()
+
+    def _calcular(self, filtros, agrupar_por, metricas, ordenar_por, limite):
+        """
+        Ejecuta una consulta ya normalizada (sin caché)
+        """
+        # Solo se copian las columnas que usa la consulta, no las filas completas
+        necesarias = list(dict.fromkeys([*agrupar_por, *(columna for _, columna, _ in metricas if columna)]))
+        datos = self.df[necesarias or self.df.columns[:1]]
+        if filtros:
+            datos = datos[self._mascara(filtros)]
+        especificacion = {nombre: (columna or datos.columns[0], 'size' if agregacion == 'count' else agregacion)
+                          for nombre, columna, agregacion in metricas}
+
+        if agrupar_por:
+            resultado = datos.groupby(list(agrupar_por), observed=True, sort=False).agg(**especificacion)
+            resultado = resultado.reset_index()
+        else:
+            resultado = pd.DataFrame({
+                nombre: [len(datos) if agregacion == 'size' else datos[columna].agg(agregacion)]
+                for nombre, (columna, agregacion) in especificacion.items()
+            })
+
+        if ordenar_por:
+            columna = ordenar_por.lstrip('-')
+            if columna not in resultado.columns:
+                raise ValueError(f"No se puede ordenar por {columna}: no está en el resultado")
+            resultado = resultado.sort_values(columna, ascending=not ordenar_por.startswith('-'),
+                                              kind='stable')
+        if limite is not None:
+            resultado = resultado.head(limite)
+        return resultado.reset_index(drop=True)
+
+    def estadisticas_cache(self):
+        """
+        Aciertos, fallos y tamaño de la caché de respuestas
+
+        Returns:
+            dict: Contadores de la caché
+        """
+        with self._bloqueo:
+            return {'aciertos': self.aciertos, 'fallos': self.fallos, 'en_cache': len(self._cache),
+                    'maximo': self.max_consultas_en_cache}
+
+def parsear_filtro(texto):
+    """
+    Interpreta un filtro escrito como texto
+
+    Args:
+        texto (str): Condición como "ram_gb=16", "precio<=50000" o
+            "marca=HP,Dell" (varios valores separados por comas)
+
+    Returns:
+        tuple: (columna, operador, valor)
+
+    Raises:
+        ValueError: Si el texto no tiene la forma columna-operador-valor
+    """
+    coincidencia = _PATRON_FILTRO.match(texto)
+    if not coincidencia:
+        raise ValueError(f"Filtro no válido: {texto!r} (ejemplo: ram_gb=16)")
+    columna, operador, valor = coincidencia.groups()
+    if operador == '=':
+        if ',' in valor:
+            return columna, 'in', tuple(v.strip() for v in valor.split(','))
+        operador = '=='
+    return columna, operador, valor
+
+def _a_json(resultado, **extra):
+    """
+    Serializa el resultado de una consulta como JSON
+    """
+    registros = json.loads(resultado.to_json(orient='records', force_ascii=False))
+    return json.dumps({'filas': len(resultado), **extra, 'resultado': registros}, ensure_ascii=False)
+
+def servir(servicio, puerto=8765, host='127.0.0.1'):
+    """
+    Atiende consultas HTTP hasta que se interrumpa el proceso
+
+    Rutas:
+        GET /columnas   Columnas consultables y su tipo
+        GET /cache      Estadísticas de la caché de respuestas
+        GET /consulta?filtro=...&agrupar=...&metrica=...&ordenar=...&limite=...
+            (filtro, agrupar y metrica pueden repetirse)
+
+    Args:
+        servicio (ServicioConsultas): Servicio con los datos cargados
+        puerto (int): Puerto TCP
+        host (str): Interfaz de escucha (por defecto solo local)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlparse
+
+    class Manejador(BaseHTTPRequestHandler):
+        def _responder(self, codigo, cuerpo):
+            datos = cuerpo.encode('utf-8')
+            self.send_response(codigo)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(datos)))
+            self.end_headers()
+            self.wfile.write(datos)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            parametros = parse_qs(url.query)
+            if url.path == '/columnas':
+                return self._responder(200, json.dumps(servicio.columnas(), ensure_ascii=False))
+            if url.path == '/cache':
+                return self._responder(200, json.dumps(servicio.estadisticas_cache()))
+            if url.path != '/consulta':
+                return self._responder(404, json.dumps({'error': 'Ruta desconocida'}))
+
+            inicio = time.perf_counter()
+            try:
+                limite = parametros.get('limite', [None])[0]
+                resultado = servicio.consultar(
+                    filtros=parametros.get('filtro'),
+                    agrupar_por=parametros.get('agrupar'),
+                    metricas=parametros.get('metrica'),
+                    ordenar_por=parametros.get('ordenar', [None])[0],
+                    limite=int(limite) if limite is not None else None,
+                )
+            except (ValueError, TypeError) as e:
+                return self._responder(400, json.dumps({'error': str(e)}, ensure_ascii=False))
+            self._responder(200, _a_json(resultado, milisegundos=round((time.perf_counter() - inicio) * 1000, 2)))
+
+        def log_message(self, formato, *args):
+            # Una línea por consulta, sin la fecha de BaseHTTPRequestHandler
+            print(f"{self.command} {self.path} -> {args[1] if len(args) > 1 else ''}")
+
+    servidor = ThreadingHTTPServer((host, puerto), Manejador)
+    print(f"Servicio de consultas en http://{host}:{puerto} ({len(servicio.df):,} filas). Ctrl+C para salir")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Consultas de filtro y agregación sobre los datos limpios")
+    parser.add_argument("--filtro", action="append", metavar="CONDICION",
+                        help='Condición como "ram_gb=16", "precio<50000" o "marca=HP,Dell" (repetible)')
+    parser.add_argument("--agrupar", action="append", metavar="COLUMNA", help="Columna de agrupación (repetible)")
+    parser.add_argument("--metrica", action="append", metavar="AGREGACION:COLUMNA",
+                        help=f"Métrica como median:precio o count (repetible; {', '.join(AGREGACIONES)})")
+    parser.add_argument("--ordenar", metavar="COLUMNA", help="Columna del resultado; con '-' delante, descendente")
+    parser.add_argument("--limite", type=int, help="Número máximo de filas del resultado")
+    parser.add_argument("--servir", action="store_true", help="Inicia el servicio HTTP local")
+    parser.add_argument("--puerto", type=int, default=8765, help="Puerto del servicio HTTP")
+    argumentos = parser.parse_args()
+
+    try:
+        servicio = ServicioConsultas()
+    except FileNotFoundError:
+        print("Error: No se encontraron datos limpios. Ejecuta primero data_cleaning.py")
+        sys.exit(1)
+
+    if argumentos.servir:
+        servir(servicio, argumentos.puerto)
+    else:
+        try:
+            resultado = servicio.consultar(argumentos.filtro, argumentos.agrupar, argumentos.metrica,
+                                           argumentos.ordenar, argumentos.limite)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(resultado.to_string(index=False))
@@ -7,29 +7,103 @@ Este script contiene funciones para crear visualizaciones
 informativas del análisis exploratorio de datos.
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import warnings
 warnings.filterwarnings('ignore')
 
-# Configurar estilo de gráficos
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+import bloque_numerico
+import cache_datos
+from correlaciones import calcular_matriz_correlacion
+from deteccion_outliers import columnas_variables, limites_iqr
+from instrumentacion import instrumentar
 
-# Configurar matplotlib para español
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.titlesize'] = 12
-plt.rcParams['axes.labelsize'] = 10
+# matplotlib, seaborn y plotly se importan solo cuando se dibuja algo
+_estilo_inicial_aplicado = False
+
+# Rutas de salida (independientes del directorio de trabajo)
+DIRECTORIO_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRECTORIO_REPORTES = os.path.join(DIRECTORIO_PROYECTO, 'reports')
+DIRECTORIO_IMAGENES = os.path.join(DIRECTORIO_REPORTES, 'images')
+
+# Resolución de las imágenes y si se abren ventanas tras guardarlas
+DPI = 300
+MOSTRAR_GRAFICOS = True
+
+# A partir de este número de filas los gráficos se dibujan a partir de datos
+# agregados (histogramas y densidades precalculadas, muestras para 3D), de
+# modo que el tiempo de dibujo y el tamaño de los archivos no crecen con los datos
+UMBRAL_DATOS_GRANDES = 100_000
+BINS_HISTOGRAMA = 50
+BINS_DENSIDAD = 120
+MAX_PUNTOS_3D = 5_000
+
+# Cifras significativas con que se escriben los datos en los HTML interactivos
+CIFRAS_HTML = 4
+
+def _cargar_matplotlib():
+    """
+    Importa matplotlib y seaborn la primera vez que se necesitan
+    
+    En la primera llamada también aplica el estilo base del proyecto.
+    
+    Returns:
+        tuple: Módulos (matplotlib.pyplot, seaborn)
+    """
+    global _estilo_inicial_aplicado
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    if not _estilo_inicial_aplicado:
+        # Configurar estilo de gráficos
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
+        
+        # Configurar matplotlib para español
+        plt.rcParams['font.size'] = 10
+        plt.rcParams['axes.titlesize'] = 12
+        plt.rcParams['axes.labelsize'] = 10
+        _estilo_inicial_aplicado = True
+    
+    return plt, sns
+
+def configurar_modo_sin_pantalla():
+    """
+    Usa un backend no interactivo y desactiva plt.show()
+    
+    Los gráficos solo se escriben a disco, sin abrir ventanas ni bloquear
+    la ejecución.
+    """
+    global MOSTRAR_GRAFICOS
+    if 'matplotlib.pyplot' in sys.modules:
+        sys.modules['matplotlib.pyplot'].switch_backend('Agg')
+    else:
+        # Se aplicará cuando se importe matplotlib, sin cargarlo ahora
+        os.environ['MPLBACKEND'] = 'Agg'
+    MOSTRAR_GRAFICOS = False
+
+def guardar_figura(nombre_archivo):
+    """
+    Guarda la figura actual en reports/images y libera su memoria
+    
+    Args:
+        nombre_archivo (str): Nombre del archivo PNG
+    """
+    plt, _ = _cargar_matplotlib()
+    
+    plt.savefig(os.path.join(DIRECTORIO_IMAGENES, nombre_archivo), dpi=DPI, bbox_inches='tight')
+    if MOSTRAR_GRAFICOS:
+        plt.show()
+    plt.close('all')
 
 def configurar_estilo():
     """
     Configura el estilo de los gráficos
     """
+    plt, sns = _cargar_matplotlib()
+    
     # Configurar estilo de seaborn
     sns.set_style("whitegrid")
     sns.set_palette("husl")
@@ -42,7 +116,128 @@ def configurar_estilo():
     plt.rcParams['xtick.labelsize'] = 10
     plt.rcParams['ytick.labelsize'] = 10
 
-def grafico_distribucion_numericas(df, columnas_numericas=None, max_graficos=6):
+def _datos_grandes(df, datos_grandes=None):
+    """
+    Decide si se usa el modo de datos grandes
+    
+    Args:
+        df (pandas.DataFrame): DataFrame a visualizar
+        datos_grandes (bool): Fuerza el modo; None lo decide según UMBRAL_DATOS_GRANDES
+        
+    Returns:
+        bool: True si hay que dibujar a partir de datos agregados
+    """
+    if datos_grandes is None:
+        return len(df) >= UMBRAL_DATOS_GRANDES
+    return datos_grandes
+
+def histograma_agregado(serie, bins=BINS_HISTOGRAMA):
+    """
+    Calcula un histograma sin pasar los valores a la librería de gráficos
+    
+    Args:
+        serie (pandas.Series): Valores numéricos
+        bins (int): Número de intervalos
+        
+    Returns:
+        tuple: (conteos, bordes) como arreglos de numpy
+    """
+    valores = serie.to_numpy(dtype=float)
+    valores = valores[np.isfinite(valores)]
+    return np.histogram(valores, bins=bins)
+
+def densidad_2d(x, y, bins=BINS_DENSIDAD):
+    """
+    Cuenta los puntos de cada celda de una rejilla de bins x bins
+    
+    Args:
+        x (pandas.Series): Valores del eje X
+        y (pandas.Series): Valores del eje Y
+        bins (int): Celdas por eje
+        
+    Returns:
+        tuple: (conteos, bordes_x, bordes_y); conteos tiene forma (bins_x, bins_y)
+    """
+    x = x.to_numpy(dtype=float)
+    y = y.to_numpy(dtype=float)
+    validos = np.isfinite(x) & np.isfinite(y)
+    return np.histogram2d(x[validos], y[validos], bins=bins)
+
+def tendencia_por_bins(x, y, bins=BINS_HISTOGRAMA):
+    """
+    Ajusta una recta a las medias de Y por intervalos de X
+    
+    Cada intervalo pesa según el número de puntos que contiene, así que la
+    recta se aproxima a la regresión sobre todos los puntos sin recorrerlos
+    en la librería de gráficos.
+    
+    Args:
+        x (pandas.Series): Valores del eje X
+        y (pandas.Series): Valores del eje Y
+        bins (int): Número de intervalos de X
+        
+    Returns:
+        tuple: (x_medias, y_medias, coeficientes [pendiente, ordenada]) o
+            None si no hay al menos dos intervalos con datos
+    """
+    x = x.to_numpy(dtype=float)
+    y = y.to_numpy(dtype=float)
+    validos = np.isfinite(x) & np.isfinite(y)
+    x, y = x[validos], y[validos]
+    if len(x) == 0:
+        return None
+    
+    bordes = np.histogram_bin_edges(x, bins=bins)
+    indices = np.clip(np.searchsorted(bordes, x, side='right') - 1, 0, len(bordes) - 2)
+    conteos = np.bincount(indices, minlength=len(bordes) - 1)
+    con_datos = conteos > 0
+    if con_datos.sum() < 2:
+        return None
+    
+    x_medias = np.bincount(indices, weights=x, minlength=len(conteos))[con_datos] / conteos[con_datos]
+    y_medias = np.bincount(indices, weights=y, minlength=len(conteos))[con_datos] / conteos[con_datos]
+    # polyfit pondera los residuos: sqrt(n) equivale a pesar cada intervalo por n
+    coeficientes = np.polyfit(x_medias, y_medias, 1, w=np.sqrt(conteos[con_datos]))
+    return x_medias, y_medias, coeficientes
+
+def muestra_estratificada(df, n, columna_estrato=None, semilla=42):
+    """
+    Toma una muestra que conserva la proporción de cada estrato
+    
+    Si no se indica columna, los estratos son los quintiles de la primera
+    columna numérica. Cada estrato aporta al menos una fila.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame a muestrear
+        n (int): Tamaño aproximado de la muestra
+        columna_estrato (str): Columna que define los estratos
+        semilla (int): Semilla del generador aleatorio
+        
+    Returns:
+        pandas.DataFrame: Muestra (o el DataFrame completo si tiene n filas o menos)
+    """
+    if len(df) <= n:
+        return df
+    
+    if columna_estrato is not None:
+        estratos = df[columna_estrato]
+    else:
+        primera = columnas_variables(df)[0]
+        estratos = pd.qcut(df[primera].rank(method='first'), q=5, labels=False)
+    codigos, _ = pd.factorize(estratos, use_na_sentinel=False)
+    
+    # Orden aleatorio dentro de cada estrato; se conservan los primeros de cada uno
+    rng = np.random.default_rng(semilla)
+    orden = np.lexsort((rng.random(len(df)), codigos))
+    tamanos = np.bincount(codigos)
+    cuotas = np.maximum(1, np.round(tamanos * n / len(df))).astype(int)
+    inicios = np.concatenate(([0], np.cumsum(tamanos)[:-1]))
+    posicion = np.arange(len(df)) - np.repeat(inicios, tamanos)
+    seleccion = orden[posicion < np.repeat(cuotas, tamanos)]
+    return df.iloc[np.sort(seleccion)]
+
+@instrumentar
+def grafico_distribucion_numericas(df, columnas_numericas=None, max_graficos=6, datos_grandes=None):
     """
     Crea gráficos de distribución para variables numéricas
     
@@ -50,9 +245,14 @@ def grafico_distribucion_numericas(df, columnas_numericas=None, max_graficos=6):
         df (pandas.DataFrame): DataFrame a visualizar
         columnas_numericas (list): Lista de columnas numéricas
         max_graficos (int): Máximo número de gráficos a mostrar
+        datos_grandes (bool): Dibuja histogramas precalculados sin curva de
+            densidad (por defecto, según UMBRAL_DATOS_GRANDES)
     """
+    plt, sns = _cargar_matplotlib()
+    grande = _datos_grandes(df, datos_grandes)
+    
     if columnas_numericas is None:
-        columnas_numericas = df.select_dtypes(include=[np.number]).columns
+        columnas_numericas = columnas_variables(df)
     
     # Limitar número de gráficos
     columnas_numericas = columnas_numericas[:max_graficos]
@@ -77,8 +277,13 @@ def grafico_distribucion_numericas(df, columnas_numericas=None, max_graficos=6):
         else:
             ax = axes[row, col_idx]
         
-        # Histograma con curva de densidad
-        sns.histplot(data=df, x=col, kde=True, ax=ax, bins=30)
+        if grande:
+            # Histograma precalculado: la curva de densidad no escala a millones de filas
+            conteos, bordes = histograma_agregado(df[col])
+            ax.stairs(conteos, bordes, fill=True, alpha=0.6)
+        else:
+            # Histograma con curva de densidad
+            sns.histplot(data=df, x=col, kde=True, ax=ax, bins=30)
         ax.set_title(f'Distribución de {col}')
         ax.set_xlabel(col)
         ax.set_ylabel('Frecuencia')
@@ -100,9 +305,9 @@ def grafico_distribucion_numericas(df, columnas_numericas=None, max_graficos=6):
             axes[row, col_idx].set_visible(False)
     
     plt.tight_layout()
-    plt.savefig('../reports/images/distribuciones_numericas.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    guardar_figura('distribuciones_numericas.png')
 
+@instrumentar
 def grafico_correlaciones(df, columnas_numericas=None):
     """
     Crea un mapa de calor de correlaciones
@@ -111,11 +316,13 @@ def grafico_correlaciones(df, columnas_numericas=None):
         df (pandas.DataFrame): DataFrame a visualizar
         columnas_numericas (list): Lista de columnas numéricas
     """
+    plt, sns = _cargar_matplotlib()
+    
     if columnas_numericas is None:
-        columnas_numericas = df.select_dtypes(include=[np.number]).columns
+        columnas_numericas = columnas_variables(df)
     
-    # Calcular matriz de correlaciones
-    matriz_corr = df[columnas_numericas].corr()
+    # Matriz de correlaciones (reutiliza la calculada en el análisis)
+    matriz_corr = calcular_matriz_correlacion(df, columnas_numericas)
     
     # Crear mapa de calor
     plt.figure(figsize=(12, 10))
@@ -132,9 +339,9 @@ def grafico_correlaciones(df, columnas_numericas=None):
     
     plt.title('Matriz de Correlaciones', fontsize=16, fontweight='bold', pad=20)
     plt.tight_layout()
-    plt.savefig('../reports/images/matriz_correlaciones.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    guardar_figura('matriz_correlaciones.png')
 
+@instrumentar
 def grafico_categoricas(df, columnas_categoricas=None, max_graficos=6):
     """
     Crea gráficos para variables categóricas
@@ -144,8 +351,10 @@ def grafico_categoricas(df, columnas_categoricas=None, max_graficos=6):
         columnas_categoricas (list): Lista de columnas categóricas
         max_graficos (int): Máximo número de gráficos a mostrar
     """
+    plt, sns = _cargar_matplotlib()
+    
     if columnas_categoricas is None:
-        columnas_categoricas = df.select_dtypes(include=['object']).columns
+        columnas_categoricas = df.select_dtypes(include=['object', 'category']).columns
     
     # Verificar si hay columnas categóricas
     if len(columnas_categoricas) == 0:
@@ -177,6 +386,8 @@ def grafico_categoricas(df, columnas_categoricas=None, max_graficos=6):
         
         # Gráfico de barras
         valores = df[col].value_counts().head(10)  # Top 10 valores
+        # Etiquetas como texto: con dtype 'category' seaborn dibujaría todas las categorías
+        valores.index = valores.index.astype(str)
         sns.barplot(x=valores.values, y=valores.index, ax=ax)
         ax.set_title(f'Top 10 valores de {col}')
         ax.set_xlabel('Frecuencia')
@@ -196,9 +407,9 @@ def grafico_categoricas(df, columnas_categoricas=None, max_graficos=6):
             axes[row, col_idx].set_visible(False)
     
     plt.tight_layout()
-    plt.savefig('../reports/images/analisis_categoricas.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    guardar_figura('analisis_categoricas.png')
 
+@instrumentar
 def grafico_boxplot(df, columnas_numericas=None, max_graficos=6):
     """
     Crea gráficos de caja para detectar outliers
@@ -208,12 +419,17 @@ def grafico_boxplot(df, columnas_numericas=None, max_graficos=6):
         columnas_numericas (list): Lista de columnas numéricas
         max_graficos (int): Máximo número de gráficos a mostrar
     """
+    plt, sns = _cargar_matplotlib()
+    
     if columnas_numericas is None:
-        columnas_numericas = df.select_dtypes(include=[np.number]).columns
+        columnas_numericas = columnas_variables(df)
     
     # Limitar número de gráficos
     columnas_numericas = columnas_numericas[:max_graficos]
     
+    # Límites IQR de todas las columnas a la vez, como en la detección de outliers
+    limites = limites_iqr(df, columnas_numericas)
+    
     n_cols = min(3, len(columnas_numericas))
     n_rows = (len(columnas_numericas) + n_cols - 1) // n_cols
     
@@ -240,12 +456,7 @@ def grafico_boxplot(df, columnas_numericas=None, max_graficos=6):
         ax.set_ylabel(col)
         
         # Agregar estadísticas
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        outliers = df[(df[col] < Q1 - 1.5*IQR) | (df[col] > Q3 + 1.5*IQR)]
-        
-        ax.text(0.02, 0.98, f'Outliers: {len(outliers)}', 
+        ax.text(0.02, 0.98, f"Outliers: {limites.loc[col, 'outliers']}", 
                 transform=ax.transAxes, verticalalignment='top',
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
@@ -259,25 +470,48 @@ def grafico_boxplot(df, columnas_numericas=None, max_graficos=6):
             axes[row, col_idx].set_visible(False)
     
     plt.tight_layout()
-    plt.savefig('../reports/images/boxplots_outliers.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    guardar_figura('boxplots_outliers.png')
 
-def grafico_dispersion(df, col_x, col_y):
+@instrumentar
+def grafico_dispersion(df, col_x, col_y, datos_grandes=None):
     """
     Crea gráfico de dispersión entre dos variables
     
+    Con datos grandes se dibuja la densidad de puntos por celdas (escala
+    logarítmica) y la recta se ajusta sobre medias por intervalos.
+    
     Args:
         df (pandas.DataFrame): DataFrame a visualizar
         col_x (str): Variable del eje X
         col_y (str): Variable del eje Y
+        datos_grandes (bool): Fuerza el modo de datos grandes (por defecto,
+            según UMBRAL_DATOS_GRANDES)
     """
-    plt.figure(figsize=(10, 8))
+    plt, sns = _cargar_matplotlib()
+    from matplotlib.colors import LogNorm
     
-    # Gráfico de dispersión
-    sns.scatterplot(data=df, x=col_x, y=col_y, alpha=0.6)
+    plt.figure(figsize=(10, 8))
     
-    # Línea de regresión
-    sns.regplot(data=df, x=col_x, y=col_y, scatter=False, color='red')
+    if _datos_grandes(df, datos_grandes):
+        # Densidad 2D precalculada
+        conteos, bordes_x, bordes_y = densidad_2d(df[col_x], df[col_y])
+        conteos = np.where(conteos > 0, conteos, np.nan)
+        malla = plt.pcolormesh(bordes_x, bordes_y, conteos.T, norm=LogNorm(), cmap='viridis')
+        plt.colorbar(malla, label='Número de laptops')
+        
+        # Tendencia ajustada sobre las medias por intervalo
+        tendencia = tendencia_por_bins(df[col_x], df[col_y])
+        if tendencia is not None:
+            x_medias, y_medias, coeficientes = tendencia
+            plt.plot(x_medias, y_medias, 'o', color='orange', markersize=4, label='Media por intervalo')
+            plt.plot(x_medias, np.polyval(coeficientes, x_medias), color='red', label='Tendencia')
+            plt.legend()
+    else:
+        # Gráfico de dispersión
+        sns.scatterplot(data=df, x=col_x, y=col_y, alpha=0.6)
+        
+        # Línea de regresión
+        sns.regplot(data=df, x=col_x, y=col_y, scatter=False, color='red')
     
     # Calcular correlación
     correlacion = df[col_x].corr(df[col_y])
@@ -288,9 +522,9 @@ def grafico_dispersion(df, col_x, col_y):
     plt.ylabel(col_y)
     
     plt.tight_layout()
-    plt.savefig(f'../reports/images/dispersion_{col_x}_{col_y}.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    guardar_figura(f'dispersion_{col_x}_{col_y}.png')
 
+@instrumentar
 def grafico_valores_faltantes(df):
     """
     Crea gráfico de valores faltantes
@@ -298,6 +532,8 @@ def grafico_valores_faltantes(df):
     Args:
         df (pandas.DataFrame): DataFrame a visualizar
     """
+    plt, sns = _cargar_matplotlib()
+    
     # Calcular valores faltantes
     valores_faltantes = df.isnull().sum()
     porcentaje_faltantes = (valores_faltantes / len(df)) * 100
@@ -314,6 +550,10 @@ def grafico_valores_faltantes(df):
     
     if len(df_faltantes) == 0:
         print("No hay valores faltantes en el dataset")
+        # Un gráfico de una ejecución anterior ya no corresponde a los datos
+        ruta_anterior = os.path.join(DIRECTORIO_IMAGENES, 'valores_faltantes.png')
+        if os.path.exists(ruta_anterior):
+            os.remove(ruta_anterior)
         return
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
@@ -329,9 +569,9 @@ def grafico_valores_faltantes(df):
     ax2.set_xlabel('Porcentaje (%)')
     
     plt.tight_layout()
-    plt.savefig('../reports/images/valores_faltantes.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    guardar_figura('valores_faltantes.png')
 
+@instrumentar
 def grafico_resumen_estadistico(df, columnas_numericas=None):
     """
     Crea un gráfico resumen de estadísticas descriptivas
@@ -340,8 +580,10 @@ def grafico_resumen_estadistico(df, columnas_numericas=None):
         df (pandas.DataFrame): DataFrame a visualizar
         columnas_numericas (list): Lista de columnas numéricas
     """
+    plt, _ = _cargar_matplotlib()
+    
     if columnas_numericas is None:
-        columnas_numericas = df.select_dtypes(include=[np.number]).columns
+        columnas_numericas = columnas_variables(df)
     
     # Calcular estadísticas
     stats_df = df[columnas_numericas].describe().T
@@ -372,105 +614,350 @@ def grafico_resumen_estadistico(df, columnas_numericas=None):
     axes[1, 1].tick_params(axis='x', rotation=45)
     
     plt.tight_layout()
-    plt.savefig('../reports/images/resumen_estadistico.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    guardar_figura('resumen_estadistico.png')
 
-def crear_visualizaciones_interactivas(df, columnas_numericas=None):
+def redondear_significativas(valores, cifras=CIFRAS_HTML):
+    """
+    Redondea una serie numérica a un número de cifras significativas
+    
+    Las cifras se cuentan respecto al mayor valor absoluto de la serie, así
+    que todos los valores quedan con los mismos decimales.
+    
+    Args:
+        valores (pandas.Series o numpy.ndarray): Valores numéricos
+        cifras (int): Cifras significativas a conservar
+        
+    Returns:
+        Mismo tipo que la entrada, redondeado (los enteros no se modifican)
+    """
+    arreglo = np.asarray(valores)
+    if not np.issubdtype(arreglo.dtype, np.floating):
+        return valores
+    maximo = np.nanmax(np.abs(arreglo)) if np.isfinite(arreglo).any() else 0
+    if not maximo:
+        return valores
+    decimales = max(0, cifras - 1 - int(np.floor(np.log10(maximo))))
+    return np.round(valores, decimales)
+
+def guardar_html(fig, nombre_archivo):
+    """
+    Guarda una figura de Plotly en reports/ sin incrustar plotly.js
+    
+    Todas las páginas enlazan un único plotly.min.js escrito en la misma
+    carpeta, en lugar de llevar cada una su copia de varios MB.
+    
+    Args:
+        fig (plotly.graph_objects.Figure): Figura a guardar
+        nombre_archivo (str): Nombre del archivo HTML
+    """
+    fig.write_html(os.path.join(DIRECTORIO_REPORTES, nombre_archivo),
+                   include_plotlyjs='directory', config={'displaylogo': False})
+
+@instrumentar
+def crear_visualizaciones_interactivas(df, columnas_numericas=None, datos_grandes=None):
     """
     Crea visualizaciones interactivas con Plotly
     
+    Los histogramas se envían ya agregados (conteos por intervalo) y los
+    datos se redondean a CIFRAS_HTML cifras significativas. Con datos
+    grandes el gráfico 3D (WebGL) usa una muestra estratificada de
+    MAX_PUNTOS_3D filas.
+    
     Args:
         df (pandas.DataFrame): DataFrame a visualizar
         columnas_numericas (list): Lista de columnas numéricas
+        datos_grandes (bool): Fuerza el modo de datos grandes (por defecto,
+            según UMBRAL_DATOS_GRANDES)
     """
+    import plotly.express as px
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
     if columnas_numericas is None:
-        columnas_numericas = df.select_dtypes(include=[np.number]).columns
+        columnas_numericas = columnas_variables(df)
+    grande = _datos_grandes(df, datos_grandes)
     
     # 1. Matriz de correlaciones interactiva
-    matriz_corr = df[columnas_numericas].corr()
+    matriz_corr = calcular_matriz_correlacion(df, columnas_numericas)
     
-    fig_corr = px.imshow(matriz_corr,
-                         text_auto=True,
+    fig_corr = px.imshow(matriz_corr.round(3),
+                         text_auto='.2f',
                          aspect="auto",
                          title="Matriz de Correlaciones Interactiva")
-    fig_corr.write_html("../reports/correlaciones_interactivo.html")
+    guardar_html(fig_corr, "correlaciones_interactivo.html")
     
     # 2. Gráfico de dispersión 3D (si hay al menos 3 variables numéricas)
     if len(columnas_numericas) >= 3:
-        fig_3d = px.scatter_3d(df, 
+        estrato = 'precio_categoria' if 'precio_categoria' in df.columns else None
+        datos_3d = muestra_estratificada(df, MAX_PUNTOS_3D, estrato) if grande else df
+        ejes_3d = list(columnas_numericas[:3])
+        datos_3d = datos_3d[ejes_3d].apply(redondear_significativas)
+        titulo_3d = "Gráfico de Dispersión 3D"
+        if len(datos_3d) < len(df):
+            titulo_3d += f" (muestra estratificada de {len(datos_3d):,} de {len(df):,} filas)"
+        fig_3d = px.scatter_3d(datos_3d, 
                                x=columnas_numericas[0], 
                                y=columnas_numericas[1], 
                                z=columnas_numericas[2],
-                               title="Gráfico de Dispersión 3D")
-        fig_3d.write_html("../reports/dispersion_3d.html")
+                               title=titulo_3d)
+        guardar_html(fig_3d, "dispersion_3d.html")
     
     # 3. Histogramas interactivos
     fig_hist = make_subplots(rows=len(columnas_numericas), cols=1,
                              subplot_titles=columnas_numericas)
     
     for i, col in enumerate(columnas_numericas, 1):
-        fig_hist.add_trace(go.Histogram(x=df[col], name=col), row=i, col=1)
+        # Solo se envían los conteos por intervalo, no los valores
+        conteos, bordes = histograma_agregado(df[col])
+        fig_hist.add_trace(go.Bar(x=redondear_significativas((bordes[:-1] + bordes[1:]) / 2),
+                                  y=conteos, width=redondear_significativas(np.diff(bordes)),
+                                  name=col, showlegend=False), row=i, col=1)
     
     fig_hist.update_layout(height=300*len(columnas_numericas), 
-                          title_text="Histogramas Interactivos")
-    fig_hist.write_html("../reports/histogramas_interactivos.html")
+                          title_text="Histogramas Interactivos", bargap=0)
+    guardar_html(fig_hist, "histogramas_interactivos.html")
     
     print("Visualizaciones interactivas guardadas en la carpeta reports/")
 
-def main():
+# Gráficos generados por main: (descripción, función, si un error detiene el proceso)
+GRAFICOS = [
+    ("gráficos de distribución", grafico_distribucion_numericas, True),
+    ("matriz de correlaciones", grafico_correlaciones, True),
+    ("análisis de variables categóricas", grafico_categoricas, False),
+    ("análisis de outliers", grafico_boxplot, True),
+    ("análisis de valores faltantes", grafico_valores_faltantes, True),
+    ("resumen estadístico", grafico_resumen_estadistico, True),
+    ("visualizaciones interactivas", crear_visualizaciones_interactivas, True),
+]
+
+# Archivos que escribe cada gráfico de GRAFICOS, relativos a reports/
+SALIDAS_GRAFICOS = {
+    'grafico_distribucion_numericas': ['images/distribuciones_numericas.png'],
+    'grafico_correlaciones': ['images/matriz_correlaciones.png'],
+    'grafico_categoricas': ['images/analisis_categoricas.png'],
+    'grafico_boxplot': ['images/boxplots_outliers.png'],
+    'grafico_valores_faltantes': ['images/valores_faltantes.png'],
+    'grafico_resumen_estadistico': ['images/resumen_estadistico.png'],
+    'crear_visualizaciones_interactivas': ['correlaciones_interactivo.html', 'dispersion_3d.html',
+                                           'histogramas_interactivos.html', 'plotly.min.js'],
+}
+
+# Salidas que solo se escriben según los datos: el gráfico de faltantes si hay
+# valores faltantes y la dispersión 3D si hay al menos tres variables numéricas
+SALIDAS_OPCIONALES = {'images/valores_faltantes.png', 'dispersion_3d.html'}
+
+def salidas_grafico(nombre_funcion):
+    """
+    Rutas absolutas de los archivos que escribe un gráfico de GRAFICOS
+    
+    Args:
+        nombre_funcion (str): Nombre de la función del gráfico
+        
+    Returns:
+        list: Rutas de salida
+    """
+    return [os.path.join(DIRECTORIO_REPORTES, *ruta.split('/')) for ruta in SALIDAS_GRAFICOS[nombre_funcion]]
+
+def salidas_opcionales_grafico(nombre_funcion):
+    """
+    Rutas absolutas de las salidas de un gráfico que pueden no escribirse
+    
+    Args:
+        nombre_funcion (str): Nombre de la función del gráfico
+        
+    Returns:
+        list: Rutas de salida opcionales (ver SALIDAS_OPCIONALES)
+    """
+    return [os.path.join(DIRECTORIO_REPORTES, *ruta.split('/')) for ruta in SALIDAS_GRAFICOS[nombre_funcion]
+            if ruta in SALIDAS_OPCIONALES]
+
+def eliminar_salidas_grafico(nombre_funcion):
+    """
+    Borra las salidas de una ejecución anterior de un gráfico de GRAFICOS
+    
+    Así, si el gráfico falla, no quedan en disco archivos antiguos que
+    parezcan el resultado de esta ejecución.
+    
+    Args:
+        nombre_funcion (str): Nombre de la función del gráfico
+    """
+    for ruta in salidas_grafico(nombre_funcion):
+        if os.path.exists(ruta):
+            os.remove(ruta)
+
+def _indices_graficos(graficos=None):
+    """
+    Posiciones en GRAFICOS de los gráficos pedidos por nombre de función
+    
+    Raises:
+        ValueError: Si algún nombre no corresponde a un gráfico
+    """
+    if graficos is None:
+        return list(range(len(GRAFICOS)))
+    nombres = [funcion.__name__ for _, funcion, _ in GRAFICOS]
+    desconocidos = [g for g in graficos if g not in nombres]
+    if desconocidos:
+        raise ValueError(f"Gráficos desconocidos: {', '.join(desconocidos)}")
+    return [i for i, nombre in enumerate(nombres) if nombre in graficos]
+
+# DataFrame reconstruido por cada proceso worker al iniciarse
+_df_worker = None
+
+def _inicializar_worker(ruta_bloque, resto):
+    """
+    Prepara un proceso worker: backend sin pantalla, estilo y datos
+    
+    Las columnas numéricas se abren desde el bloque compartido sin
+    copiarlas; resto trae las demás columnas.
+    """
+    global _df_worker
+    configurar_modo_sin_pantalla()
+    configurar_estilo()
+    _df_worker = bloque_numerico.combinar(ruta_bloque, resto)
+
+def _renderizar_en_worker(indice):
+    """
+    Genera un gráfico de GRAFICOS dentro de un proceso worker
+    
+    Returns:
+        tuple: (índice, mensaje de error o None)
+    """
+    try:
+        GRAFICOS[indice][1](_df_worker)
+        return indice, None
+    except Exception as e:
+        return indice, str(e)
+
+def generar_graficos_en_paralelo(df, max_workers=None, graficos=None):
+    """
+    Reparte los gráficos independientes entre varios procesos
+    
+    Las columnas numéricas se escriben una vez en un bloque temporal que
+    cada proceso abre con numpy.memmap, sin copiarlas; solo las demás
+    columnas se envían serializadas al iniciar cada proceso. Cada proceso
+    usa el backend Agg y libera cada figura tras escribirla. La codificación
+    PNG a 300 DPI deja de ser secuencial.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame a visualizar
+        max_workers (int): Número de procesos (por defecto, uno por CPU)
+        graficos (list): Nombres de las funciones a generar (por defecto todas)
+        
+    Returns:
+        list: Nombres de las funciones de los gráficos opcionales que fallaron
+        
+    Raises:
+        RuntimeError: Si falla algún gráfico que no es opcional
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    indices = _indices_graficos(graficos)
+    max_workers = max_workers or min(len(indices), os.cpu_count() or 1)
+    errores = []
+    fallidos = []
+    with bloque_numerico.bloque_temporal(df) as (ruta_bloque, resto):
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_inicializar_worker,
+                                 initargs=(ruta_bloque, resto)) as executor:
+            futuros = [executor.submit(_renderizar_en_worker, i) for i in indices]
+            for futuro in as_completed(futuros):
+                indice, error = futuro.result()
+                descripcion, _, obligatorio = GRAFICOS[indice]
+                if error is None:
+                    print(f"✓ Generado: {descripcion}")
+                else:
+                    print(f"No se pudo generar {descripcion}: {error}")
+                    fallidos.append(GRAFICOS[indice][1].__name__)
+                    if obligatorio:
+                        errores.append(descripcion)
+    
+    if errores:
+        raise RuntimeError(f"Fallaron los gráficos: {', '.join(errores)}")
+    return fallidos
+
+def main(df=None, sin_pantalla=False, max_workers=None, graficos=None, vecinos=None):
     """
     Función principal que ejecuta todas las visualizaciones
+    
+    Args:
+        df (pandas.DataFrame): Datos limpios ya cargados en memoria. Si es None
+            se leen desde data/laptop_limpio.csv
+        sin_pantalla (bool): Usa un backend no interactivo y no llama a plt.show()
+        max_workers (int): Si es mayor que 1, reparte los gráficos entre ese
+            número de procesos (implica sin_pantalla)
+        graficos (list): Nombres de las funciones de GRAFICOS a generar (por
+            defecto todas)
+        vecinos (int): Lee de la caché los datos imputados con ese número
+            de vecinos (ver data_cleaning.main)
+    
+    Returns:
+        list: Nombres de las funciones de los gráficos opcionales que
+            fallaron (sus salidas anteriores se han borrado), o None si no
+            se pudieron cargar los datos
     """
     # Configurar estilo
+    if sin_pantalla or (max_workers or 1) > 1:
+        configurar_modo_sin_pantalla()
     configurar_estilo()
     
     # Cargar datos limpios
-    try:
-        df = pd.read_csv("../data/laptop_limpio.csv")
-        print("Datos cargados exitosamente para visualización")
-    except FileNotFoundError:
-        print("Error: No se encontró el archivo laptop_limpio.csv")
-        print("Ejecuta primero el script de limpieza de datos")
-        return
+    if df is None:
+        try:
+            df = cache_datos.cargar_datos_limpios(vecinos=vecinos)
+            print("Datos cargados exitosamente para visualización")
+        except FileNotFoundError:
+            print("Error: No se encontró el archivo laptop_limpio.csv")
+            print("Ejecuta primero el script de limpieza de datos")
+            return
     
     print("=" * 60)
     print("GENERANDO VISUALIZACIONES")
     print("=" * 60)
     
     # Crear carpeta de imágenes si no existe
-    import os
-    os.makedirs("../reports/images", exist_ok=True)
+    os.makedirs(DIRECTORIO_IMAGENES, exist_ok=True)
     
-    # Generar visualizaciones
-    print("1. Generando gráficos de distribución...")
-    grafico_distribucion_numericas(df)
+    # Un gráfico que falle no debe dejar las salidas de la ejecución anterior
+    indices = _indices_graficos(graficos)
+    for indice in indices:
+        eliminar_salidas_grafico(GRAFICOS[indice][1].__name__)
     
-    print("2. Generando matriz de correlaciones...")
-    grafico_correlaciones(df)
-    
-    print("3. Generando análisis de variables categóricas...")
-    try:
-        grafico_categoricas(df)
-    except Exception as e:
-        print(f"No se pudieron generar gráficos de variables categóricas: {e}")
-    
-    print("4. Generando análisis de outliers...")
-    grafico_boxplot(df)
-    
-    print("5. Generando análisis de valores faltantes...")
-    grafico_valores_faltantes(df)
-    
-    print("6. Generando resumen estadístico...")
-    grafico_resumen_estadistico(df)
-    
-    print("7. Generando visualizaciones interactivas...")
-    crear_visualizaciones_interactivas(df)
+    # Generar visualizaciones
+    fallidos = []
+    if (max_workers or 1) > 1:
+        fallidos = generar_graficos_en_paralelo(df, max_workers, graficos)
+    else:
+        for i, indice in enumerate(indices, 1):
+            descripcion, funcion, obligatorio = GRAFICOS[indice]
+            print(f"{i}. Generando {descripcion}...")
+            if obligatorio:
+                funcion(df)
+                continue
+            try:
+                funcion(df)
+            except Exception as e:
+                print(f"No se pudieron generar {descripcion}: {e}")
+                fallidos.append(funcion.__name__)
     
     print("\n" + "=" * 60)
     print("VISUALIZACIONES COMPLETADAS")
     print("=" * 60)
     print("Los gráficos se han guardado en la carpeta reports/images/")
     print("Las visualizaciones interactivas se han guardado en la carpeta reports/")
+    return fallidos
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Visualizaciones del dataset de laptops")
+    parser.add_argument("--sin-pantalla", action="store_true",
+                        help="Guarda los gráficos sin abrir ventanas (backend Agg)")
+    parser.add_argument("--procesos", type=int, default=1, metavar="N",
+                        help="Genera los gráficos en paralelo con N procesos")
+    parser.add_argument("--graficos", nargs="+", metavar="FUNCION",
+                        help="Genera solo estos gráficos (nombres de función, p. ej. grafico_boxplot)")
+    parser.add_argument("--vecinos", type=int, metavar="K",
+                        help="Usa los datos limpiados con la imputación por K vecinos")
+    argumentos = parser.parse_args()
+    
+    main(sin_pantalla=argumentos.sin_pantalla, max_workers=argumentos.procesos,
+         graficos=argumentos.graficos, vecinos=argumentos.vecinos) 
\ No newline at end of file